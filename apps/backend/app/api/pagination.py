@@ -0,0 +1,128 @@
+"""
+AUREX.AI - Cursor Pagination.
+
+Keyset pagination shared by the list endpoints. Pages are ordered newest first on
+(timestamp, id) and the next page starts strictly after the last row returned, so
+deep pages cost the same as the first one and rows inserted meanwhile never shift
+or duplicate results the way OFFSET does.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import desc, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+def encode_cursor(timestamp: datetime, row_id: Any) -> str:
+    """
+    Encode the position of a row as an opaque cursor.
+
+    Args:
+        timestamp: Timestamp of the last row on the page
+        row_id: Primary key of the last row on the page
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    payload = json.dumps([timestamp.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        tuple: (timestamp, row id)
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(timestamp), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Select,
+    timestamp_column: Any,
+    id_column: Any,
+    page_size: int,
+    cursor: str | None = None,
+    page: int = 1,
+    include_total: bool = False,
+) -> tuple[list, dict]:
+    """
+    Fetch one page of a query, newest first.
+
+    With a cursor the page is selected with a (timestamp, id) row comparison that
+    walks the timestamp index. Without one, ``page`` is honoured with OFFSET for
+    older clients; only the first page is cheap on that path.
+
+    Args:
+        session: Database session
+        query: Filtered select of a single ORM entity, without ordering or limit
+        timestamp_column: Timestamp column to order by
+        id_column: Primary key column used as the tie-breaker
+        page_size: Maximum rows per page
+        cursor: Cursor from the previous page's ``next_cursor``
+        page: Page number used when no cursor is given (deprecated)
+        include_total: Run a ``SELECT count(*)`` for total_items/total_pages
+
+    Returns:
+        tuple: (rows, pagination metadata)
+    """
+    total_count = None
+    if include_total:
+        count_query = select(func.count()).select_from(query.order_by(None).subquery())
+        total_count = (await session.execute(count_query)).scalar_one()
+
+    page_query = query.order_by(desc(timestamp_column), desc(id_column))
+    if cursor:
+        after_timestamp, after_id = decode_cursor(cursor)
+        try:
+            id_value = id_column.type.python_type(after_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail="Invalid pagination cursor") from e
+        page_query = page_query.where(
+            tuple_(timestamp_column, id_column) < tuple_(after_timestamp, id_value)
+        )
+    elif page > 1:
+        page_query = page_query.offset((page - 1) * page_size)
+
+    # One extra row tells us whether another page exists without counting
+    result = await session.execute(page_query.limit(page_size + 1))
+    rows = list(result.scalars().all())
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            getattr(last, timestamp_column.key), getattr(last, id_column.key)
+        )
+
+    pagination = {
+        "page": None if cursor else page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+        "has_more": has_more,
+        "total_items": total_count,
+        "total_pages": (
+            (total_count + page_size - 1) // page_size if total_count is not None else None
+        ),
+    }
+    return rows, pagination
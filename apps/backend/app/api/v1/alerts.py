@@ -7,12 +7,14 @@ from datetime import datetime, timedelta
 from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, select
+from sqlalchemy import select
 
 from packages.db_core.cache import get_cache
 from packages.db_core.connection import db_manager
 from packages.db_core.models import Alert
 
+from ..pagination import paginate
+
 router = APIRouter()
 
 
@@ -45,6 +47,8 @@ async def get_alerts(
     acknowledged: bool = Query(None, description="Filter by acknowledged status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
+    cursor: str = Query(None, description="Cursor from the previous page"),
+    include_total: bool = Query(False, description="Include total_items (runs a count)"),
 ):
     """
     Get alerts.
@@ -53,8 +57,10 @@ async def get_alerts(
         hours: Number of hours of alerts
         severity: Filter by severity
         acknowledged: Filter by acknowledged status
-        page: Page number
+        page: Page number (deprecated, use cursor)
         page_size: Number of items per page
+        cursor: Cursor from the previous page's next_cursor
+        include_total: Also count the matching rows
 
     Returns:
         dict: Alerts with pagination
@@ -73,20 +79,18 @@ async def get_alerts(
             if acknowledged is not None:
                 query = query.where(Alert.acknowledged == acknowledged)
 
-            # Count total
-            count_result = await session.execute(query)
-            total_count = len(count_result.scalars().all())
-
             # Fetch page
-            query = (
-                query.order_by(desc(Alert.timestamp))
-                .offset((page - 1) * page_size)
-                .limit(page_size)
+            alerts, pagination = await paginate(
+                session,
+                query,
+                Alert.timestamp,
+                Alert.id,
+                page_size,
+                cursor=cursor,
+                page=page,
+                include_total=include_total,
             )
 
-            result = await session.execute(query)
-            alerts = result.scalars().all()
-
             alert_data = [
                 {
                     "id": str(a.id),  # Convert UUID to string
@@ -104,12 +108,7 @@ async def get_alerts(
             return {
                 "status": "success",
                 "data": alert_data,
-                "pagination": {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_count,
-                    "total_pages": (total_count + page_size - 1) // page_size,
-                },
+                "pagination": pagination,
                 "params": {
                     "hours": hours,
                     "severity": severity,
@@ -117,6 +116,8 @@ async def get_alerts(
                 },
             }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching alerts: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -7,6 +7,11 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from loguru import logger
 
+from packages.ai_core.sentiment import (
+    get_inference_queue_stats,
+    get_model_registry,
+    get_warmup_status,
+)
 from packages.db_core.cache import get_cache
 from packages.db_core.connection import db_manager
 from packages.shared.config import config
@@ -77,5 +82,12 @@ async def detailed_health_check() -> dict:
         }
         health_status["status"] = "degraded"
 
+    # Sentiment model warm-up is informational and never degrades readiness
+    health_status["services"]["sentiment_model"] = {
+        "status": get_warmup_status(),
+        "inference_queue": get_inference_queue_stats(),
+        "registry": get_model_registry().get_status(),
+    }
+
     return health_status
 
@@ -3,15 +3,21 @@ AUREX.AI - News API Endpoints.
 """
 
 from datetime import datetime, timedelta
+from uuid import UUID
 
 from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
-from sqlalchemy import desc, select
+from sqlalchemy import select
 
+from packages.ai_core.sentiment import embed_texts
+from packages.ai_core.vector_index import get_embedding_index
+from packages.db_core import queries
 from packages.db_core.cache import get_cache
 from packages.db_core.connection import db_manager
 from packages.db_core.models import News
 
+from ..pagination import paginate
+
 router = APIRouter()
 
 
@@ -21,15 +27,19 @@ async def get_recent_news(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     source: str = Query(None, description="Filter by source"),
+    cursor: str = Query(None, description="Cursor from the previous page"),
+    include_total: bool = Query(False, description="Include total_items (runs a count)"),
 ):
     """
     Get recent news articles.
 
     Args:
         hours: Number of hours of news (1-168)
-        page: Page number
+        page: Page number (deprecated, use cursor)
         page_size: Number of items per page
         source: Filter by news source
+        cursor: Cursor from the previous page's next_cursor
+        include_total: Also count the matching rows
 
     Returns:
         dict: Recent news articles with pagination
@@ -37,7 +47,10 @@ async def get_recent_news(
     cache_manager = await get_cache()
 
     # Try cache first
-    cache_key = f"news:recent:{hours}:page{page}:size{page_size}:source{source}"
+    cache_key = (
+        f"news:recent:{hours}:page{page}:size{page_size}:source{source}"
+        f":cursor{cursor}:total{include_total}"
+    )
     cached_data = await cache_manager.get(cache_key)
 
     if cached_data:
@@ -54,20 +67,18 @@ async def get_recent_news(
             if source:
                 query = query.where(News.source == source)
 
-            # Count total
-            count_result = await session.execute(query)
-            total_count = len(count_result.scalars().all())
-
             # Fetch page
-            query = (
-                query.order_by(desc(News.timestamp))
-                .offset((page - 1) * page_size)
-                .limit(page_size)
+            news_items, pagination = await paginate(
+                session,
+                query,
+                News.timestamp,
+                News.id,
+                page_size,
+                cursor=cursor,
+                page=page,
+                include_total=include_total,
             )
 
-            result = await session.execute(query)
-            news_items = result.scalars().all()
-
             news_data = [
                 {
                     "id": str(n.id),  # Convert UUID to string
@@ -78,6 +89,7 @@ async def get_recent_news(
                     "source": n.source,
                     "sentiment_label": n.sentiment_label,
                     "sentiment_score": float(n.sentiment_score) if n.sentiment_score else None,
+                    "sentiment_relevance": n.sentiment_relevance,
                     "created_at": n.created_at.isoformat(),
                 }
                 for n in news_items
@@ -86,12 +98,7 @@ async def get_recent_news(
             response = {
                 "status": "success",
                 "data": news_data,
-                "pagination": {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_count,
-                    "total_pages": (total_count + page_size - 1) // page_size,
-                },
+                "pagination": pagination,
                 "params": {
                     "hours": hours,
                     "source": source,
@@ -103,11 +110,92 @@ async def get_recent_news(
 
             return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching recent news: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/similar")
+async def get_similar_news(
+    news_id: UUID = Query(None, description="Find articles similar to this stored article"),
+    text: str = Query(None, max_length=2000, description="Or: find articles similar to this text"),
+    k: int = Query(10, ge=1, le=100, description="Number of similar articles"),
+):
+    """
+    Find the k past articles whose FinBERT embeddings are closest to a query.
+
+    Args:
+        news_id: Stored article to use as the query
+        text: Free text to use as the query (embedded with the sentiment model)
+        k: Number of similar articles
+
+    Returns:
+        dict: Similar articles, most similar first, with cosine similarity
+    """
+    if (news_id is None) == (text is None):
+        raise HTTPException(status_code=400, detail="Provide exactly one of news_id or text")
+
+    index = get_embedding_index()
+
+    if news_id is not None:
+        query = index.get(news_id)
+        if query is None:
+            raise HTTPException(status_code=404, detail="Article has no stored embedding")
+    else:
+        batch = await embed_texts([text])
+        if batch.embeddings is None:
+            raise HTTPException(status_code=501, detail="Inference backend returns no embeddings")
+        if index.model_version and batch.model_version != index.model_version:
+            # Vectors from different models are not comparable
+            raise HTTPException(
+                status_code=409,
+                detail=(
+                    f"Embedding index was built with {index.model_version}, "
+                    f"active model is {batch.model_version}; rebuild the index"
+                ),
+            )
+        query = batch.embeddings[0]
+
+    neighbours = index.search(query, k=k, exclude={news_id} if news_id else None)
+
+    try:
+        async with db_manager.get_session() as session:
+            ids = [UUID(article_id) for article_id, _ in neighbours]
+            result = await session.execute(select(News).where(News.id.in_(ids)))
+            by_id = {str(n.id): n for n in result.scalars().all()}
+
+        similar = []
+        for article_id, similarity in neighbours:
+            news = by_id.get(article_id)
+            if news is None:
+                continue  # Deleted since it was indexed
+            similar.append(
+                {
+                    "id": article_id,
+                    "similarity": similarity,
+                    "title": news.title,
+                    "url": news.url,
+                    "published": news.timestamp.isoformat(),
+                    "source": news.source,
+                    "sentiment_label": news.sentiment_label,
+                    "sentiment_score": float(news.sentiment_score) if news.sentiment_score else None,
+                }
+            )
+
+        return {
+            "status": "success",
+            "data": similar,
+            "params": {"news_id": str(news_id) if news_id else None, "k": k},
+            "index": {"size": len(index), "model_version": index.model_version},
+        }
+
+    except Exception as e:
+        logger.error(f"Error fetching similar news: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/{news_id}")
 async def get_news_by_id(news_id: int):
     """
@@ -149,6 +237,7 @@ async def get_news_by_id(news_id: int):
                     "source": news.source,
                     "sentiment_label": news.sentiment_label,
                     "sentiment_score": float(news.sentiment_score) if news.sentiment_score else None,
+                    "sentiment_relevance": news.sentiment_relevance,
                     "created_at": news.created_at.isoformat(),
                 },
             }
@@ -192,20 +281,8 @@ async def get_sentiment_distribution(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         async with db_manager.get_session() as session:
-            query = select(News).where(
-                News.timestamp >= cutoff_time,
-                News.sentiment_label.isnot(None),
-            )
-
-            result = await session.execute(query)
-            news_items = result.scalars().all()
-
-            # Calculate distribution
-            distribution = {"positive": 0, "neutral": 0, "negative": 0}
-
-            for news in news_items:
-                if news.sentiment_label in distribution:
-                    distribution[news.sentiment_label] += 1
+            # GROUP BY sentiment_label in the database
+            distribution = await queries.get_sentiment_distribution(session, cutoff_time)
 
             total = sum(distribution.values())
 
@@ -9,10 +9,14 @@ from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
 from sqlalchemy import desc, select
 
+from packages.db_core import candles, queries
 from packages.db_core.cache import get_cache
 from packages.db_core.connection import db_manager
 from packages.db_core.models import Price
 from packages.shared.config import config
+from packages.shared.constants import SYMBOL_XAUUSD
+
+from ..pagination import paginate
 
 router = APIRouter()
 
@@ -83,14 +87,18 @@ async def get_price_history(
     hours: int = Query(24, ge=1, le=720, description="Hours of history to fetch"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(100, ge=1, le=1000, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page"),
+    include_total: bool = Query(False, description="Include total_items (runs a count)"),
 ):
     """
     Get historical gold prices.
 
     Args:
         hours: Number of hours of history (1-720)
-        page: Page number
+        page: Page number (deprecated, use cursor)
         page_size: Number of items per page
+        cursor: Cursor from the previous page's next_cursor
+        include_total: Also count the matching rows
 
     Returns:
         dict: Historical price data with pagination
@@ -98,7 +106,9 @@ async def get_price_history(
     cache_manager = await get_cache()
 
     # Try cache first
-    cache_key = f"price:history:{hours}:page{page}:size{page_size}"
+    cache_key = (
+        f"price:history:{hours}:page{page}:size{page_size}:cursor{cursor}:total{include_total}"
+    )
     cached_data = await cache_manager.get(cache_key)
 
     if cached_data:
@@ -110,23 +120,19 @@ async def get_price_history(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         async with db_manager.get_session() as session:
-            # Count total
-            count_query = select(Price).where(Price.timestamp >= cutoff_time)
-            count_result = await session.execute(count_query)
-            total_count = len(count_result.scalars().all())
-
             # Fetch page
-            query = (
-                select(Price)
-                .where(Price.timestamp >= cutoff_time)
-                .order_by(desc(Price.timestamp))
-                .offset((page - 1) * page_size)
-                .limit(page_size)
+            query = select(Price).where(Price.timestamp >= cutoff_time)
+            prices, pagination = await paginate(
+                session,
+                query,
+                Price.timestamp,
+                Price.id,
+                page_size,
+                cursor=cursor,
+                page=page,
+                include_total=include_total,
             )
 
-            result = await session.execute(query)
-            prices = result.scalars().all()
-
             price_data = [
                 {
                     "id": str(p.id),  # Convert UUID to string
@@ -146,12 +152,7 @@ async def get_price_history(
             response = {
                 "status": "success",
                 "data": price_data,
-                "pagination": {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_count,
-                    "total_pages": (total_count + page_size - 1) // page_size,
-                },
+                "pagination": pagination,
                 "params": {
                     "hours": hours,
                 },
@@ -162,11 +163,111 @@ async def get_price_history(
 
             return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching price history: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
+@router.get("/candles")
+async def get_price_candles(
+    hours: int = Query(24, ge=1, le=8760, description="Hours of candles to fetch"),
+    max_points: Optional[int] = Query(None, ge=10, le=5000, description="Candle budget"),
+    resolution: Optional[str] = Query(None, description="1m, 5m, 1h or 1d (auto if omitted)"),
+    symbol: str = Query(SYMBOL_XAUUSD, description="Symbol"),
+):
+    """
+    Get OHLCV candles for charts.
+
+    Without an explicit resolution, the finest of 1m/5m/1h/1d whose candle
+    count fits max_points is used. An explicit resolution must fit it too.
+
+    Args:
+        hours: Number of hours of candles
+        max_points: Maximum number of candles (PRICE_CANDLES_MAX_POINTS if omitted)
+        resolution: Candle resolution (auto if omitted)
+        symbol: Symbol to chart
+
+    Returns:
+        dict: Candles with the resolution and source used
+    """
+    max_points = max_points or config.PRICE_CANDLES_MAX_POINTS
+    if resolution is not None and resolution not in candles.RESOLUTIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown resolution (expected one of {', '.join(candles.RESOLUTIONS)})",
+        )
+
+    end_time = datetime.utcnow()
+    start_time = end_time - timedelta(hours=hours)
+    if resolution is not None:
+        count = candles.candle_count(start_time, end_time, resolution)
+        if count > max_points:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"{hours} hours at {resolution} is {count} candles, over the limit of "
+                    f"{max_points}; use a coarser resolution or a shorter range"
+                ),
+            )
+
+    cache_manager = await get_cache()
+
+    # Try cache first
+    cache_key = f"price:candles:{symbol}:{hours}:{resolution or 'auto'}:{max_points}"
+    cached_data = await cache_manager.get(cache_key)
+
+    if cached_data:
+        logger.info(f"Returning cached price candles (hours={hours})")
+        return cached_data
+
+    try:
+        async with db_manager.get_session() as session:
+            result = await candles.get_candles(
+                session,
+                start_time,
+                end_time,
+                symbol=symbol,
+                resolution=resolution,
+                max_points=max_points,
+            )
+
+        candle_data = [
+            {
+                "timestamp": c["timestamp"].isoformat(),
+                "open": float(c["open"]) if c["open"] is not None else None,
+                "high": float(c["high"]) if c["high"] is not None else None,
+                "low": float(c["low"]) if c["low"] is not None else None,
+                "close": float(c["close"]) if c["close"] is not None else None,
+                "volume": int(c["volume"]) if c["volume"] is not None else None,
+                "ticks": int(c["ticks"]),
+            }
+            for c in result["candles"]
+        ]
+
+        response = {
+            "status": "success",
+            "data": candle_data,
+            "resolution": result["resolution"],
+            "source": result["source"],
+            "params": {
+                "hours": hours,
+                "max_points": max_points,
+                "symbol": symbol,
+            },
+        }
+
+        # Cache for 1 minute (the finest candle width)
+        await cache_manager.set(cache_key, response, ttl=60)
+
+        return response
+
+    except Exception as e:
+        logger.error(f"Error fetching price candles: {e}")
+        raise HTTPException(status_code=500, detail="Internal server error")
+
+
 @router.get("/stats")
 async def get_price_stats(
     hours: int = Query(24, ge=1, le=720, description="Hours for statistics"),
@@ -194,32 +295,21 @@ async def get_price_stats(
         cutoff_time = datetime.utcnow() - timedelta(hours=hours)
 
         async with db_manager.get_session() as session:
-            query = (
-                select(Price)
-                .where(Price.timestamp >= cutoff_time)
-                .order_by(Price.timestamp)
-            )
-
-            result = await session.execute(query)
-            prices = result.scalars().all()
+            # Aggregated in the database (one row back)
+            row = await queries.get_price_stats(session, cutoff_time)
 
-            if not prices:
+            if not row:
                 raise HTTPException(
                     status_code=404, detail="No price data available for this period"
                 )
 
-            # Calculate stats (filter out None values)
-            closes = [float(p.close) for p in prices if p.close is not None]
-            highs = [float(p.high) for p in prices if p.high is not None]
-            lows = [float(p.low) for p in prices if p.low is not None]
-            
-            if not closes:
+            if not row["close_points"]:
                 raise HTTPException(
                     status_code=404, detail="No valid price data available for this period"
                 )
 
-            first_price = closes[0]
-            last_price = closes[-1]
+            first_price = float(row["first_close"])
+            last_price = float(row["last_close"])
             price_change = last_price - first_price
             price_change_pct = (price_change / first_price) * 100 if first_price else 0
 
@@ -228,14 +318,14 @@ async def get_price_stats(
                 "data": {
                     "period_hours": hours,
                     "current_price": last_price,
-                    "high": max(highs),
-                    "low": min(lows),
-                    "average": sum(closes) / len(closes),
+                    "high": float(row["high"]) if row["high"] is not None else None,
+                    "low": float(row["low"]) if row["low"] is not None else None,
+                    "average": float(row["average"]),
                     "change": price_change,
                     "change_pct": price_change_pct,
-                    "data_points": len(prices),
-                    "first_timestamp": prices[0].timestamp.isoformat(),
-                    "last_timestamp": prices[-1].timestamp.isoformat(),
+                    "data_points": row["data_points"],
+                    "first_timestamp": row["first_timestamp"].isoformat(),
+                    "last_timestamp": row["last_timestamp"].isoformat(),
                 },
             }
 
@@ -2,15 +2,21 @@
 AUREX.AI - Sentiment API Endpoints.
 """
 
+import secrets
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query
 from loguru import logger
+from pydantic import BaseModel
 from sqlalchemy import desc, select
 
+from packages.ai_core.sentiment import get_model_registry
 from packages.db_core.cache import get_cache
 from packages.db_core.connection import db_manager
 from packages.db_core.models import SentimentSummary
+from packages.shared.config import config
+
+from ..pagination import paginate
 
 router = APIRouter()
 
@@ -71,7 +77,7 @@ async def get_sentiment_summary(
                     "negative_count": negative,
                     "total_articles": total_articles,
                     "aggregate_score": float(summary.avg_sentiment) if summary.avg_sentiment else 0.0,
-                    "confidence": 0.85,  # Default confidence
+                    "confidence": summary.confidence,  # None for summaries predating calibration
                     "source": summary.symbol if hasattr(summary, 'symbol') else "news_articles",
                     "distribution": {
                         "positive": positive,
@@ -104,6 +110,8 @@ async def get_sentiment_history(
     period_hours: int = Query(24, ge=1, le=168, description="Period for each summary"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=200, description="Items per page"),
+    cursor: str = Query(None, description="Cursor from the previous page"),
+    include_total: bool = Query(False, description="Include total_items (runs a count)"),
 ):
     """
     Get historical sentiment summaries.
@@ -111,8 +119,10 @@ async def get_sentiment_history(
     Args:
         hours: Number of hours of history
         period_hours: Period for each summary
-        page: Page number
+        page: Page number (deprecated, use cursor)
         page_size: Number of items per page
+        cursor: Cursor from the previous page's next_cursor
+        include_total: Also count the matching rows
 
     Returns:
         dict: Historical sentiment data with pagination
@@ -120,7 +130,10 @@ async def get_sentiment_history(
     cache_manager = await get_cache()
 
     # Try cache first
-    cache_key = f"sentiment:history:{hours}:{period_hours}:page{page}:size{page_size}"
+    cache_key = (
+        f"sentiment:history:{hours}:{period_hours}:page{page}:size{page_size}"
+        f":cursor{cursor}:total{include_total}"
+    )
     cached_data = await cache_manager.get(cache_key)
 
     if cached_data:
@@ -136,20 +149,18 @@ async def get_sentiment_history(
                 SentimentSummary.timestamp >= cutoff_time,
             )
 
-            # Count total
-            count_result = await session.execute(query)
-            total_count = len(count_result.scalars().all())
-
             # Fetch page
-            query = (
-                query.order_by(desc(SentimentSummary.timestamp))
-                .offset((page - 1) * page_size)
-                .limit(page_size)
+            summaries, pagination = await paginate(
+                session,
+                query,
+                SentimentSummary.timestamp,
+                SentimentSummary.id,
+                page_size,
+                cursor=cursor,
+                page=page,
+                include_total=include_total,
             )
 
-            result = await session.execute(query)
-            summaries = result.scalars().all()
-
             summary_data = [
                 {
                     "id": str(s.id),
@@ -160,7 +171,7 @@ async def get_sentiment_history(
                     "negative_count": s.negative_count,
                     "total_articles": s.sample_size,  # Use sample_size
                     "aggregate_score": float(s.avg_sentiment),  # Use avg_sentiment
-                    "confidence": 0.85,  # Default confidence value
+                    "confidence": s.confidence,
                     "distribution": {
                         "positive": s.positive_count,
                         "neutral": s.neutral_count,
@@ -178,12 +189,7 @@ async def get_sentiment_history(
             response = {
                 "status": "success",
                 "data": summary_data,
-                "pagination": {
-                    "page": page,
-                    "page_size": page_size,
-                    "total_items": total_count,
-                    "total_pages": (total_count + page_size - 1) // page_size,
-                },
+                "pagination": pagination,
                 "params": {
                     "hours": hours,
                     "period_hours": period_hours,
@@ -195,6 +201,8 @@ async def get_sentiment_history(
 
             return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching sentiment history: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -283,3 +291,61 @@ async def get_sentiment_trend(
         logger.error(f"Error calculating sentiment trend: {e}")
         raise HTTPException(status_code=500, detail="Internal server error")
 
+
+class ModelActivationRequest(BaseModel):
+    """Model version to load and swap in."""
+
+    model_name: str | None = None
+    revision: str | None = None
+    backend: str | None = None
+
+
+@router.get("/model")
+async def get_sentiment_model():
+    """
+    Get the active sentiment model version and any swap in progress.
+
+    Returns:
+        dict: Model registry status
+    """
+    return {"status": "success", "data": get_model_registry().get_status()}
+
+
+@router.post("/model", status_code=202)
+async def activate_sentiment_model(
+    request: ModelActivationRequest,
+    x_api_key: str | None = Header(None),
+):
+    """
+    Load a model version in the background and swap it in once warmed up.
+
+    The current model keeps serving until the new one is ready; a failed
+    load leaves it in place and is reported as ``last_error``.
+
+    Args:
+        request: Model name, revision and backend (omitted = configured default)
+        x_api_key: Admin API key
+
+    Returns:
+        dict: Model registry status after the swap was scheduled
+    """
+    if not config.API_KEY or config.API_KEY == config.API_KEY_PLACEHOLDER:
+        raise HTTPException(status_code=503, detail="Model activation is disabled (API_KEY not set)")
+    if not x_api_key or not secrets.compare_digest(x_api_key.encode(), config.API_KEY.encode()):
+        raise HTTPException(status_code=401, detail="Invalid API key")
+
+    model_name = request.model_name or config.FINBERT_MODEL_NAME
+    if model_name not in config.MODEL_ALLOWLIST:
+        raise HTTPException(status_code=403, detail=f"Model '{model_name}' is not allowed")
+
+    registry = get_model_registry()
+    if registry.get_status()["swap_in_progress"]:
+        raise HTTPException(status_code=409, detail="A model swap is already in progress")
+
+    registry.start_activation(
+        model_name=request.model_name,
+        revision=request.revision,
+        backend=request.backend,
+    )
+    logger.info(f"Scheduled sentiment model swap: {request.model_dump()}")
+    return {"status": "accepted", "data": registry.get_status()}
@@ -21,6 +21,7 @@ try:
 except ModuleNotFoundError:
     # Fall back to local development import
     from app.api.v1 import api_router
+from packages.ai_core.sentiment import start_background_warmup
 from packages.shared.config import config
 from packages.shared.logging_config import setup_logging
 
@@ -41,6 +42,11 @@ async def lifespan(app: FastAPI):
     logger.info(f"Database: {config.DATABASE_URL.split('@')[1]}")
     logger.info("=" * 80)
 
+    # Warm up the sentiment model in the background; readiness does not wait for it
+    if config.SENTIMENT_WARMUP_ON_STARTUP:
+        logger.info("Starting background sentiment model warm-up...")
+        start_background_warmup()
+
     yield
 
     logger.info("AUREX.AI Backend Shutting Down...")
@@ -14,22 +14,195 @@ import sys
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+import numpy as np
 from loguru import logger
 from sqlalchemy import select, func
 from tasks.fetch_news import NewsFetcher
-from packages.ai_core.sentiment import SentimentAnalyzer
+from packages.ai_core.aspects import get_aspect_extractor
+from packages.ai_core.sentiment import (
+    analyze_long_documents,
+    analyze_sentiment,
+    analyze_stream,
+    start_background_warmup,
+)
+from packages.ai_core.vector_index import EmbeddingIndex
 from packages.db_core.connection import db_manager
 from packages.db_core.models import News
+from packages.shared.config import config
 from packages.shared.logging_config import setup_logging
 
 
+async def reuse_canonical_sentiment(session, news_items: list[News]) -> list[News]:
+    """
+    Copy sentiment from already-labeled canonical articles onto near-duplicates.
+
+    Args:
+        session: Open database session
+        news_items: Unlabeled articles
+
+    Returns:
+        list: Articles that still need inference (duplicates whose canonical is
+        in the same batch are left for ``copy_batch_canonical_sentiment``)
+    """
+    canonical_ids = {news.canonical_id for news in news_items if news.canonical_id}
+    if not canonical_ids:
+        return list(news_items)
+
+    result = await session.execute(
+        select(
+            News.id,
+            News.sentiment_label,
+            News.sentiment_score,
+            News.sentiment_model_version,
+            News.sentiment_relevance,
+        ).where(
+            News.id.in_(canonical_ids),
+            News.sentiment_label != None,
+        )
+    )
+    labeled = {
+        row.id: (
+            row.sentiment_label,
+            row.sentiment_score,
+            row.sentiment_model_version,
+            row.sentiment_relevance,
+        )
+        for row in result
+    }
+    batch_ids = {news.id for news in news_items}
+
+    remaining = []
+    reused_count = 0
+    for news in news_items:
+        if news.canonical_id in labeled:
+            (
+                news.sentiment_label,
+                news.sentiment_score,
+                news.sentiment_model_version,
+                news.sentiment_relevance,
+            ) = labeled[news.canonical_id]
+            reused_count += 1
+        elif news.canonical_id not in batch_ids:
+            remaining.append(news)
+
+    if reused_count:
+        logger.info(f"♻️  Reused canonical sentiment for {reused_count} near-duplicates")
+    return remaining
+
+
+def copy_batch_canonical_sentiment(news_items: list[News]) -> int:
+    """
+    Label near-duplicates whose canonical article was scored in the same batch.
+
+    Args:
+        news_items: Articles of the current batch
+
+    Returns:
+        int: Number of articles labeled
+    """
+    by_id = {news.id: news for news in news_items}
+    copied = 0
+    for news in news_items:
+        canonical = by_id.get(news.canonical_id)
+        if news.sentiment_label is None and canonical is not None and canonical.sentiment_label:
+            news.sentiment_label = canonical.sentiment_label
+            news.sentiment_score = canonical.sentiment_score
+            news.sentiment_model_version = canonical.sentiment_model_version
+            news.sentiment_relevance = canonical.sentiment_relevance
+            copied += 1
+    return copied
+
+
+def index_article_embeddings(articles: list[dict], embeddings: dict) -> int:
+    """
+    Add stored articles' sentence embeddings to the similar-news index.
+
+    Args:
+        articles: Stored articles
+        embeddings: Article id -> embedding from the scoring pass
+
+    Returns:
+        int: Number of articles indexed
+    """
+    indexed = [article for article in articles if article["id"] in embeddings]
+    if not indexed:
+        return 0
+
+    model_version = indexed[0].get("sentiment_model_version")
+    index = EmbeddingIndex.load(config.EMBEDDING_INDEX_PATH, model_version=model_version)
+    index.add(
+        [article["id"] for article in indexed],
+        np.stack([embeddings[article["id"]] for article in indexed]),
+        [article["timestamp"].timestamp() for article in indexed],
+    )
+    index.save(config.EMBEDDING_INDEX_PATH)
+    return len(indexed)
+
+
+async def fetch_and_score_news(fetcher: NewsFetcher, embeddings: dict | None = None) -> list[dict]:
+    """
+    Fetch articles and score them while later sources are still being fetched.
+
+    Articles flow from the feeds straight into ``analyze_stream``, so feed
+    parsing, tokenization and inference overlap. Near-duplicates are linked
+    to their canonical article and not scored; they take its label after
+    storage. With aspect extraction enabled only the gold-relevant sentences
+    are scored and the article carries their relevance weight.
+
+    Args:
+        fetcher: News fetcher
+        embeddings: If given, filled with article id -> sentence embedding
+            pooled from the same forward pass
+
+    Returns:
+        list: All fetched articles, scored ones carrying sentiment fields
+    """
+    index = await fetcher.get_dedup_index()
+    extractor = get_aspect_extractor()
+    articles = []
+    to_score = []
+
+    async def texts():
+        async for article in fetcher.iter_news():
+            articles.append(article)
+            if fetcher.link_duplicate(article, index) is None:
+                to_score.append(article)
+                text = f"{article['title']}. {article['content'] or ''}"
+                if extractor is not None:
+                    extraction = extractor.extract(text)
+                    article["sentiment_relevance"] = extraction["relevance"]
+                    text = extraction["text"]
+                yield text
+
+    scored_count = 0
+    async for sentiment in analyze_stream(texts(), with_embeddings=embeddings is not None):
+        article = to_score[scored_count]
+        article["sentiment_label"] = sentiment["label"]
+        article["sentiment_score"] = sentiment["score"]
+        article["sentiment_model_version"] = sentiment.get("model_version")
+        if embeddings is not None and sentiment.get("embedding") is not None:
+            embeddings[article["id"]] = sentiment["embedding"]
+        scored_count += 1
+
+        if scored_count % 10 == 0:
+            logger.info(f"  ✓ Analyzed {scored_count} articles...")
+
+    logger.info(f"✅ Analyzed {scored_count} articles while fetching")
+    return articles
+
+
 async def fetch_and_analyze_news():
     """Fetch news and analyze sentiment - single iteration."""
     try:
-        # Fetch news
+        # Fetch news, scoring headlines as they arrive
         logger.info("📰 Fetching gold-related news from NewsAPI...")
         fetcher = NewsFetcher()
-        articles = await fetcher.fetch_news()
+        embeddings = {} if config.EMBEDDINGS_ENABLED else None
+        if config.LONG_DOC_ENABLED:
+            # Full bodies are scored in windows by the catch-up pass below
+            articles = await fetcher.fetch_news()
+        else:
+            articles = await fetch_and_score_news(fetcher, embeddings)
         
         if not articles:
             logger.warning("⚠️  No new articles fetched")
@@ -41,10 +214,13 @@ async def fetch_and_analyze_news():
         logger.info("💾 Storing articles in database...")
         stored_count = await fetcher.store_news(articles)
         logger.info(f"✅ Stored {stored_count} articles")
+
+        if embeddings and stored_count:
+            indexed_count = index_article_embeddings(articles, embeddings)
+            logger.info(f"✅ Indexed {indexed_count} article embeddings")
         
-        # Analyze sentiment
+        # Catch up on articles still without sentiment (near-duplicates, earlier failures)
         logger.info("🧠 Running sentiment analysis...")
-        analyzer = SentimentAnalyzer()
         
         async with db_manager.get_session() as session:
             # Get articles without sentiment (limit to recent 50)
@@ -56,24 +232,46 @@ async def fetch_and_analyze_news():
             )
             news_items = result.scalars().all()
             
+            # Near-duplicates take their canonical article's label instead of re-running inference
+            to_score = await reuse_canonical_sentiment(session, news_items)
+            
             if news_items:
+                # Submit all articles at once so the micro-batcher can coalesce them
+                texts = [f"{news.title}. {news.content or ''}" for news in to_score]
+                relevances = [None] * len(texts)
+                extractor = get_aspect_extractor()
+                if extractor is not None:
+                    # Score only the gold-relevant spans
+                    texts, relevances = extractor.focus(texts)
+                if config.LONG_DOC_ENABLED:
+                    # Full bodies: score overlapping windows and aggregate per article
+                    sentiments = await analyze_long_documents(texts)
+                else:
+                    sentiments = await asyncio.gather(
+                        *(analyze_sentiment(text) for text in texts),
+                        return_exceptions=True,
+                    )
+
                 analyzed_count = 0
-                for news in news_items:
+                for news, sentiment, relevance in zip(to_score, sentiments, relevances):
                     try:
-                        text = f"{news.title}. {news.content or ''}"
-                        sentiment = analyzer.analyze_text(text)
+                        if isinstance(sentiment, Exception):
+                            raise sentiment
                         
                         news.sentiment_label = sentiment["label"]
                         news.sentiment_score = sentiment["score"]
+                        news.sentiment_model_version = sentiment.get("model_version")
+                        news.sentiment_relevance = relevance
                         analyzed_count += 1
                         
                         if analyzed_count % 10 == 0:
-                            logger.info(f"  ✓ Analyzed {analyzed_count}/{len(news_items)}...")
+                            logger.info(f"  ✓ Analyzed {analyzed_count}/{len(to_score)}...")
                     
                     except Exception as e:
                         logger.warning(f"Error analyzing article {news.id}: {e}")
                         continue
                 
+                analyzed_count += copy_batch_canonical_sentiment(news_items)
                 await session.commit()
                 logger.info(f"✅ Analyzed {analyzed_count} articles")
             
@@ -115,6 +313,9 @@ async def run_continuous(interval_minutes: int = 60):
     logger.info(f"🔑 NewsAPI: {'Configured' if os.getenv('NEWSAPI_KEY') else 'Not configured'}")
     logger.info("="*70)
     
+    # Load the model while the first fetch is in flight
+    start_background_warmup()
+    
     iteration = 0
     
     try:
@@ -151,6 +352,9 @@ async def run_once():
     logger.info("🚀 AUREX.AI - News Fetcher & Sentiment Analyzer (One-time)")
     logger.info("="*70)
     
+    # Load the model while the fetch is in flight
+    start_background_warmup()
+    
     try:
         success = await fetch_and_analyze_news()
         
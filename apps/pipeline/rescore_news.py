@@ -0,0 +1,245 @@
+"""
+AUREX.AI - Bulk News Re-Scoring
+
+Re-runs sentiment analysis over a time range of stored news articles using a
+pool of inference worker processes. Intended for backfills after a model
+change, e.g.:
+
+    python apps/pipeline/rescore_news.py --days 30 --workers 8 --threads 4
+
+With ``--stale-only`` only rows scored by a different model version (or not
+at all) are re-scored, so a rollout can be backfilled incrementally.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from loguru import logger
+from sqlalchemy import or_, select, tuple_
+
+from packages.ai_core.aspects import get_aspect_extractor
+from packages.ai_core.process_pool import ProcessPoolAnalyzer
+from packages.ai_core.registry import make_model_version
+from packages.ai_core.results import SentimentBatch
+from packages.db_core.bulk import update_news_sentiment
+from packages.db_core.connection import db_manager
+from packages.db_core.models import News
+from packages.shared.config import config
+from packages.shared.logging_config import setup_logging
+
+
+async def iter_news_pages(
+    start: datetime,
+    end: datetime,
+    page_size: int,
+    only_unlabeled: bool = False,
+    stale_version: str | None = None,
+) -> AsyncIterator[tuple[list, list[str]]]:
+    """
+    Page through news in [start, end) ordered by (timestamp, id).
+
+    Args:
+        start: Inclusive range start
+        end: Exclusive range end
+        page_size: Rows per page
+        only_unlabeled: Skip articles that already have a sentiment label
+        stale_version: Skip articles already scored by this model version
+
+    Yields:
+        tuple: (article ids, texts to score) for each page
+    """
+    last_key = None
+
+    while True:
+        query = select(News.id, News.timestamp, News.title, News.content).where(
+            News.timestamp >= start,
+            News.timestamp < end,
+        )
+        if only_unlabeled:
+            query = query.where(News.sentiment_label.is_(None))
+        if stale_version is not None:
+            query = query.where(
+                or_(
+                    News.sentiment_model_version.is_(None),
+                    News.sentiment_model_version != stale_version,
+                )
+            )
+        if last_key is not None:
+            query = query.where(tuple_(News.timestamp, News.id) > last_key)
+        query = query.order_by(News.timestamp, News.id).limit(page_size)
+
+        async with db_manager.get_session() as session:
+            rows = (await session.execute(query)).all()
+
+        if not rows:
+            return
+
+        yield [row.id for row in rows], [f"{row.title}. {row.content or ''}" for row in rows]
+        last_key = (rows[-1].timestamp, rows[-1].id)
+
+
+async def write_results(
+    ids: list,
+    results: SentimentBatch,
+    relevances: list[float] | None = None,
+) -> int:
+    """
+    Write sentiment results back to the news table.
+
+    Args:
+        ids: Article ids
+        results: Columnar sentiment results in the same order
+        relevances: Relevance weights of the scored spans (None = whole texts scored)
+
+    Returns:
+        int: Number of rows updated
+    """
+    columns = results.to_columns()
+    columns["sentiment_relevance"] = relevances
+    async with db_manager.get_session() as session:
+        return await update_news_sentiment(session, ids, columns)
+
+
+async def rescore_news(
+    pool: ProcessPoolAnalyzer,
+    start: datetime,
+    end: datetime,
+    only_unlabeled: bool = False,
+    stale_version: str | None = None,
+) -> int:
+    """
+    Re-score all news in a time range through the process pool.
+
+    Pages are read, scored and written concurrently: up to
+    ``pool.max_in_flight`` chunks are being scored while earlier chunks are
+    written back. With aspect extraction enabled only the gold-relevant
+    spans of each article are scored.
+
+    Args:
+        pool: Started process pool
+        start: Inclusive range start
+        end: Exclusive range end
+        only_unlabeled: Skip articles that already have a sentiment label
+        stale_version: Skip articles already scored by this model version
+
+    Returns:
+        int: Number of articles re-scored
+    """
+    pending: deque[tuple[list, list[float] | None, asyncio.Future]] = deque()
+    extractor = get_aspect_extractor()
+    rescored = 0
+    started = time.perf_counter()
+
+    async def drain_one() -> None:
+        nonlocal rescored
+        ids, relevances, future = pending.popleft()
+        rescored += await write_results(ids, await future, relevances)
+        elapsed = time.perf_counter() - started
+        logger.info(f"  ✓ Re-scored {rescored} articles ({rescored / elapsed:.1f}/s)")
+
+    async for ids, texts in iter_news_pages(
+        start, end, pool.chunk_size, only_unlabeled, stale_version
+    ):
+        relevances = None
+        if extractor is not None:
+            texts, relevances = extractor.focus(texts)
+        pending.append((ids, relevances, asyncio.wrap_future(pool.submit(texts))))
+        if len(pending) >= pool.max_in_flight:
+            await drain_one()
+
+    while pending:
+        await drain_one()
+
+    return rescored
+
+
+def parse_utc(value: str) -> datetime:
+    """
+    Parse an ISO 8601 timestamp as an aware UTC datetime.
+
+    Args:
+        value: Timestamp; one without an offset is taken to be UTC
+
+    Returns:
+        datetime: Timezone-aware datetime in UTC
+    """
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Re-score stored news sentiment in bulk")
+    parser.add_argument("--start", type=parse_utc, help="Range start (ISO 8601, UTC if no offset)")
+    parser.add_argument("--end", type=parse_utc, help="Range end (ISO 8601, default now)")
+    parser.add_argument("--days", type=int, default=30, help="Days back when --start is omitted")
+    parser.add_argument("--workers", type=int, help="Worker processes")
+    parser.add_argument("--threads", type=int, help="Torch threads per worker")
+    parser.add_argument("--chunk-size", type=int, help="Texts per worker task")
+    parser.add_argument(
+        "--only-unlabeled",
+        action="store_true",
+        help="Only score articles without a sentiment label",
+    )
+    parser.add_argument(
+        "--stale-only",
+        action="store_true",
+        help="Only score articles not yet scored by the configured model version",
+    )
+    return parser.parse_args()
+
+
+async def main() -> None:
+    """Main entry point."""
+    setup_logging("news-rescorer", log_level="INFO")
+    args = parse_args()
+
+    end = args.end or datetime.now(timezone.utc)
+    start = args.start or end - timedelta(days=args.days)
+
+    logger.info("=" * 70)
+    logger.info("🔁 AUREX.AI - Bulk News Re-Scoring")
+    logger.info("=" * 70)
+    logger.info(f"Range: {start.isoformat()} → {end.isoformat()}")
+
+    stale_version = None
+    if args.stale_only:
+        stale_version = make_model_version(config.FINBERT_MODEL_NAME, config.FINBERT_MODEL_REVISION)
+        logger.info(f"Skipping articles already scored by {stale_version}")
+
+    started = time.perf_counter()
+    pool = ProcessPoolAnalyzer(
+        num_workers=args.workers,
+        threads_per_worker=args.threads,
+        chunk_size=args.chunk_size,
+    )
+
+    try:
+        with pool:
+            rescored = await rescore_news(
+                pool,
+                start,
+                end,
+                only_unlabeled=args.only_unlabeled,
+                stale_version=stale_version,
+            )
+
+        elapsed = time.perf_counter() - started
+        logger.info(f"✅ Re-scored {rescored} articles in {elapsed:.1f}s")
+    finally:
+        await db_manager.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
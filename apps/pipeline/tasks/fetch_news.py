@@ -6,13 +6,18 @@ Fetches financial news from NewsAPI and RSS feeds and stores it in the database.
 
 import asyncio
 import os
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta
-from hashlib import md5
+from pathlib import Path
+from uuid import UUID, uuid4
 
 import feedparser
 from loguru import logger
 from newsapi import NewsApiClient
+from sqlalchemy import select
 
+from packages.ai_core.dedup import NearDuplicateIndex, normalize_article, rebuild_index_from_db
+from packages.db_core.bulk import fill_undated_news, make_url_hash, upsert_news
 from packages.db_core.cache import cache_manager
 from packages.db_core.connection import db_manager
 from packages.db_core.models import News
@@ -36,7 +41,11 @@ class NewsFetcher:
             "https://feeds.finance.yahoo.com/rss/2.0/headline?s=GC=F&region=US&lang=en-US",
         ]
         self.cache_ttl = config.CACHE_TTL_NEWS
-        self.seen_articles = set()  # For deduplication
+        # Long-document mode scores full bodies in windows, so content is not clipped
+        self.content_limit = None if config.LONG_DOC_ENABLED else config.NEWS_CONTENT_MAX_CHARS
+        self.seen_articles = set()  # URL hashes already fetched or stored, for deduplication
+        self.seen_loaded = False  # Seeded from the news table on first fetch
+        self.dedup_index: NearDuplicateIndex | None = None  # Near-duplicate index, loaded lazily
         
         if self.newsapi_client:
             logger.info("NewsFetcher initialized with NewsAPI + RSS fallback sources")
@@ -79,7 +88,7 @@ class NewsFetcher:
                     try:
                         # Create unique ID for deduplication
                         url = article_data.get('url', '')
-                        article_id = md5(url.encode()).hexdigest()
+                        article_id = make_url_hash(url)
 
                         if article_id in self.seen_articles:
                             continue  # Skip duplicates
@@ -89,7 +98,7 @@ class NewsFetcher:
                         try:
                             timestamp = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
                         except:
-                            timestamp = datetime.utcnow()
+                            timestamp = None  # Resolved in iter_news (stable across re-fetches)
 
                         # Extract article data
                         article = {
@@ -97,11 +106,13 @@ class NewsFetcher:
                             "url": url,
                             "source": article_data.get('source', {}).get('name', 'NewsAPI'),
                             "timestamp": timestamp,
-                            "content": (article_data.get('description') or article_data.get('content') or '')[:500],
+                            "content": (article_data.get('description') or article_data.get('content') or '')[:self.content_limit],
+                            "url_hash": article_id,
                         }
 
                         articles.append(article)
-                        self.seen_articles.add(article_id)
+                        if article_id:
+                            self.seen_articles.add(article_id)
 
                     except Exception as e:
                         logger.warning(f"Error parsing NewsAPI article: {e}")
@@ -125,6 +136,20 @@ class NewsFetcher:
             list[dict]: List of news articles
         """
         all_articles = []
+        async for articles_from_feed in self.iter_rss_feeds():
+            all_articles.extend(articles_from_feed)
+        return all_articles
+
+    async def iter_rss_feeds(self) -> AsyncIterator[list[dict]]:
+        """
+        Parse RSS feeds one at a time, yielding each feed's articles as soon as it is parsed.
+
+        Stops after the feeds yielded at least 10 articles.
+
+        Yields:
+            list[dict]: New articles from one feed
+        """
+        total = 0
 
         for rss_url in self.rss_urls:
             try:
@@ -142,100 +167,227 @@ class NewsFetcher:
                 for entry in feed.entries:
                     try:
                         # Create unique ID for deduplication
-                        article_id = md5(entry.link.encode()).hexdigest()
+                        article_id = make_url_hash(entry.link)
 
                         if article_id in self.seen_articles:
                             continue  # Skip duplicates
 
                         # Extract article data
                         published = entry.get("published_parsed") or entry.get("updated_parsed")
-                        timestamp = (
-                            datetime(*published[:6])
-                            if published
-                            else datetime.utcnow()
-                        )
+                        # Undated entries are resolved in iter_news (stable across re-fetches)
+                        timestamp = datetime(*published[:6]) if published else None
 
                         article = {
                             "title": entry.title,
                             "url": entry.link,
                             "source": feed.feed.get("title", "Financial News"),
                             "timestamp": timestamp,
-                            "content": entry.get("summary", "")[:500],  # Limit content
+                            "content": entry.get("summary", "")[: self.content_limit],  # Limit content
+                            "url_hash": article_id,
                         }
 
                         articles_from_feed.append(article)
-                        self.seen_articles.add(article_id)
+                        if article_id:
+                            self.seen_articles.add(article_id)
 
                     except Exception as e:
                         logger.warning(f"Error parsing article: {e}")
                         continue
 
                 logger.info(f"Fetched {len(articles_from_feed)} articles from {rss_url}")
-                all_articles.extend(articles_from_feed)
-
-                # If we got articles, we can stop trying other sources
-                if len(all_articles) >= 10:
-                    break
 
             except Exception as e:
                 logger.warning(f"Error with {rss_url}: {e}")
                 continue
 
-        return all_articles
+            yield articles_from_feed
+            total += len(articles_from_feed)
 
-    async def fetch_news(self) -> list[dict]:
+            # If we got articles, we can stop trying other sources
+            if total >= 10:
+                break
+
+    async def iter_news(self) -> AsyncIterator[dict]:
         """
-        Fetch news from all sources (NewsAPI first, then RSS fallback).
+        Yield articles from all sources as each source is parsed.
 
-        Returns:
-            list[dict]: List of news articles
+        NewsAPI is tried first, then RSS feeds as a fallback. Consumers can
+        start processing (e.g. sentiment scoring) while later feeds are
+        still being fetched.
+
+        Yields:
+            dict: News article
         """
-        all_articles = []
+        total = 0
+        await self.load_seen_articles()
 
         # Try NewsAPI first (more reliable and structured)
         if self.newsapi_client:
-            newsapi_articles = await self.fetch_from_newsapi()
-            all_articles.extend(newsapi_articles)
+            articles = await self.fetch_from_newsapi()
+            await self.resolve_timestamps(articles)
+            for article in articles:
+                total += 1
+                yield article
 
         # If NewsAPI didn't get enough articles, use RSS feeds
-        if len(all_articles) < 10:
+        if total < 10:
             logger.info("Fetching additional articles from RSS feeds...")
-            rss_articles = await self.fetch_from_rss()
-            all_articles.extend(rss_articles)
+            async for articles_from_feed in self.iter_rss_feeds():
+                await self.resolve_timestamps(articles_from_feed)
+                for article in articles_from_feed:
+                    total += 1
+                    yield article
 
-        logger.info(f"Total fetched: {len(all_articles)} new articles")
-        return all_articles
+        logger.info(f"Total fetched: {total} new articles")
+
+    async def resolve_timestamps(self, articles: list[dict]) -> None:
+        """
+        Timestamp undated articles so a re-fetched URL gets the same value.
+
+        Undated articles take the timestamp of their stored copy, so the
+        (url_hash, timestamp) unique key still catches them after a restart.
+
+        Args:
+            articles: Articles from one source (updated in place)
+        """
+        if not any(article["timestamp"] is None for article in articles):
+            return
+
+        try:
+            async with db_manager.get_session() as session:
+                await fill_undated_news(session, articles)
+        except Exception as e:
+            logger.warning(f"Could not look up stored timestamps: {e}")
+            for article in articles:
+                if article["timestamp"] is None:
+                    article["timestamp"] = datetime.utcnow()
+
+    async def load_seen_articles(self) -> None:
+        """Seed the seen set with URL hashes stored within the dedup window (once per process)."""
+        if self.seen_loaded:
+            return
+        self.seen_loaded = True
+
+        try:
+            cutoff_time = datetime.utcnow() - timedelta(hours=config.DEDUP_WINDOW_HOURS)
+            async with db_manager.get_session() as session:
+                result = await session.execute(
+                    select(News.url_hash).where(
+                        News.timestamp >= cutoff_time,
+                        News.url_hash.isnot(None),
+                    )
+                )
+                self.seen_articles.update(result.scalars().all())
+            logger.info(f"Loaded {len(self.seen_articles)} stored URL hashes")
+        except Exception as e:
+            logger.warning(f"Could not load stored URL hashes: {e}")
+
+    async def fetch_news(self) -> list[dict]:
+        """
+        Fetch news from all sources (NewsAPI first, then RSS fallback).
+
+        Returns:
+            list[dict]: List of news articles
+        """
+        return [article async for article in self.iter_news()]
+
+    async def get_dedup_index(self) -> NearDuplicateIndex | None:
+        """
+        Load the persisted near-duplicate index, rebuilding it from the DB if missing.
+
+        Returns:
+            NearDuplicateIndex | None: Index, or None if deduplication is disabled
+        """
+        if not config.DEDUP_ENABLED:
+            return None
+
+        if self.dedup_index is None:
+            index = NearDuplicateIndex.load(config.DEDUP_INDEX_PATH)
+            if not Path(config.DEDUP_INDEX_PATH).exists():
+                try:
+                    count = await rebuild_index_from_db(index)
+                    logger.info(f"Rebuilt dedup index from {count} stored articles")
+                except Exception as e:
+                    logger.warning(f"Could not rebuild dedup index: {e}")
+            self.dedup_index = index
+
+        return self.dedup_index
+
+    def link_duplicate(self, article: dict, index: NearDuplicateIndex | None) -> UUID | None:
+        """
+        Assign an article id and link the article to its canonical copy if it is a near-duplicate.
+
+        Idempotent: articles that were already linked keep their result.
+
+        Args:
+            article: Article dictionary (updated in place with "id" and "canonical_id")
+            index: Near-duplicate index, or None to skip detection
+
+        Returns:
+            UUID | None: Canonical article id if the article is a near-duplicate
+        """
+        article.setdefault("id", uuid4())
+        if "canonical_id" not in article:
+            canonical_id = None
+            if index is not None:
+                canonical_id = index.find_or_add(
+                    str(article["id"]),
+                    normalize_article(article["title"], article.get("content")),
+                    article.get("timestamp"),
+                )
+            article["canonical_id"] = UUID(canonical_id) if canonical_id else None
+        return article["canonical_id"]
 
     async def store_news(self, articles: list[dict]) -> int:
         """
         Store news articles in database.
 
+        Near-duplicates of already-seen articles (e.g. syndicated wire stories)
+        are stored with ``canonical_id`` pointing at the first-seen copy. All
+        rows are written with one bulk upsert; articles whose URL is already
+        stored are skipped by the ``url_hash`` unique key.
+
         Args:
             articles: List of article dictionaries
 
         Returns:
-            int: Number of articles stored
+            int: Number of new articles stored
         """
         if not articles:
             return 0
 
         try:
-            async with db_manager.get_session() as session:
-                stored_count = 0
-                for article_data in articles:
-                    # Check if article already exists
-                    # (In production, would use a unique constraint)
-                    news_record = News(**article_data)
-                    session.add(news_record)
-                    stored_count += 1
+            index = await self.get_dedup_index()
+
+            duplicate_count = 0
+            for article_data in articles:
+                if self.link_duplicate(article_data, index) is not None:
+                    duplicate_count += 1
 
+            # Exact duplicates (same URL) are skipped by the url_hash unique key
+            async with db_manager.get_session() as session:
+                counts = await upsert_news(session, articles)
                 await session.commit()
+            stored_count = counts["inserted"]
+
+            if index is not None:
+                # Skipped articles were indexed under ids that never reached the database
+                index.remove(
+                    str(article["id"])
+                    for article in articles
+                    if article["id"] not in counts["inserted_ids"]
+                )
+                index.save(config.DEDUP_INDEX_PATH)
 
-            logger.info(f"Stored {stored_count} articles in database")
+            logger.info(
+                f"Stored {stored_count} articles in database "
+                f"({counts['skipped']} already stored, {duplicate_count} linked as near-duplicates)"
+            )
             return stored_count
 
         except Exception as e:
             logger.error(f"Error storing news: {e}")
+            self.dedup_index = None  # Drop unsaved entries for articles that were not stored
             return 0
 
     async def cache_news(self, articles: list[dict]) -> bool:
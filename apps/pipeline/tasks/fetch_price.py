@@ -10,6 +10,7 @@ from datetime import datetime
 import yfinance as yf
 from loguru import logger
 
+from packages.db_core.bulk import bulk_insert
 from packages.db_core.cache import cache_manager
 from packages.db_core.connection import db_manager
 from packages.db_core.models import Price
@@ -88,18 +89,36 @@ class PriceFetcher:
         Returns:
             bool: True if successful
         """
+        if await self.store_prices([price_data]):
+            logger.info(f"Price stored in database: {price_data['symbol']}")
+            return True
+        return False
+
+    async def store_prices(self, prices: list[dict[str, any]]) -> int:
+        """
+        Store many price rows with one bulk insert (backfills, bursts).
+
+        Args:
+            prices: Price data dictionaries
+
+        Returns:
+            int: Number of rows stored
+        """
+        if not prices:
+            return 0
+
         try:
             async with db_manager.get_session() as session:
-                price_record = Price(**price_data)
-                session.add(price_record)
+                stats = await bulk_insert(session, Price.__table__, prices)
                 await session.commit()
 
-            logger.info(f"Price stored in database: {price_data['symbol']}")
-            return True
+            if stats["rows"] > 1:
+                logger.info(f"Stored {stats['rows']} prices ({stats['rows_per_sec']:.0f} rows/s)")
+            return stats["rows"]
 
         except Exception as e:
-            logger.error(f"Error storing price: {e}")
-            return False
+            logger.error(f"Error storing prices: {e}")
+            return 0
 
     async def cache_price(self, price_data: dict[str, any]) -> bool:
         """
@@ -12,6 +12,7 @@ from loguru import logger
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from packages.ai_core.aspects import get_aspect_extractor
 from packages.ai_core.sentiment import get_sentiment_analyzer
 from packages.db_core.cache import get_cache_manager
 from packages.db_core.connection import get_db_manager
@@ -74,6 +75,11 @@ class SentimentAggregator:
 
             # Prepare texts for analysis
             texts = [f"{item.title}. {item.content or ''}" for item in news_items]
+            relevances = [None] * len(texts)
+            extractor = get_aspect_extractor()
+            if extractor is not None:
+                # Score only the gold-relevant spans
+                texts, relevances = extractor.focus(texts)
 
             # Batch analyze
             logger.info(f"Analyzing sentiment for {len(texts)} news articles...")
@@ -81,9 +87,11 @@ class SentimentAggregator:
 
             # Update news items with sentiment
             async with self.db_manager.get_async_session() as session:
-                for news_item, result in zip(news_items, results):
+                for news_item, result, relevance in zip(news_items, results, relevances):
                     news_item.sentiment_label = result["label"]
                     news_item.sentiment_score = result["score"]
+                    news_item.sentiment_model_version = result.get("model_version")
+                    news_item.sentiment_relevance = relevance
                     session.add(news_item)
 
                 await session.commit()
@@ -134,6 +142,8 @@ class SentimentAggregator:
         # Calculate sentiment distribution
         sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
         sentiment_scores = {"positive": [], "neutral": [], "negative": []}
+        # Articles that mention gold in passing count less (unweighted if no relevance stored)
+        relevance_weights = {"positive": 0.0, "neutral": 0.0, "negative": 0.0}
 
         for item in news_items:
             label = item.sentiment_label
@@ -142,17 +152,21 @@ class SentimentAggregator:
             if label in sentiment_counts:
                 sentiment_counts[label] += 1
                 sentiment_scores[label].append(score)
+                relevance_weights[label] += (
+                    1.0 if item.sentiment_relevance is None else item.sentiment_relevance
+                )
 
         total_articles = len(news_items)
+        total_weight = sum(relevance_weights.values()) or 1.0
 
         # Calculate weighted average sentiment
-        positive_weight = sentiment_counts["positive"] / total_articles
-        negative_weight = sentiment_counts["negative"] / total_articles
+        positive_weight = relevance_weights["positive"] / total_weight
+        negative_weight = relevance_weights["negative"] / total_weight
 
         # Aggregate score: positive = 1, neutral = 0, negative = -1
         aggregate_score = positive_weight - negative_weight
 
-        # Average confidence
+        # Average confidence (calibrated probabilities when a calibration map is fitted)
         all_scores = (
             sentiment_scores["positive"]
             + sentiment_scores["neutral"]
@@ -163,14 +177,12 @@ class SentimentAggregator:
         # Create summary
         summary = SentimentSummary(
             timestamp=datetime.utcnow(),
-            period_hours=hours_back,
+            avg_sentiment=aggregate_score,
             positive_count=sentiment_counts["positive"],
             neutral_count=sentiment_counts["neutral"],
             negative_count=sentiment_counts["negative"],
-            total_articles=total_articles,
-            aggregate_score=aggregate_score,
+            sample_size=total_articles,
             confidence=avg_confidence,
-            source="news_articles",
         )
 
         session.add(summary)
@@ -235,7 +247,7 @@ class SentimentAggregator:
                 result = {
                     "status": "success",
                     "articles_analyzed": len(unprocessed_news),
-                    "aggregate_score": summary.aggregate_score,
+                    "aggregate_score": summary.avg_sentiment,
                     "confidence": summary.confidence,
                     "distribution": {
                         "positive": summary.positive_count,
@@ -19,14 +19,39 @@ CREATE TABLE IF NOT EXISTS news (
     title TEXT NOT NULL,
     source VARCHAR(100) NOT NULL,
     url TEXT,
+    url_hash CHAR(32),  -- md5 of the trimmed URL, unique per timestamp (idempotent ingestion)
     content TEXT,
     timestamp TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
     sentiment_label VARCHAR(20),  -- positive, negative, neutral
     sentiment_score FLOAT,  -- confidence score 0-1
+    sentiment_model_version VARCHAR(200),  -- model@revision that produced the label
+    sentiment_relevance FLOAT,  -- 0-1 gold relevance of the scored spans (NULL = whole text)
+    canonical_id UUID,  -- near-duplicate of this article (NULL = canonical)
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Upgrade existing installs
+ALTER TABLE news ADD COLUMN IF NOT EXISTS canonical_id UUID;
+ALTER TABLE news ADD COLUMN IF NOT EXISTS sentiment_model_version VARCHAR(200);
+ALTER TABLE news ADD COLUMN IF NOT EXISTS sentiment_relevance FLOAT;
+ALTER TABLE news ADD COLUMN IF NOT EXISTS url_hash CHAR(32);
+
+-- Backfill url_hash for the first copy of each (url, timestamp); later copies keep
+-- NULL so the unique index below can be built without deleting rows
+UPDATE news SET url_hash = md5(btrim(url))
+WHERE id IN (
+    SELECT DISTINCT ON (btrim(n.url), n.timestamp) n.id
+    FROM news n
+    WHERE n.url_hash IS NULL
+      AND btrim(coalesce(n.url, '')) <> ''
+      AND NOT EXISTS (
+          SELECT 1 FROM news h
+          WHERE h.url_hash = md5(btrim(n.url)) AND h.timestamp = n.timestamp
+      )
+    ORDER BY btrim(n.url), n.timestamp, n.created_at
+);
+
 -- Create hypertable for time-series optimization
 SELECT create_hypertable('news', 'timestamp', if_not_exists => TRUE);
 
@@ -57,10 +82,14 @@ CREATE TABLE IF NOT EXISTS sentiment_summary (
     negative_count INT DEFAULT 0,
     neutral_count INT DEFAULT 0,
     sample_size INT NOT NULL,
+    confidence FLOAT,  -- mean calibrated probability of the article labels
     symbol VARCHAR(20) DEFAULT 'XAUUSD',
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
 );
 
+-- Upgrade existing installs
+ALTER TABLE sentiment_summary ADD COLUMN IF NOT EXISTS confidence FLOAT;
+
 -- Create hypertable for time-series optimization
 SELECT create_hypertable('sentiment_summary', 'timestamp', if_not_exists => TRUE);
 
@@ -84,6 +113,10 @@ CREATE TABLE IF NOT EXISTS alerts (
 CREATE INDEX IF NOT EXISTS idx_news_timestamp ON news (timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_news_source ON news (source);
 CREATE INDEX IF NOT EXISTS idx_news_sentiment_label ON news (sentiment_label);
+CREATE INDEX IF NOT EXISTS idx_news_canonical_id ON news (canonical_id);
+CREATE INDEX IF NOT EXISTS idx_news_sentiment_model_version ON news (sentiment_model_version);
+-- Conflict target of the news upsert (includes the hypertable time column)
+CREATE UNIQUE INDEX IF NOT EXISTS uq_news_url_hash ON news (url_hash, timestamp);
 
 -- Price indexes
 CREATE INDEX IF NOT EXISTS idx_price_timestamp ON price (timestamp DESC);
@@ -157,6 +190,98 @@ SELECT add_continuous_aggregate_policy('sentiment_hourly',
     if_not_exists => TRUE
 );
 
+-- Price OHLCV candles (real-time: un-materialized recent buckets are read from raw ticks).
+-- Candles are built from the tick price; the open/high/low/close columns hold session values.
+CREATE MATERIALIZED VIEW IF NOT EXISTS price_ohlcv_1m
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 minute', timestamp) AS bucket,
+    symbol,
+    first(price, timestamp) AS open,
+    MAX(price) AS high,
+    MIN(price) AS low,
+    last(price, timestamp) AS close,
+    last(volume, timestamp) AS volume,  -- session volume reported at the bucket close
+    COUNT(*) AS ticks
+FROM price
+GROUP BY bucket, symbol
+WITH NO DATA;
+
+-- Coarser candles roll up the next finer aggregate (hierarchical, TimescaleDB >= 2.9)
+CREATE MATERIALIZED VIEW IF NOT EXISTS price_ohlcv_5m
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('5 minutes', bucket) AS bucket,
+    symbol,
+    first(open, bucket) AS open,
+    MAX(high) AS high,
+    MIN(low) AS low,
+    last(close, bucket) AS close,
+    last(volume, bucket) AS volume,
+    SUM(ticks) AS ticks
+FROM price_ohlcv_1m
+GROUP BY time_bucket('5 minutes', bucket), symbol
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS price_ohlcv_1h
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 hour', bucket) AS bucket,
+    symbol,
+    first(open, bucket) AS open,
+    MAX(high) AS high,
+    MIN(low) AS low,
+    last(close, bucket) AS close,
+    last(volume, bucket) AS volume,
+    SUM(ticks) AS ticks
+FROM price_ohlcv_5m
+GROUP BY time_bucket('1 hour', bucket), symbol
+WITH NO DATA;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS price_ohlcv_1d
+WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+SELECT
+    time_bucket('1 day', bucket) AS bucket,
+    symbol,
+    first(open, bucket) AS open,
+    MAX(high) AS high,
+    MIN(low) AS low,
+    last(close, bucket) AS close,
+    last(volume, bucket) AS volume,
+    SUM(ticks) AS ticks
+FROM price_ohlcv_1h
+GROUP BY time_bucket('1 day', bucket), symbol
+WITH NO DATA;
+
+-- Refresh policies (each window spans several buckets of its resolution)
+SELECT add_continuous_aggregate_policy('price_ohlcv_1m',
+    start_offset => INTERVAL '1 hour',
+    end_offset => INTERVAL '1 minute',
+    schedule_interval => INTERVAL '1 minute',
+    if_not_exists => TRUE
+);
+
+SELECT add_continuous_aggregate_policy('price_ohlcv_5m',
+    start_offset => INTERVAL '3 hours',
+    end_offset => INTERVAL '5 minutes',
+    schedule_interval => INTERVAL '5 minutes',
+    if_not_exists => TRUE
+);
+
+SELECT add_continuous_aggregate_policy('price_ohlcv_1h',
+    start_offset => INTERVAL '2 days',
+    end_offset => INTERVAL '1 hour',
+    schedule_interval => INTERVAL '30 minutes',
+    if_not_exists => TRUE
+);
+
+SELECT add_continuous_aggregate_policy('price_ohlcv_1d',
+    start_offset => INTERVAL '7 days',
+    end_offset => INTERVAL '1 day',
+    schedule_interval => INTERVAL '1 hour',
+    if_not_exists => TRUE
+);
+
 -- ==========================================
 -- Sample Data (Development Only)
 -- ==========================================
@@ -0,0 +1,237 @@
+"""
+AUREX.AI - Aspect Extraction.
+
+This module finds the sentences of an article that are about gold or its
+main drivers (the Fed, the dollar) with a keyword automaton, so only those
+spans are sent to FinBERT. Articles that mention gold in passing get a low
+relevance weight, which is stored next to the sentiment score and used to
+down-weight them in aggregates.
+"""
+
+import re
+from collections import deque
+from typing import Any
+
+from packages.shared.config import config
+
+ASPECT_GOLD = "gold"
+ASPECT_FED = "fed"
+ASPECT_DOLLAR = "dollar"
+
+ASPECT_KEYWORDS = {
+    ASPECT_GOLD: (
+        "gold",
+        "xau",
+        "xauusd",
+        "bullion",
+        "precious metal",
+        "precious metals",
+        "comex",
+    ),
+    ASPECT_FED: (
+        "fed",
+        "federal reserve",
+        "fomc",
+        "powell",
+        "rate cut",
+        "rate cuts",
+        "rate hike",
+        "rate hikes",
+        "interest rate",
+        "interest rates",
+    ),
+    ASPECT_DOLLAR: (
+        "dollar",
+        "usd",
+        "greenback",
+        "dxy",
+        "treasury yields",
+    ),
+}
+
+# How much a sentence about each aspect counts towards an article's relevance
+ASPECT_WEIGHTS = {ASPECT_GOLD: 1.0, ASPECT_FED: 0.6, ASPECT_DOLLAR: 0.5}
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton matching whole-word keywords in one pass over a text."""
+
+    def __init__(self, keywords: dict[str, str]) -> None:
+        """
+        Build the automaton.
+
+        Args:
+            keywords: Keyword -> aspect it signals (matched case-insensitively)
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail = [0]
+        self._output: list[list[tuple[int, str]]] = [[]]  # (keyword length, aspect)
+
+        for keyword, aspect in keywords.items():
+            state = 0
+            for char in keyword.lower():
+                child = self._goto[state].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[state][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = child
+            self._output[state].append((len(keyword), aspect))
+
+        # Breadth-first so each state's failure link is final before its children's
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """
+        Find all whole-word keyword occurrences.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            list: (start, end, aspect) for each match, in order of end offset
+        """
+        text = text.lower()
+        matches = []
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, aspect in self._output[state]:
+                start = end - length
+                if _is_boundary(text, start - 1) and _is_boundary(text, end):
+                    matches.append((start, end, aspect))
+        return matches
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Check that ``text[index]`` does not continue a word."""
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+def split_sentences(text: str) -> list[str]:
+    """
+    Split text into sentences on terminal punctuation and line breaks.
+
+    Args:
+        text: Article text
+
+    Returns:
+        list: Non-empty stripped sentences
+    """
+    return [s.strip() for s in _SENTENCE_SPLIT_RE.split(text or "") if s and s.strip()]
+
+
+class AspectExtractor:
+    """Selects gold-relevant sentences of an article and weighs its relevance."""
+
+    def __init__(
+        self,
+        keywords: dict[str, tuple[str, ...]] | None = None,
+        weights: dict[str, float] | None = None,
+        max_sentences: int | None = None,
+    ) -> None:
+        """
+        Initialize the extractor.
+
+        Args:
+            keywords: Aspect -> keywords (default: ASPECT_KEYWORDS)
+            weights: Aspect -> relevance weight (default: ASPECT_WEIGHTS)
+            max_sentences: Keep at most this many sentences per article
+                (default: ASPECT_MAX_SENTENCES)
+        """
+        keywords = keywords or ASPECT_KEYWORDS
+        self.weights = weights or ASPECT_WEIGHTS
+        self.max_sentences = max_sentences or config.ASPECT_MAX_SENTENCES
+        self.automaton = KeywordAutomaton(
+            {keyword: aspect for aspect, words in keywords.items() for keyword in words}
+        )
+
+    def extract(self, text: str) -> dict[str, Any]:
+        """
+        Extract the relevant spans of one article.
+
+        Relevance is the mean over all sentences of the highest aspect weight
+        each sentence mentions, so an article that is about gold throughout
+        scores 1.0 and a long article with one passing mention scores near 0.
+        Articles with no relevant sentence keep their first sentence (usually
+        the title) so they still get a label, with relevance 0.
+
+        Args:
+            text: Article text (title and content)
+
+        Returns:
+            dict: {"text": spans to score, "relevance": 0-1 weight,
+            "aspects": aspect -> number of sentences mentioning it}
+        """
+        sentences = split_sentences(text)
+        if not sentences:
+            return {"text": text, "relevance": 0.0, "aspects": {}}
+
+        scored = []  # (sentence index, weight)
+        aspects: dict[str, int] = {}
+        for i, sentence in enumerate(sentences):
+            found = {aspect for _, _, aspect in self.automaton.find(sentence)}
+            if found:
+                scored.append((i, max(self.weights[aspect] for aspect in found)))
+                for aspect in found:
+                    aspects[aspect] = aspects.get(aspect, 0) + 1
+
+        if not scored:
+            return {"text": sentences[0], "relevance": 0.0, "aspects": {}}
+
+        relevance = sum(weight for _, weight in scored) / len(sentences)
+        # Most relevant sentences first, then back in reading order
+        kept = sorted(sorted(scored, key=lambda item: -item[1])[: self.max_sentences])
+        return {
+            "text": " ".join(sentences[i] for i, _ in kept),
+            "relevance": round(relevance, 4),
+            "aspects": aspects,
+        }
+
+    def focus(self, texts: list[str]) -> tuple[list[str], list[float]]:
+        """
+        Extract relevant spans for many articles.
+
+        Args:
+            texts: Article texts
+
+        Returns:
+            tuple: (texts to score, relevance weights), aligned with ``texts``
+        """
+        extractions = [self.extract(text) for text in texts]
+        return [e["text"] for e in extractions], [e["relevance"] for e in extractions]
+
+
+# Global extractor instance (the automaton is built once per process)
+_aspect_extractor: AspectExtractor | None = None
+
+
+def get_aspect_extractor() -> AspectExtractor | None:
+    """
+    Get the global aspect extractor.
+
+    Returns:
+        AspectExtractor | None: Extractor, or None if aspect extraction is disabled
+    """
+    global _aspect_extractor
+
+    if not config.ASPECT_EXTRACTION_ENABLED:
+        return None
+    if _aspect_extractor is None:
+        _aspect_extractor = AspectExtractor()
+    return _aspect_extractor
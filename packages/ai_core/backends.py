@@ -0,0 +1,520 @@
+"""
+AUREX.AI - Inference Backends.
+
+This module provides pluggable FinBERT inference backends: the reference
+PyTorch model, an exported ONNX Runtime graph, and a dynamically quantized
+int8 ONNX variant for CPU-only hosts.
+
+torch, transformers and onnxruntime are imported only when a backend is
+loaded, so importing this module stays cheap.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.ai_core.model_cache import load_mmap_model, resolve_model_source
+from packages.ai_core.torch_runtime import TorchRuntimeProfile
+from packages.shared.config import config
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+SUPPORTED_BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+ONNX_OPSET_VERSION = 17
+
+
+class InferenceBackend:
+    """Base class for sentiment inference backends."""
+
+    name = "base"
+
+    def __init__(self, model_name: str, revision: str = "main") -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            revision: Model revision (branch, tag or commit hash)
+        """
+        self.model_name = model_name
+        self.revision = revision
+
+    def load(self) -> None:
+        """Load model weights (blocking)."""
+        raise NotImplementedError
+
+    def predict_logits(self, inputs: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Run a forward pass.
+
+        Args:
+            inputs: Tokenizer output as int64 NumPy arrays
+
+        Returns:
+            np.ndarray: Logits of shape (batch, num_labels)
+        """
+        raise NotImplementedError
+
+    def predict(self, inputs: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Run a forward pass, also returning pooled sentence embeddings.
+
+        Args:
+            inputs: Tokenizer output as int64 NumPy arrays
+
+        Returns:
+            tuple: (logits of shape (batch, num_labels), mean-pooled last hidden
+            states of shape (batch, hidden) or None if the backend cannot return them)
+        """
+        return self.predict_logits(inputs), None
+
+    def get_info(self) -> dict[str, Any]:
+        """Get backend information."""
+        return {"backend": self.name}
+
+
+class TorchBackend(InferenceBackend):
+    """Reference PyTorch backend (fp32)."""
+
+    name = BACKEND_TORCH
+
+    def __init__(
+        self,
+        model_name: str,
+        revision: str = "main",
+        device: str = "cpu",
+        profile: TorchRuntimeProfile | None = None,
+    ) -> None:
+        """
+        Initialize the PyTorch backend.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            revision: Model revision (branch, tag or commit hash)
+            device: Torch device ("cpu" or "cuda")
+            profile: Threads, autograd context and fast path (default: from config)
+        """
+        super().__init__(model_name, revision)
+        self.device = device
+        self.profile = profile or TorchRuntimeProfile()
+        self.model = None
+        self.eager_model = None
+        self.mmap_weights = False
+
+    def load(self) -> None:
+        """Load the PyTorch model, memory-mapping cached CPU weights when possible."""
+        self.profile.apply_threads()
+        self.eager_model = self._load_eager()
+        self.model = self.profile.optimize(self.eager_model)
+
+    def _load_eager(self) -> Any:
+        """Load the unoptimized model in eval mode."""
+        from transformers import AutoModelForSequenceClassification
+
+        source, revision = resolve_model_source(self.model_name, self.revision)
+
+        if revision is None and self.device == "cpu" and config.MODEL_MMAP_WEIGHTS:
+            try:
+                model = load_mmap_model(source)
+                self.mmap_weights = True
+                return model
+            except ValueError as e:
+                logger.warning(f"Cannot memory-map {source}, loading a private copy: {e}")
+
+        model = AutoModelForSequenceClassification.from_pretrained(source, revision=revision)
+        model.to(self.device)
+        model.eval()  # Set to evaluation mode
+        return model
+
+    def predict_logits(self, inputs: dict[str, np.ndarray]) -> np.ndarray:
+        """Run a forward pass with PyTorch."""
+        import torch
+
+        tensors = {key: torch.from_numpy(value).to(self.device) for key, value in inputs.items()}
+        outputs, self.model = self.profile.run(
+            self.model, self.eager_model, lambda model: model(**tensors)
+        )
+        return outputs.logits.float().cpu().numpy()
+
+    def predict(self, inputs: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray | None]:
+        """Run a forward pass with PyTorch, pooling the last hidden states of the same pass."""
+        import torch
+
+        tensors = {key: torch.from_numpy(value).to(self.device) for key, value in inputs.items()}
+
+        def forward(model: Any) -> tuple[Any, Any]:
+            outputs = model(**tensors, output_hidden_states=True)
+            return outputs.logits, mean_pool(outputs.hidden_states[-1], tensors["attention_mask"])
+
+        (logits, embeddings), self.model = self.profile.run(self.model, self.eager_model, forward)
+        return logits.float().cpu().numpy(), embeddings.float().cpu().numpy()
+
+    def get_info(self) -> dict[str, Any]:
+        """Get backend information."""
+        return {
+            "backend": self.name,
+            "device": self.device,
+            "precision": "fp32",
+            "mmap_weights": self.mmap_weights,
+        }
+
+
+class OnnxBackend(InferenceBackend):
+    """ONNX Runtime CPU backend, optionally int8-quantized."""
+
+    def __init__(
+        self,
+        model_name: str,
+        revision: str = "main",
+        quantized: bool = False,
+        export_dir: str | None = None,
+        profile: TorchRuntimeProfile | None = None,
+    ) -> None:
+        """
+        Initialize the ONNX Runtime backend.
+
+        Args:
+            model_name: Hugging Face model name or local path
+            revision: Model revision (branch, tag or commit hash)
+            quantized: Use the dynamically quantized int8 graph
+            export_dir: Directory holding exported graphs (defaults to MODEL_CACHE_DIR/onnx)
+            profile: Thread counts for the ONNX Runtime session (default: from config)
+        """
+        super().__init__(model_name, revision)
+        self.quantized = quantized
+        self.profile = profile or TorchRuntimeProfile()
+        self.name = BACKEND_ONNX_INT8 if quantized else BACKEND_ONNX
+        self.export_dir = (
+            Path(export_dir) if export_dir else get_onnx_export_dir(model_name, revision)
+        )
+        self.session = None
+        self.input_names: list[str] = []
+        self.output_names: list[str] = []
+
+    @property
+    def model_path(self) -> Path:
+        """Path of the ONNX graph used by this backend."""
+        return self.export_dir / ("model.int8.onnx" if self.quantized else "model.onnx")
+
+    def load(self) -> None:
+        """Load the ONNX graph, exporting and quantizing it first if needed."""
+        import onnxruntime as ort
+
+        if not self.model_path.exists():
+            onnx_path = self.export_dir / "model.onnx"
+            if not onnx_path.exists():
+                logger.info(f"No ONNX graph at {onnx_path}, exporting {self.model_name}")
+                onnx_path = export_onnx(self.model_name, self.export_dir, self.revision)
+            if self.quantized:
+                quantize_onnx(onnx_path)
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # Same thread budget as the torch profile (0 = ONNX Runtime default)
+        options.intra_op_num_threads = self.profile.intra_op_threads
+        options.inter_op_num_threads = self.profile.inter_op_threads
+        self.session = ort.InferenceSession(
+            str(self.model_path),
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        self.input_names = [node.name for node in self.session.get_inputs()]
+        self.output_names = [node.name for node in self.session.get_outputs()]
+
+    def predict_logits(self, inputs: dict[str, np.ndarray]) -> np.ndarray:
+        """Run a forward pass with ONNX Runtime."""
+        feed = {name: inputs[name].astype(np.int64) for name in self.input_names if name in inputs}
+        (logits,) = self.session.run(["logits"], feed)
+        return logits
+
+    def predict(self, inputs: dict[str, np.ndarray]) -> tuple[np.ndarray, np.ndarray | None]:
+        """Run a forward pass with ONNX Runtime (embeddings need a graph exported with them)."""
+        if "embeddings" not in self.output_names:
+            return self.predict_logits(inputs), None
+
+        feed = {name: inputs[name].astype(np.int64) for name in self.input_names if name in inputs}
+        logits, embeddings = self.session.run(["logits", "embeddings"], feed)
+        return logits, embeddings
+
+    def get_info(self) -> dict[str, Any]:
+        """Get backend information."""
+        return {
+            "backend": self.name,
+            "device": "cpu",
+            "precision": "int8" if self.quantized else "fp32",
+            "model_path": str(self.model_path),
+        }
+
+
+def softmax(logits: np.ndarray) -> np.ndarray:
+    """
+    Numerically stable softmax over the last axis.
+
+    Args:
+        logits: Array of logits
+
+    Returns:
+        np.ndarray: Probabilities with the same shape
+    """
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def mean_pool(hidden_states: Any, attention_mask: Any) -> Any:
+    """
+    Average token hidden states over the real (unpadded) tokens.
+
+    Works on torch tensors and NumPy arrays alike.
+
+    Args:
+        hidden_states: Hidden states of shape (batch, sequence, hidden)
+        attention_mask: Mask of shape (batch, sequence)
+
+    Returns:
+        Pooled embeddings of shape (batch, hidden)
+    """
+    if isinstance(hidden_states, np.ndarray):
+        mask = attention_mask[..., None].astype(hidden_states.dtype)
+        return (hidden_states * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1)
+
+    mask = attention_mask.unsqueeze(-1).to(hidden_states.dtype)
+    return (hidden_states * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+
+
+def get_onnx_export_dir(model_name: str, revision: str = "main") -> Path:
+    """
+    Get the export directory for a model's ONNX graphs.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        revision: Model revision (branch, tag or commit hash)
+
+    Returns:
+        Path: Directory under MODEL_CACHE_DIR/onnx
+    """
+    return Path(config.MODEL_CACHE_DIR) / "onnx" / model_name.replace("/", "--") / revision
+
+
+def export_onnx(model_name: str, output_dir: str | Path, revision: str = "main") -> Path:
+    """
+    Export a sequence-classification model to ONNX with dynamic batch/sequence axes.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        output_dir: Directory to write ``model.onnx`` into
+        revision: Model revision (branch, tag or commit hash)
+
+    Returns:
+        Path: Path of the exported graph
+    """
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / "model.onnx"
+
+    source, source_revision = resolve_model_source(model_name, revision)
+    tokenizer = AutoTokenizer.from_pretrained(source, revision=source_revision)
+    model = AutoModelForSequenceClassification.from_pretrained(source, revision=source_revision)
+    model.eval()
+
+    class WithEmbeddings(torch.nn.Module):
+        """Expose pooled embeddings next to the logits of the same pass."""
+
+        def __init__(self, classifier: Any) -> None:
+            super().__init__()
+            self.classifier = classifier
+
+        def forward(self, **inputs: Any) -> tuple[Any, Any]:
+            outputs = self.classifier(**inputs, output_hidden_states=True)
+            return outputs.logits, mean_pool(outputs.hidden_states[-1], inputs["attention_mask"])
+
+    sample = tokenizer(["Gold prices rise"], return_tensors="pt")
+    input_names = list(sample.keys())
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+    dynamic_axes["embeddings"] = {0: "batch"}
+
+    with torch.no_grad():
+        torch.onnx.export(
+            WithEmbeddings(model),
+            (),
+            str(output_path),
+            kwargs=dict(sample),
+            input_names=input_names,
+            output_names=["logits", "embeddings"],
+            dynamic_axes=dynamic_axes,
+            opset_version=ONNX_OPSET_VERSION,
+            dynamo=False,
+        )
+
+    # Keep the tokenizer next to the graph so the export dir is self-contained
+    tokenizer.save_pretrained(output_dir)
+    logger.info(f"✅ Exported ONNX graph: {output_path}")
+    return output_path
+
+
+def quantize_onnx(onnx_path: str | Path) -> Path:
+    """
+    Dynamically quantize an ONNX graph's weights to int8.
+
+    Args:
+        onnx_path: Path of the fp32 graph
+
+    Returns:
+        Path: Path of the quantized ``model.int8.onnx`` graph
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    onnx_path = Path(onnx_path)
+    output_path = onnx_path.with_name("model.int8.onnx")
+    quantize_dynamic(str(onnx_path), str(output_path), weight_type=QuantType.QInt8)
+    logger.info(f"✅ Quantized ONNX graph: {output_path}")
+    return output_path
+
+
+def create_backend(
+    backend: str | None = None,
+    model_name: str | None = None,
+    device: str = "cpu",
+    revision: str | None = None,
+    profile: TorchRuntimeProfile | None = None,
+) -> InferenceBackend:
+    """
+    Create an inference backend by name.
+
+    Args:
+        backend: One of SUPPORTED_BACKENDS (defaults to INFERENCE_BACKEND)
+        model_name: Model name (defaults to FINBERT_MODEL_NAME)
+        device: Torch device for the torch backend
+        revision: Model revision (defaults to FINBERT_MODEL_REVISION)
+        profile: Torch runtime profile (defaults to the configured profile)
+
+    Returns:
+        InferenceBackend: Unloaded backend instance
+    """
+    backend = (backend or config.INFERENCE_BACKEND).lower()
+    model_name = model_name or config.FINBERT_MODEL_NAME
+    revision = revision or config.FINBERT_MODEL_REVISION
+
+    if backend == BACKEND_TORCH:
+        return TorchBackend(model_name, revision=revision, device=device, profile=profile)
+    if backend == BACKEND_ONNX:
+        return OnnxBackend(model_name, revision=revision, quantized=False, profile=profile)
+    if backend == BACKEND_ONNX_INT8:
+        return OnnxBackend(model_name, revision=revision, quantized=True, profile=profile)
+
+    raise ValueError(f"Unknown inference backend: {backend} (expected one of {SUPPORTED_BACKENDS})")
+
+
+def compare_logits(
+    reference: np.ndarray, candidate: np.ndarray, atol: float = 0.05
+) -> dict[str, Any]:
+    """
+    Compare a candidate backend's logits against reference logits.
+
+    Args:
+        reference: Reference (torch) logits, shape (batch, num_labels)
+        candidate: Candidate backend logits, same shape
+        atol: Maximum allowed absolute logit difference
+
+    Returns:
+        dict: Max/mean absolute difference, label agreement and pass flag
+    """
+    diff = np.abs(reference - candidate)
+    agreement = float((reference.argmax(axis=-1) == candidate.argmax(axis=-1)).mean())
+    max_abs_diff = float(diff.max()) if diff.size else 0.0
+
+    return {
+        "max_abs_diff": max_abs_diff,
+        "mean_abs_diff": float(diff.mean()) if diff.size else 0.0,
+        "label_agreement": agreement,
+        "passed": agreement == 1.0 and max_abs_diff <= atol,
+    }
+
+
+def check_parity(
+    texts: list[str],
+    backend: str,
+    model_name: str | None = None,
+    atol: float = 0.05,
+) -> dict[str, Any]:
+    """
+    Check a backend's logits against the reference PyTorch model.
+
+    Args:
+        texts: Texts to score with both backends
+        backend: Backend name to check
+        model_name: Model name (defaults to FINBERT_MODEL_NAME)
+        atol: Maximum allowed absolute logit difference
+
+    Returns:
+        dict: Parity report (see ``compare_logits``)
+    """
+    from transformers import AutoTokenizer
+
+    model_name = model_name or config.FINBERT_MODEL_NAME
+    revision = config.FINBERT_MODEL_REVISION
+    # Same lookup as the analyzer: local snapshot first, Hub only when allowed
+    source, source_revision = resolve_model_source(model_name, revision)
+    tokenizer = AutoTokenizer.from_pretrained(source, revision=source_revision)
+    inputs = dict(
+        tokenizer(texts, return_tensors="np", padding=True, truncation=True, max_length=512)
+    )
+
+    reference = TorchBackend(model_name, revision=revision)
+    reference.load()
+    candidate = create_backend(backend, model_name, revision=revision)
+    candidate.load()
+
+    report = compare_logits(
+        reference.predict_logits(inputs),
+        candidate.predict_logits(inputs),
+        atol=atol,
+    )
+    report["backend"] = candidate.name
+    report["samples"] = len(texts)
+    return report
+
+
+async def main() -> None:
+    """Export, quantize and parity-check the configured model."""
+    from packages.shared.logging_config import setup_logging
+
+    setup_logging("inference-backends", log_level="INFO")
+
+    test_sentences = [
+        "Gold prices surge to record highs amid economic uncertainty",
+        "Federal Reserve announces unexpected rate cut",
+        "Market remains stable with minimal volatility",
+        "Gold futures plummet as dollar strengthens",
+        "Investors cautiously optimistic about gold outlook",
+    ]
+
+    model_name = config.FINBERT_MODEL_NAME
+    revision = config.FINBERT_MODEL_REVISION
+    loop = asyncio.get_event_loop()
+
+    onnx_path = await loop.run_in_executor(
+        None, export_onnx, model_name, get_onnx_export_dir(model_name, revision), revision
+    )
+    await loop.run_in_executor(None, quantize_onnx, onnx_path)
+
+    for backend in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+        report = await loop.run_in_executor(None, check_parity, test_sentences, backend)
+        status = "✅" if report["passed"] else "❌"
+        logger.info(
+            f"{status} {backend}: label agreement {report['label_agreement']:.0%}, "
+            f"max |Δlogit| {report['max_abs_diff']:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+AUREX.AI - Dynamic Micro-Batching.
+
+This module coalesces concurrent single-text sentiment requests into padded
+batches so that bursts of headlines share one forward pass.
+"""
+
+import asyncio
+from typing import Any
+
+from loguru import logger
+
+from packages.shared.config import config
+
+
+class MicroBatcher:
+    """Queues single-text requests and flushes them through ``analyze_batch``."""
+
+    def __init__(
+        self,
+        analyzer: Any,
+        max_batch_size: int | None = None,
+        max_wait_ms: float | None = None,
+    ) -> None:
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            analyzer: Object exposing ``async analyze_batch(texts)``
+            max_batch_size: Flush as soon as this many requests are queued
+            max_wait_ms: Flush after this many milliseconds even if the batch is not full
+        """
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size or config.INFERENCE_BATCH_SIZE
+        self.max_wait = (
+            max_wait_ms if max_wait_ms is not None else config.INFERENCE_BATCH_WAIT_MS
+        ) / 1000
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+
+        # Counters for observability
+        self.batches_flushed = 0
+        self.items_processed = 0
+
+    def enqueue(self, text: str) -> asyncio.Future:
+        """
+        Queue a text for the next batch.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            asyncio.Future: Resolves to the sentiment result for this text
+        """
+        if self._worker is None or self._worker.done():
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, future))
+        return future
+
+    async def analyze(self, text: str) -> dict[str, Any]:
+        """
+        Analyze a single text through the shared batch queue.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            dict: Sentiment result
+        """
+        return await self.enqueue(text)
+
+    def start(self) -> None:
+        """Start the background flush loop on the running event loop."""
+        if self._worker is not None and not self._worker.done():
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+        logger.info(
+            f"MicroBatcher started (batch_size={self.max_batch_size}, "
+            f"max_wait={self.max_wait * 1000:.1f}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush loop and fail any requests still queued."""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("MicroBatcher stopped"))
+        logger.info("MicroBatcher stopped")
+
+    async def _collect(self) -> list[tuple[str, asyncio.Future]]:
+        """Wait for the first request, then gather more until full or the deadline passes."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Flush loop: collect a batch, run it, and resolve each caller's future."""
+        while True:
+            batch = await self._collect()
+
+            # Drop requests whose callers have gone away
+            batch = [(text, future) for text, future in batch if not future.cancelled()]
+            if not batch:
+                continue
+
+            texts = [text for text, _ in batch]
+            try:
+                results = await self.analyzer.analyze_batch(texts)
+            except Exception as e:
+                logger.error(f"Micro-batch of {len(texts)} failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+            self.batches_flushed += 1
+            self.items_processed += len(batch)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics."""
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "batches_flushed": self.batches_flushed,
+            "items_processed": self.items_processed,
+            "avg_batch_size": (
+                self.items_processed / self.batches_flushed if self.batches_flushed else 0.0
+            ),
+        }
@@ -0,0 +1,493 @@
+"""
+AUREX.AI - Sentiment Inference Benchmark.
+
+This module measures SentimentAnalyzer throughput and latency across
+single-text vs batched calls, batch sizes, sequence-length mixes, torch
+thread counts and inference backends. It runs offline against a tiny
+random-weight BERT written into the local model cache, reports texts/sec,
+p50/p99 latency and peak RSS as JSON, and fails when a run regresses
+against a saved baseline:
+
+    python -m packages.ai_core.benchmark --baseline benchmarks/sentiment_baseline.json
+
+Baselines are machine-specific and not committed; record one with
+``--save-baseline`` (``make benchmark-baseline``).
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import sys
+import threading
+import time
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.ai_core.backends import BACKEND_TORCH, SUPPORTED_BACKENDS
+from packages.ai_core.model_cache import MANIFEST_FILE, get_model_cache_dir
+
+TINY_MODEL_NAME = "aurex/tiny-random-bert"
+TINY_MODEL_REVISION = "benchmark"
+
+MODE_SINGLE = "single"
+MODE_BATCH = "batch"
+
+# Sequence-length mixes: share of article bodies among headlines
+LENGTH_MIXES = {
+    "headlines": 0.0,
+    "mixed": 0.2,
+    "bodies": 1.0,
+}
+
+# Regression tolerances (relative change vs baseline)
+DEFAULT_TOLERANCE = {"texts_per_sec": 0.15, "p99_ms": 0.25, "peak_rss_mb": 0.20}
+
+_WORDS = (
+    "gold prices rise fall surge plunge fed rate cut hike inflation dollar yields "
+    "treasury bullion ounce futures demand supply central bank buying selling "
+    "investors traders market rally slump record high low safe haven risk "
+    "geopolitical tensions outlook forecast analysts expect weak strong data jobs "
+    "report cpi ppi gdp growth recession fears easing tightening policy steady"
+).split()
+
+
+def make_texts(count: int, mix: str, seed: int = 0) -> list[str]:
+    """
+    Generate a deterministic corpus of headlines and article bodies.
+
+    Args:
+        count: Number of texts
+        mix: One of ``LENGTH_MIXES``
+        seed: Random seed
+
+    Returns:
+        list: Texts (headlines of 6-16 words, bodies of 150-400 words)
+    """
+    rng = np.random.default_rng(seed)
+    body_share = LENGTH_MIXES[mix]
+    texts = []
+    for _ in range(count):
+        is_body = rng.random() < body_share
+        length = rng.integers(150, 400) if is_body else rng.integers(6, 16)
+        texts.append(" ".join(rng.choice(_WORDS, size=length)))
+    return texts
+
+
+def latency_summary(latencies: list[float]) -> dict[str, float]:
+    """
+    Summarize call latencies.
+
+    Args:
+        latencies: Latencies in seconds
+
+    Returns:
+        dict: p50/p99/mean in milliseconds
+    """
+    values = np.asarray(latencies, dtype=np.float64) * 1000
+    return {
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "mean_ms": float(values.mean()),
+    }
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def current_rss_mb() -> float | None:
+    """Current resident set size of this process in MB (None without /proc)."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * resource.getpagesize() / (1024 * 1024)
+
+
+class RssSampler:
+    """
+    Track the peak RSS over a block by sampling on a background thread.
+
+    ``ru_maxrss`` is the peak of the whole process, so every scenario after
+    the heaviest one would report that scenario's peak. Where /proc is not
+    available the sampler falls back to it.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _sample(self) -> None:
+        """Fold the current RSS into the peak."""
+        rss = current_rss_mb()
+        if rss is not None:
+            self.peak_mb = max(self.peak_mb, rss)
+
+    def _run(self) -> None:
+        """Sampling loop."""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "RssSampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        if not self.peak_mb:
+            self.peak_mb = peak_rss_mb()
+
+
+def scenario_name(scenario: dict[str, Any]) -> str:
+    """Stable key identifying a scenario across runs."""
+    return (
+        f"{scenario['backend']}/{scenario['mode']}/bs{scenario['batch_size']}/"
+        f"{scenario['mix']}/t{scenario['threads']}"
+    )
+
+
+def build_scenarios(
+    backends: list[str],
+    batch_sizes: list[int],
+    mixes: list[str],
+    threads: list[int],
+) -> list[dict[str, Any]]:
+    """
+    Build the benchmark matrix.
+
+    Single-text calls are measured once per backend, mix and thread count;
+    thread counts only apply to the torch backend.
+
+    Args:
+        backends: Backends to measure
+        batch_sizes: Batch sizes for batched calls
+        mixes: Sequence-length mixes
+        threads: Torch intra-op thread counts
+
+    Returns:
+        list: Scenario dicts
+    """
+    scenarios = []
+    for backend, mix in product(backends, mixes):
+        for thread_count in threads if backend == BACKEND_TORCH else [0]:
+            base = {"backend": backend, "mix": mix, "threads": thread_count}
+            scenarios.append({**base, "mode": MODE_SINGLE, "batch_size": 1})
+            scenarios.extend(
+                {**base, "mode": MODE_BATCH, "batch_size": size} for size in batch_sizes
+            )
+    return scenarios
+
+
+async def run_scenario(
+    analyzer: Any,
+    scenario: dict[str, Any],
+    texts: list[str],
+    warmup_calls: int = 2,
+) -> dict[str, Any]:
+    """
+    Measure one scenario on a loaded analyzer.
+
+    Args:
+        analyzer: Loaded SentimentAnalyzer (result cache and cascade disabled)
+        scenario: Scenario from ``build_scenarios``
+        texts: Corpus to score
+        warmup_calls: Untimed calls before measuring
+
+    Returns:
+        dict: Scenario plus texts/sec, latency percentiles and the peak RSS
+        sampled while the scenario ran
+    """
+    if scenario["mode"] == MODE_SINGLE:
+        calls = [[text] for text in texts]
+
+        async def score(chunk: list[str]) -> Any:
+            return await analyzer.analyze_text(chunk[0])
+
+    else:
+        size = scenario["batch_size"]
+        analyzer.batch_size = size
+        calls = [texts[i : i + size] for i in range(0, len(texts), size)]
+
+        async def score(chunk: list[str]) -> Any:
+            return await analyzer.analyze_batch(chunk)
+
+    for chunk in calls[:warmup_calls]:
+        await score(chunk)
+
+    latencies = []
+    with RssSampler() as rss:
+        started = time.perf_counter()
+        for chunk in calls:
+            call_started = time.perf_counter()
+            await score(chunk)
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+    return {
+        "name": scenario_name(scenario),
+        **scenario,
+        "texts": len(texts),
+        "texts_per_sec": len(texts) / elapsed if elapsed else 0.0,
+        **latency_summary(latencies),
+        "peak_rss_mb": rss.peak_mb,
+    }
+
+
+def compare_to_baseline(
+    results: list[dict[str, Any]],
+    baseline: list[dict[str, Any]],
+    tolerance: dict[str, float] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Find scenarios that got slower or bigger than the baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results (matched by scenario name)
+        tolerance: Allowed relative change per metric (default: DEFAULT_TOLERANCE)
+
+    Returns:
+        list: One entry per regressed metric (empty if none)
+    """
+    tolerance = tolerance or DEFAULT_TOLERANCE
+    previous = {entry["name"]: entry for entry in baseline}
+    regressions = []
+
+    for result in results:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+        for metric, allowed in tolerance.items():
+            old, new = before[metric], result[metric]
+            if not old:
+                continue
+            # Throughput regresses downwards, latency and memory upwards
+            change = (old - new) / old if metric == "texts_per_sec" else (new - old) / old
+            if change > allowed:
+                regressions.append(
+                    {
+                        "name": result["name"],
+                        "metric": metric,
+                        "baseline": old,
+                        "current": new,
+                        "change": change,
+                        "tolerance": allowed,
+                    }
+                )
+    return regressions
+
+
+def create_tiny_model(output_dir: str | Path | None = None, seed: int = 0) -> Path:
+    """
+    Write a tiny random-weight BERT classifier and word-level tokenizer.
+
+    The model is written in the local model cache layout, so the analyzer
+    loads it through the same path as FinBERT without network access.
+
+    Args:
+        output_dir: Target directory (default: cache dir of TINY_MODEL_NAME)
+        seed: Weight initialization seed
+
+    Returns:
+        Path: Model directory
+    """
+    import torch
+    from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast
+
+    output_dir = Path(output_dir or get_model_cache_dir(TINY_MODEL_NAME, TINY_MODEL_REVISION))
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", *sorted(set(_WORDS))]
+    vocab_file = output_dir / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab) + "\n")
+    # Positional: the vocab argument was renamed between transformers 4 and 5
+    BertTokenizerFast(str(vocab_file)).save_pretrained(output_dir)
+
+    torch.manual_seed(seed)
+    model = BertForSequenceClassification(
+        BertConfig(
+            vocab_size=len(vocab),
+            hidden_size=64,
+            num_hidden_layers=2,
+            num_attention_heads=2,
+            intermediate_size=128,
+            max_position_embeddings=512,
+            num_labels=3,
+        )
+    )
+    model.save_pretrained(output_dir, safe_serialization=True)
+    (output_dir / MANIFEST_FILE).write_text(
+        json.dumps({"model_name": TINY_MODEL_NAME, "revision": TINY_MODEL_REVISION})
+    )
+    return output_dir
+
+
+async def run_benchmark(
+    backends: list[str],
+    batch_sizes: list[int],
+    mixes: list[str],
+    threads: list[int],
+    num_texts: int,
+    model_name: str = TINY_MODEL_NAME,
+    revision: str = TINY_MODEL_REVISION,
+) -> dict[str, Any]:
+    """
+    Run the full benchmark matrix.
+
+    Args:
+        backends: Backends to measure
+        batch_sizes: Batch sizes for batched calls
+        mixes: Sequence-length mixes
+        threads: Torch intra-op thread counts
+        num_texts: Texts per scenario
+        model_name: Model to benchmark (default: the tiny random BERT)
+        revision: Model revision
+
+    Returns:
+        dict: {"meta": {...}, "results": [...]}
+    """
+    import torch
+
+    from packages.ai_core.sentiment import SentimentAnalyzer
+
+    corpora = {mix: make_texts(num_texts, mix) for mix in mixes}
+    analyzers = {}
+    results = []
+
+    for scenario in build_scenarios(backends, batch_sizes, mixes, threads):
+        if scenario["threads"]:
+            torch.set_num_threads(scenario["threads"])
+
+        analyzer = analyzers.get(scenario["backend"])
+        if analyzer is None:
+            analyzer = SentimentAnalyzer(model_name, revision, scenario["backend"])
+            analyzer.result_cache = None
+            analyzer.pre_classifier = None
+            await analyzer.load_model()
+            analyzers[scenario["backend"]] = analyzer
+
+        result = await run_scenario(analyzer, scenario, corpora[scenario["mix"]])
+        results.append(result)
+        logger.info(
+            f"{result['name']:40s} {result['texts_per_sec']:9.1f} texts/s | "
+            f"p50 {result['p50_ms']:7.2f} ms | p99 {result['p99_ms']:7.2f} ms | "
+            f"RSS {result['peak_rss_mb']:6.0f} MB"
+        )
+
+    for analyzer in analyzers.values():
+        analyzer.inference_worker.shutdown()
+
+    return {
+        "meta": {
+            "model": f"{model_name}@{revision}",
+            "texts_per_scenario": num_texts,
+            "python": platform.python_version(),
+            "torch": torch.__version__,
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    """Run the benchmark, write a JSON report and compare against a baseline."""
+    from packages.shared.logging_config import setup_logging
+
+    setup_logging("sentiment-benchmark", log_level="INFO")
+
+    parser = argparse.ArgumentParser(description="Benchmark sentiment inference")
+    parser.add_argument(
+        "--backends", nargs="+", default=[BACKEND_TORCH], choices=SUPPORTED_BACKENDS
+    )
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=[8, 32, 64])
+    parser.add_argument("--mixes", nargs="+", default=list(LENGTH_MIXES), choices=LENGTH_MIXES)
+    parser.add_argument("--threads", nargs="+", type=int, default=[1, 4])
+    parser.add_argument("--texts", type=int, default=256, help="Texts per scenario")
+    parser.add_argument("--model", help="Benchmark a real model instead of the tiny random BERT")
+    parser.add_argument("--revision", default="main", help="Revision of --model")
+    parser.add_argument("--output", help="Write the JSON report here (default: stdout)")
+    parser.add_argument("--baseline", help="Baseline report to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run to --baseline")
+    args = parser.parse_args()
+
+    # Fail before the (slow) run if there is nothing to compare against
+    if args.baseline and not args.save_baseline and not Path(args.baseline).is_file():
+        logger.error(
+            f"❌ Baseline {args.baseline} not found. Record one on this machine first with "
+            f"--save-baseline (make benchmark-baseline)."
+        )
+        sys.exit(2)
+
+    if args.model:
+        model_name, revision = args.model, args.revision
+    else:
+        create_tiny_model()
+        model_name, revision = TINY_MODEL_NAME, TINY_MODEL_REVISION
+
+    report = asyncio.run(
+        run_benchmark(
+            args.backends,
+            args.batch_sizes,
+            args.mixes,
+            args.threads,
+            args.texts,
+            model_name,
+            revision,
+        )
+    )
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+        logger.info(f"✅ Wrote benchmark report to {args.output}")
+    else:
+        print(output)
+
+    if not args.baseline:
+        return
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(output)
+        logger.info(f"✅ Saved baseline to {baseline_path}")
+        return
+
+    baseline = json.loads(baseline_path.read_text())["results"]
+    regressions = compare_to_baseline(report["results"], baseline)
+    for regression in regressions:
+        logger.error(
+            f"❌ REGRESSION {regression['name']} {regression['metric']}: "
+            f"{regression['baseline']:.2f} → {regression['current']:.2f} "
+            f"({regression['change']:+.0%}, tolerance {regression['tolerance']:.0%})"
+        )
+    if regressions:
+        sys.exit(1)
+    logger.info(f"✅ No regressions against {baseline_path}")
+
+
+if __name__ == "__main__":
+    main()
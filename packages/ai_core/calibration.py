@@ -0,0 +1,430 @@
+"""
+AUREX.AI - Sentiment Probability Calibration.
+
+FinBERT's softmax is over-confident on gold news, so its top probability is
+not a usable confidence. This module fits a temperature or per-class
+isotonic calibration map offline against a labeled set, stores it next to
+the model snapshot, and applies it to whole probability matrices after each
+forward pass.
+
+Usage:
+    python -m packages.ai_core.calibration fit --input labeled.csv --method isotonic
+    python -m packages.ai_core.calibration evaluate --input labeled.csv
+"""
+
+import argparse
+import asyncio
+import csv
+import hashlib
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.ai_core.backends import softmax
+from packages.ai_core.cascade import LABELS
+from packages.ai_core.model_cache import get_model_cache_dir
+from packages.shared.config import config
+
+METHOD_TEMPERATURE = "temperature"
+METHOD_ISOTONIC = "isotonic"
+METHODS = (METHOD_TEMPERATURE, METHOD_ISOTONIC)
+
+CALIBRATION_FILE = "calibration.npz"
+
+# Search range for log(temperature) and probability floor before taking logs
+_LOG_TEMPERATURE_RANGE = (-3.0, 3.0)
+_EPS = 1e-7
+
+
+def negative_log_likelihood(probabilities: np.ndarray, labels: np.ndarray) -> float:
+    """
+    Mean negative log-likelihood of the true labels.
+
+    Args:
+        probabilities: Probabilities of shape (N, num_labels)
+        labels: True label indices of shape (N,)
+
+    Returns:
+        float: Mean NLL
+    """
+    picked = probabilities[np.arange(len(labels)), labels]
+    return float(-np.log(np.clip(picked, _EPS, 1.0)).mean())
+
+
+def expected_calibration_error(
+    probabilities: np.ndarray,
+    labels: np.ndarray,
+    num_bins: int = 15,
+) -> float:
+    """
+    Expected calibration error of the top-label confidence.
+
+    Args:
+        probabilities: Probabilities of shape (N, num_labels)
+        labels: True label indices of shape (N,)
+        num_bins: Equal-width confidence bins
+
+    Returns:
+        float: Sample-weighted mean |accuracy - confidence| over the bins
+    """
+    confidence = probabilities.max(axis=1)
+    correct = probabilities.argmax(axis=1) == labels
+    bins = np.minimum((confidence * num_bins).astype(np.int64), num_bins - 1)
+
+    counts = np.bincount(bins, minlength=num_bins)
+    gaps = np.abs(
+        np.bincount(bins, weights=correct, minlength=num_bins)
+        - np.bincount(bins, weights=confidence, minlength=num_bins)
+    )
+    return float(gaps.sum() / max(counts.sum(), 1))
+
+
+def scale_temperature(probabilities: np.ndarray, temperature: float) -> np.ndarray:
+    """
+    Rescale probabilities as if their logits were divided by a temperature.
+
+    ``log(p)`` equals the logits up to a per-row constant, which softmax
+    ignores, so this needs no access to the raw logits.
+
+    Args:
+        probabilities: Probabilities of shape (N, num_labels)
+        temperature: Temperature (> 1 softens, < 1 sharpens)
+
+    Returns:
+        np.ndarray: float32 probabilities of the same shape
+    """
+    logits = np.log(np.clip(probabilities, _EPS, 1.0)) / temperature
+    return softmax(logits).astype(np.float32)
+
+
+def fit_temperature(probabilities: np.ndarray, labels: np.ndarray, iterations: int = 60) -> float:
+    """
+    Find the temperature minimizing NLL with a golden-section search.
+
+    The NLL of temperature-scaled softmax is unimodal in log(temperature).
+
+    Args:
+        probabilities: Uncalibrated probabilities of shape (N, num_labels)
+        labels: True label indices of shape (N,)
+        iterations: Search iterations
+
+    Returns:
+        float: Fitted temperature
+    """
+    ratio = (np.sqrt(5.0) - 1.0) / 2.0
+    low, high = _LOG_TEMPERATURE_RANGE
+
+    def loss(log_t: float) -> float:
+        return negative_log_likelihood(scale_temperature(probabilities, np.exp(log_t)), labels)
+
+    a, b = high - ratio * (high - low), low + ratio * (high - low)
+    loss_a, loss_b = loss(a), loss(b)
+    for _ in range(iterations):
+        if loss_a <= loss_b:
+            high, b, loss_b = b, a, loss_a
+            a = high - ratio * (high - low)
+            loss_a = loss(a)
+        else:
+            low, a, loss_a = a, b, loss_b
+            b = low + ratio * (high - low)
+            loss_b = loss(b)
+    return float(np.exp((low + high) / 2.0))
+
+
+def isotonic_regression(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fit a non-decreasing step function with pool-adjacent-violators.
+
+    Args:
+        x: Inputs of shape (N,)
+        y: Targets of shape (N,)
+
+    Returns:
+        tuple: (knot x, knot y) for ``np.interp``, x strictly increasing
+    """
+    unique_x, inverse = np.unique(x, return_inverse=True)
+    weights = np.bincount(inverse).astype(np.float64)
+    means = np.bincount(inverse, weights=y) / weights
+
+    # Blocks as (mean, weight, number of unique x values)
+    values: list[float] = []
+    block_weights: list[float] = []
+    sizes: list[int] = []
+    for mean, weight in zip(means, weights):
+        values.append(mean)
+        block_weights.append(weight)
+        sizes.append(1)
+        while len(values) > 1 and values[-2] >= values[-1]:
+            weight = block_weights[-2] + block_weights[-1]
+            values[-2] = (values[-2] * block_weights[-2] + values[-1] * block_weights[-1]) / weight
+            block_weights[-2] = weight
+            sizes[-2] += sizes[-1]
+            del values[-1], block_weights[-1], sizes[-1]
+
+    fitted = np.repeat(values, sizes)
+    # Block endpoints are enough for linear interpolation between blocks
+    ends = np.cumsum(sizes) - 1
+    keep = np.unique(np.concatenate([ends - np.array(sizes) + 1, ends]))
+    return unique_x[keep], fitted[keep]
+
+
+class Calibrator:
+    """Fitted probability calibration map."""
+
+    def __init__(
+        self,
+        method: str,
+        temperature: float = 1.0,
+        knots: list[tuple[np.ndarray, np.ndarray]] | None = None,
+        metrics: dict[str, float] | None = None,
+    ) -> None:
+        """
+        Initialize the calibrator.
+
+        Args:
+            method: "temperature" or "isotonic"
+            temperature: Temperature (temperature method)
+            knots: Per-label (x, y) interpolation knots (isotonic method)
+            metrics: Fit-time metrics (samples, NLL and ECE before and after)
+        """
+        if method not in METHODS:
+            raise ValueError(f"Unknown calibration method '{method}'. Supported: {METHODS}")
+        if method == METHOD_ISOTONIC and not knots:
+            raise ValueError("Isotonic calibration needs per-label knots")
+        self.method = method
+        self.temperature = float(temperature)
+        self.knots = knots or []
+        self.metrics = metrics or {}
+
+    @classmethod
+    def fit(
+        cls,
+        probabilities: np.ndarray,
+        labels: np.ndarray,
+        method: str = METHOD_TEMPERATURE,
+    ) -> "Calibrator":
+        """
+        Fit a calibration map against true labels.
+
+        Args:
+            probabilities: Uncalibrated probabilities of shape (N, num_labels)
+            labels: True label indices of shape (N,)
+            method: "temperature" or "isotonic"
+
+        Returns:
+            Calibrator: Fitted calibrator with before/after metrics
+        """
+        probabilities = np.asarray(probabilities, dtype=np.float32)
+        labels = np.asarray(labels, dtype=np.int64)
+
+        if method == METHOD_TEMPERATURE:
+            calibrator = cls(method, temperature=fit_temperature(probabilities, labels))
+        else:
+            knots = [
+                isotonic_regression(probabilities[:, c], (labels == c).astype(np.float64))
+                for c in range(probabilities.shape[1])
+            ]
+            calibrator = cls(method, knots=knots)
+
+        calibrated = calibrator.apply(probabilities)
+        calibrator.metrics = {
+            "samples": int(len(labels)),
+            "nll_before": negative_log_likelihood(probabilities, labels),
+            "nll_after": negative_log_likelihood(calibrated, labels),
+            "ece_before": expected_calibration_error(probabilities, labels),
+            "ece_after": expected_calibration_error(calibrated, labels),
+        }
+        return calibrator
+
+    def apply(self, probabilities: np.ndarray) -> np.ndarray:
+        """
+        Calibrate a probability matrix.
+
+        Args:
+            probabilities: Probabilities of shape (N, num_labels)
+
+        Returns:
+            np.ndarray: float32 calibrated probabilities (rows sum to 1)
+        """
+        if self.method == METHOD_TEMPERATURE:
+            return scale_temperature(probabilities, self.temperature)
+
+        calibrated = np.empty(probabilities.shape, dtype=np.float32)
+        for c, (x, y) in enumerate(self.knots):
+            calibrated[:, c] = np.interp(probabilities[:, c], x, y)
+        totals = calibrated.sum(axis=1, keepdims=True)
+        # Rows every per-label map sends to 0 keep their original probabilities
+        return np.where(totals > 0, calibrated / np.maximum(totals, _EPS), probabilities).astype(
+            np.float32
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Short hash of the fitted parameters (changes whenever outputs would)."""
+        digest = hashlib.sha256(self.method.encode())
+        digest.update(np.float64(self.temperature).tobytes())
+        for x, y in self.knots:
+            digest.update(np.asarray(x, dtype=np.float64).tobytes())
+            digest.update(np.asarray(y, dtype=np.float64).tobytes())
+        return digest.hexdigest()[:12]
+
+    def save(self, path: str | Path) -> None:
+        """
+        Persist the calibrator.
+
+        Args:
+            path: Destination ``.npz`` path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {f"knots_x_{c}": x for c, (x, _) in enumerate(self.knots)}
+        arrays.update({f"knots_y_{c}": y for c, (_, y) in enumerate(self.knots)})
+        np.savez(
+            path,
+            method=np.array(self.method),
+            temperature=np.array(self.temperature),
+            num_knots=np.array(len(self.knots)),
+            metric_names=np.array(list(self.metrics), dtype=str),
+            metric_values=np.array(list(self.metrics.values()), dtype=np.float64),
+            **arrays,
+        )
+        logger.info(f"Saved {self.method} calibration to {path}")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Calibrator":
+        """
+        Load a persisted calibrator.
+
+        Args:
+            path: Source ``.npz`` path
+
+        Returns:
+            Calibrator: Loaded calibrator
+        """
+        data = np.load(path)
+        knots = [
+            (data[f"knots_x_{c}"], data[f"knots_y_{c}"]) for c in range(int(data["num_knots"]))
+        ]
+        metrics = dict(zip(data["metric_names"].tolist(), data["metric_values"].tolist()))
+        return cls(
+            str(data["method"]),
+            temperature=float(data["temperature"]),
+            knots=knots,
+            metrics=metrics,
+        )
+
+    def get_info(self) -> dict[str, Any]:
+        """Get method, parameters and fit-time metrics."""
+        return {
+            "method": self.method,
+            "temperature": self.temperature if self.method == METHOD_TEMPERATURE else None,
+            "fingerprint": self.fingerprint,
+            "metrics": dict(self.metrics),
+        }
+
+
+def get_calibration_path(model_name: str, revision: str = "main") -> Path:
+    """
+    Get where a model revision's calibration map is stored.
+
+    Args:
+        model_name: Hugging Face model name
+        revision: Model revision
+
+    Returns:
+        Path: ``calibration.npz`` in the model's cache directory
+    """
+    return get_model_cache_dir(model_name, revision) / CALIBRATION_FILE
+
+
+def load_calibrator(model_name: str, revision: str = "main") -> Calibrator | None:
+    """
+    Load the calibration map stored next to a model revision.
+
+    Args:
+        model_name: Hugging Face model name
+        revision: Model revision
+
+    Returns:
+        Calibrator | None: Calibrator, or None if none has been fitted
+    """
+    path = get_calibration_path(model_name, revision)
+    if not path.exists():
+        return None
+
+    try:
+        calibrator = Calibrator.load(path)
+    except Exception as e:
+        logger.error(f"Error loading calibration {path}, using raw probabilities: {e}")
+        return None
+
+    logger.info(f"Loaded {calibrator.method} calibration from {path}")
+    return calibrator
+
+
+def _load_labeled(input_path: str) -> tuple[list[str], np.ndarray]:
+    """Load a labeled CSV with "text" and "label" columns."""
+    with open(input_path, newline="", encoding="utf-8") as f:
+        rows = [row for row in csv.DictReader(f) if row.get("text") and row.get("label")]
+    labels = np.array([LABELS.index(row["label"].strip().lower()) for row in rows], dtype=np.int64)
+    return [row["text"] for row in rows], labels
+
+
+async def _raw_probabilities(texts: list[str]) -> np.ndarray:
+    """Score texts with the configured model, without calibration."""
+    from packages.ai_core.sentiment import SentimentAnalyzer
+
+    analyzer = SentimentAnalyzer()
+    analyzer.calibrator = None
+    batch = await analyzer.analyze_batch_array(texts)
+    return batch.probabilities
+
+
+async def main() -> None:
+    """Fit or evaluate the calibration map of the configured model."""
+    from packages.shared.logging_config import setup_logging
+
+    setup_logging("sentiment-calibration", log_level="INFO")
+
+    parser = argparse.ArgumentParser(description="Fit or evaluate sentiment calibration")
+    parser.add_argument("command", choices=["fit", "evaluate"])
+    parser.add_argument("--input", required=True, help="CSV with text,label columns")
+    parser.add_argument("--method", choices=METHODS, default=METHOD_TEMPERATURE)
+    parser.add_argument("--model", default=config.FINBERT_MODEL_NAME)
+    parser.add_argument("--revision", default=config.FINBERT_MODEL_REVISION)
+    args = parser.parse_args()
+
+    texts, labels = _load_labeled(args.input)
+    if not len(texts):
+        logger.warning("No labeled texts to process")
+        return
+
+    logger.info(f"Scoring {len(texts)} labeled texts...")
+    probabilities = await _raw_probabilities(texts)
+
+    if args.command == "fit":
+        calibrator = Calibrator.fit(probabilities, labels, method=args.method)
+        calibrator.save(get_calibration_path(args.model, args.revision))
+        metrics = calibrator.metrics
+    else:
+        calibrator = load_calibrator(args.model, args.revision)
+        calibrated = calibrator.apply(probabilities) if calibrator else probabilities
+        metrics = {
+            "samples": len(labels),
+            "nll_before": negative_log_likelihood(probabilities, labels),
+            "nll_after": negative_log_likelihood(calibrated, labels),
+            "ece_before": expected_calibration_error(probabilities, labels),
+            "ece_after": expected_calibration_error(calibrated, labels),
+        }
+
+    logger.info("=" * 60)
+    logger.info(f"Calibration ({calibrator.method if calibrator else 'none'}, {len(texts)} texts)")
+    logger.info("=" * 60)
+    logger.info(f"NLL {metrics['nll_before']:.4f} → {metrics['nll_after']:.4f}")
+    logger.info(f"ECE {metrics['ece_before']:.4f} → {metrics['ece_after']:.4f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
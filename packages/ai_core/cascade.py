@@ -0,0 +1,356 @@
+"""
+AUREX.AI - Sentiment Pre-Classifier Cascade.
+
+This module provides a cheap first-stage classifier (a linear model over
+hashed word n-grams) that labels unambiguous headlines on its own, so only
+low-confidence texts are escalated to FinBERT.
+
+Usage:
+    python -m packages.ai_core.cascade evaluate --hours 168
+    python -m packages.ai_core.cascade fit --hours 720 --output models/cascade.npz
+"""
+
+import argparse
+import asyncio
+import re
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.ai_core.backends import softmax
+from packages.shared.config import config
+
+STAGE_LEXICON = "lexicon"
+STAGE_MODEL = "finbert"
+
+LABELS = ["negative", "neutral", "positive"]
+NUM_FEATURES = 2**18
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Gold-market polarity cues. Bigrams get more weight so that phrases such as
+# "dollar slips" (bullish for gold) override their individual words.
+# fmt: off
+POSITIVE_TERMS = [
+    "surge", "surges", "soar", "soars", "rally", "rallies", "rise", "rises", "gain", "gains",
+    "climb", "climbs", "jump", "jumps", "rebound", "rebounds", "record", "bullish", "higher",
+    "boost", "boosts", "strong", "optimistic", "upbeat", "advance", "advances",
+]
+NEGATIVE_TERMS = [
+    "fall", "falls", "drop", "drops", "plunge", "plunges", "slump", "slumps", "tumble",
+    "tumbles", "slide", "slides", "sink", "sinks", "decline", "declines", "lower", "bearish",
+    "loss", "losses", "weak", "weaker", "slip", "slips", "retreat", "retreats", "selloff",
+]
+POSITIVE_BIGRAMS = [
+    "dollar slips", "dollar falls", "dollar weakens", "dollar drops", "rate cut", "rate cuts",
+    "safe haven", "record high", "all time", "yields fall", "inflation fears",
+]
+NEGATIVE_BIGRAMS = [
+    "dollar rises", "dollar gains", "dollar strengthens", "dollar jumps", "rate hike",
+    "rate hikes", "yields rise", "yields climb", "profit taking", "risk appetite",
+]
+# fmt: on
+
+UNIGRAM_WEIGHT = 2.0
+BIGRAM_WEIGHT = 3.0
+NEUTRAL_BIAS = 0.5
+
+
+def extract_ngrams(text: str) -> list[str]:
+    """
+    Extract lowercase word unigrams and bigrams.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        list: Unigrams followed by bigrams
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def hash_ngram(ngram: str, num_features: int = NUM_FEATURES) -> int:
+    """Map an n-gram to a stable feature index (CRC32, not the salted built-in hash)."""
+    return zlib.crc32(ngram.encode("utf-8")) % num_features
+
+
+class HashedNgramClassifier:
+    """Multinomial linear classifier over hashed word n-grams."""
+
+    def __init__(self, weights: np.ndarray, bias: np.ndarray) -> None:
+        """
+        Initialize the classifier.
+
+        Args:
+            weights: Feature weights of shape (num_features, num_labels)
+            bias: Label bias of shape (num_labels,)
+        """
+        self.weights = weights.astype(np.float32)
+        self.bias = bias.astype(np.float32)
+        self.num_features = weights.shape[0]
+
+    @classmethod
+    def from_lexicon(cls) -> "HashedNgramClassifier":
+        """Build a classifier from the built-in gold-market lexicon."""
+        weights = np.zeros((NUM_FEATURES, len(LABELS)), dtype=np.float32)
+        for terms, label, weight in (
+            (POSITIVE_TERMS, "positive", UNIGRAM_WEIGHT),
+            (NEGATIVE_TERMS, "negative", UNIGRAM_WEIGHT),
+            (POSITIVE_BIGRAMS, "positive", BIGRAM_WEIGHT),
+            (NEGATIVE_BIGRAMS, "negative", BIGRAM_WEIGHT),
+        ):
+            for term in terms:
+                weights[hash_ngram(term), LABELS.index(label)] += weight
+
+        bias = np.zeros(len(LABELS), dtype=np.float32)
+        bias[LABELS.index("neutral")] = NEUTRAL_BIAS
+        return cls(weights, bias)
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HashedNgramClassifier":
+        """
+        Load a fitted classifier.
+
+        Args:
+            path: Path of an ``.npz`` file written by ``save``
+
+        Returns:
+            HashedNgramClassifier: Loaded classifier
+        """
+        data = np.load(path)
+        return cls(data["weights"], data["bias"])
+
+    def save(self, path: str | Path) -> None:
+        """
+        Save the classifier.
+
+        Args:
+            path: Destination ``.npz`` path
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, weights=self.weights, bias=self.bias)
+        logger.info(f"Pre-classifier saved: {path}")
+
+    def _features(self, texts: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Hash all texts into flat (row, feature) index arrays."""
+        rows, features = [], []
+        for row, text in enumerate(texts):
+            ids = [hash_ngram(ngram, self.num_features) for ngram in extract_ngrams(text)]
+            rows.extend([row] * len(ids))
+            features.extend(ids)
+        return np.asarray(rows, dtype=np.int64), np.asarray(features, dtype=np.int64)
+
+    def _logits(self, rows: np.ndarray, features: np.ndarray, count: int) -> np.ndarray:
+        """Sum feature weights per row."""
+        logits = np.tile(self.bias, (count, 1))
+        np.add.at(logits, rows, self.weights[features])
+        return logits
+
+    def predict_proba(self, texts: list[str]) -> np.ndarray:
+        """
+        Predict label probabilities.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            np.ndarray: Probabilities of shape (len(texts), num_labels)
+        """
+        if not texts:
+            return np.empty((0, len(LABELS)), dtype=np.float32)
+        rows, features = self._features(texts)
+        return softmax(self._logits(rows, features, len(texts)))
+
+    def fit(
+        self,
+        texts: list[str],
+        labels: list[str],
+        epochs: int = 200,
+        learning_rate: float = 0.5,
+        l2: float = 1e-4,
+    ) -> "HashedNgramClassifier":
+        """
+        Fit the weights by full-batch gradient descent (e.g. on FinBERT labels).
+
+        Args:
+            texts: Training texts
+            labels: Target labels
+            epochs: Gradient steps
+            learning_rate: Step size
+            l2: L2 regularization strength
+
+        Returns:
+            HashedNgramClassifier: self
+        """
+        rows, features = self._features(texts)
+        targets = np.eye(len(LABELS), dtype=np.float32)[[LABELS.index(label) for label in labels]]
+        count = len(texts)
+
+        for _ in range(epochs):
+            error = (softmax(self._logits(rows, features, count)) - targets) / count
+            grad = np.zeros_like(self.weights)
+            np.add.at(grad, features, error[rows])
+            self.weights -= learning_rate * (grad + l2 * self.weights)
+            self.bias -= learning_rate * error.sum(axis=0)
+
+        return self
+
+    def classify(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Classify texts into sentiment results tagged with the lexicon stage.
+
+        Args:
+            texts: Texts to classify
+
+        Returns:
+            list: Sentiment results in input order
+        """
+        results = []
+        for probs in self.predict_proba(texts):
+            predicted_class = int(probs.argmax())
+            results.append(
+                {
+                    "label": LABELS[predicted_class],
+                    "score": float(probs[predicted_class]),
+                    "probabilities": {label: float(p) for label, p in zip(LABELS, probs)},
+                    "stage": STAGE_LEXICON,
+                }
+            )
+        return results
+
+
+def load_pre_classifier() -> HashedNgramClassifier:
+    """
+    Load the configured pre-classifier.
+
+    Returns:
+        HashedNgramClassifier: Fitted model from CASCADE_MODEL_PATH, or the built-in lexicon
+    """
+    path = config.CASCADE_MODEL_PATH
+    if path and Path(path).exists():
+        logger.info(f"Loading pre-classifier from {path}")
+        return HashedNgramClassifier.load(path)
+    return HashedNgramClassifier.from_lexicon()
+
+
+def evaluate_cascade(
+    first_stage: list[dict[str, Any]],
+    model_labels: list[str],
+    thresholds: list[float],
+) -> list[dict[str, Any]]:
+    """
+    Compare first-stage results with FinBERT labels at several thresholds.
+
+    Args:
+        first_stage: Pre-classifier results
+        model_labels: FinBERT labels for the same texts
+        thresholds: Confidence thresholds to report
+
+    Returns:
+        list: One report per threshold with calls saved and agreement
+    """
+    scores = np.array([result["score"] for result in first_stage])
+    agrees = np.array(
+        [result["label"] == label for result, label in zip(first_stage, model_labels)]
+    )
+
+    reports = []
+    for threshold in thresholds:
+        accepted = scores >= threshold
+        reports.append(
+            {
+                "threshold": threshold,
+                "calls_saved": float(accepted.mean()) if len(scores) else 0.0,
+                "accepted_agreement": float(agrees[accepted].mean()) if accepted.any() else 1.0,
+                # Escalated texts get the FinBERT label, so they always agree
+                "overall_agreement": float((agrees | ~accepted).mean()) if len(scores) else 1.0,
+            }
+        )
+    return reports
+
+
+async def _load_texts(input_path: str | None, hours: int) -> list[str]:
+    """Load evaluation texts from a file (one per line) or recent news rows."""
+    if input_path:
+        lines = Path(input_path).read_text(encoding="utf-8").splitlines()
+        return [line.strip() for line in lines if line.strip()]
+
+    from sqlalchemy import select
+
+    from packages.db_core.connection import db_manager
+    from packages.db_core.models import News
+
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours)
+    async with db_manager.get_session() as session:
+        result = await session.execute(
+            select(News.title, News.content).where(News.timestamp >= cutoff_time)
+        )
+        rows = result.all()
+    await db_manager.close()
+    return [f"{row.title}. {row.content or ''}" for row in rows]
+
+
+async def _model_labels(texts: list[str]) -> list[str]:
+    """Label texts with FinBERT alone (no cascade, no result cache)."""
+    from packages.ai_core.sentiment import SentimentAnalyzer
+
+    analyzer = SentimentAnalyzer()
+    analyzer.pre_classifier = None
+    analyzer.result_cache = None
+    results = await analyzer.analyze_batch(texts)
+    return [result["label"] for result in results]
+
+
+async def main() -> None:
+    """Offline evaluation and fitting of the pre-classifier."""
+    from packages.shared.logging_config import setup_logging
+
+    setup_logging("sentiment-cascade", log_level="INFO")
+
+    parser = argparse.ArgumentParser(description="Evaluate or fit the sentiment pre-classifier")
+    parser.add_argument("command", choices=["evaluate", "fit"])
+    parser.add_argument("--input", help="Text file with one text per line (default: news table)")
+    parser.add_argument("--hours", type=int, default=168, help="Hours of news to load from the DB")
+    parser.add_argument(
+        "--output", default=config.CASCADE_MODEL_PATH, help="Where fit saves weights"
+    )
+    args = parser.parse_args()
+
+    texts = await _load_texts(args.input, args.hours)
+    if not texts:
+        logger.warning("No texts to process")
+        return
+
+    logger.info(f"Labeling {len(texts)} texts with FinBERT...")
+    model_labels = await _model_labels(texts)
+
+    if args.command == "fit":
+        classifier = HashedNgramClassifier.from_lexicon().fit(texts, model_labels)
+        classifier.save(args.output)
+    else:
+        classifier = load_pre_classifier()
+
+    reports = evaluate_cascade(
+        classifier.classify(texts),
+        model_labels,
+        thresholds=[0.6, 0.7, 0.8, 0.9, 0.95, config.CASCADE_CONFIDENCE_THRESHOLD],
+    )
+
+    logger.info("=" * 60)
+    logger.info(f"Cascade evaluation ({len(texts)} texts)")
+    logger.info("=" * 60)
+    for report in sorted(reports, key=lambda r: r["threshold"]):
+        logger.info(
+            f"threshold {report['threshold']:.2f} | calls saved {report['calls_saved']:6.1%} | "
+            f"agreement (accepted) {report['accepted_agreement']:6.1%} | "
+            f"agreement (overall) {report['overall_agreement']:6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,327 @@
+"""
+AUREX.AI - Near-Duplicate News Detection.
+
+This module provides a MinHash/LSH index over normalized headlines and
+summaries. Syndicated wire stories republished under different sources (with
+slightly different titles) map to the first-seen canonical article, so they
+can be linked in storage and reuse its sentiment label instead of re-running
+inference.
+"""
+
+import re
+import time
+import zlib
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+from loguru import logger
+
+from packages.shared.config import config
+
+# Universal hashing modulo a Mersenne prime; a * x stays below 2**62 in uint64
+_PRIME = np.uint64((1 << 31) - 1)
+_MAX_HASH = np.uint32((1 << 32) - 1)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# Trailing " - Reuters" / " | Kitco News" style source attributions
+_SOURCE_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,40}$")
+
+SHINGLE_SIZE = 5
+
+
+def normalize_article(title: str, summary: str | None = None) -> str:
+    """
+    Normalize a headline and summary for near-duplicate comparison.
+
+    Args:
+        title: Article title
+        summary: Article summary or content
+
+    Returns:
+        str: Lowercase alphanumeric tokens joined by single spaces
+    """
+    title = _SOURCE_SUFFIX_RE.sub("", title or "")
+    return " ".join(_TOKEN_RE.findall(f"{title} {summary or ''}".lower()))
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> np.ndarray:
+    """
+    Hash the character shingles of a normalized text.
+
+    Args:
+        text: Normalized text
+        size: Shingle length in characters
+
+    Returns:
+        np.ndarray: Unique CRC32 shingle hashes (uint64)
+    """
+    if len(text) <= size:
+        shingles = {text}
+    else:
+        shingles = {text[i : i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles)
+    )
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures with seeded universal hash functions."""
+
+    def __init__(self, num_perm: int = 128, seed: int = 1) -> None:
+        """
+        Initialize the hash family.
+
+        Args:
+            num_perm: Signature length
+            seed: Seed for the hash coefficients (must match across runs)
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self._a = rng.integers(1, int(_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, int(_PRIME), size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a normalized text.
+
+        Args:
+            text: Normalized text
+
+        Returns:
+            np.ndarray: Signature of shape (num_perm,), dtype uint32
+        """
+        if not text:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+        hashes = shingle_hashes(text) % _PRIME
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+class NearDuplicateIndex:
+    """LSH index of MinHash signatures mapping articles to their canonical copy."""
+
+    def __init__(
+        self,
+        num_perm: int | None = None,
+        bands: int | None = None,
+        threshold: float | None = None,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            num_perm: Signature length (default: DEDUP_NUM_PERM)
+            bands: LSH bands; num_perm must be divisible by it (default: DEDUP_BANDS)
+            threshold: Minimum estimated Jaccard similarity for a duplicate
+        """
+        self.num_perm = num_perm or config.DEDUP_NUM_PERM
+        self.bands = bands or config.DEDUP_BANDS
+        self.threshold = threshold if threshold is not None else config.DEDUP_THRESHOLD
+        if self.num_perm % self.bands:
+            raise ValueError(
+                f"num_perm ({self.num_perm}) must be divisible by bands ({self.bands})"
+            )
+        self.rows = self.num_perm // self.bands
+
+        self.hasher = MinHasher(self.num_perm)
+        self._signatures: dict[str, np.ndarray] = {}
+        self._timestamps: dict[str, float] = {}
+        self._buckets: list[dict[bytes, list[str]]] = [{} for _ in range(self.bands)]
+
+    def __len__(self) -> int:
+        """Number of indexed canonical articles."""
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray) -> list[bytes]:
+        """Split a signature into per-band bucket keys."""
+        return [signature[i * self.rows : (i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def _insert(self, article_id: str, signature: np.ndarray, timestamp: float) -> None:
+        """Insert a precomputed signature."""
+        self._signatures[article_id] = signature
+        self._timestamps[article_id] = timestamp
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(key, []).append(article_id)
+
+    def query(self, text: str) -> tuple[str | None, float]:
+        """
+        Find the most similar indexed article.
+
+        Args:
+            text: Normalized text (see ``normalize_article``)
+
+        Returns:
+            tuple: (canonical article id or None, estimated Jaccard similarity)
+        """
+        signature = self.hasher.signature(text)
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_id, best_similarity = None, 0.0
+        for candidate in candidates:
+            similarity = float(np.mean(self._signatures[candidate] == signature))
+            if similarity > best_similarity:
+                best_id, best_similarity = candidate, similarity
+
+        if best_similarity >= self.threshold:
+            return best_id, best_similarity
+        return None, best_similarity
+
+    def add(self, article_id: str, text: str, timestamp: datetime | None = None) -> None:
+        """
+        Index an article as canonical.
+
+        Args:
+            article_id: Article id
+            text: Normalized text (see ``normalize_article``)
+            timestamp: Publication time, used for pruning (default: now)
+        """
+        ts = timestamp.timestamp() if timestamp else time.time()
+        self._insert(article_id, self.hasher.signature(text), ts)
+
+    def find_or_add(
+        self, article_id: str, text: str, timestamp: datetime | None = None
+    ) -> str | None:
+        """
+        Return the canonical id of a near-duplicate, or index the article as new.
+
+        Args:
+            article_id: Id of the incoming article
+            text: Normalized text (see ``normalize_article``)
+            timestamp: Publication time
+
+        Returns:
+            str | None: Canonical article id if this is a near-duplicate, else None
+        """
+        canonical_id, _ = self.query(text)
+        if canonical_id is None:
+            self.add(article_id, text, timestamp)
+        return canonical_id
+
+    def prune(self, max_age_hours: int | None = None) -> int:
+        """
+        Drop articles older than the dedup window.
+
+        Args:
+            max_age_hours: Window size (default: DEDUP_WINDOW_HOURS)
+
+        Returns:
+            int: Number of articles removed
+        """
+        cutoff = time.time() - (max_age_hours or config.DEDUP_WINDOW_HOURS) * 3600
+        return self.remove(aid for aid, ts in self._timestamps.items() if ts < cutoff)
+
+    def remove(self, article_ids) -> int:
+        """
+        Drop articles from the index (e.g. ones that were never stored).
+
+        Args:
+            article_ids: Ids to remove (unknown ids are ignored)
+
+        Returns:
+            int: Number of articles removed
+        """
+        removed = {aid for aid in article_ids if aid in self._signatures}
+        if not removed:
+            return 0
+
+        for article_id in removed:
+            del self._signatures[article_id]
+            del self._timestamps[article_id]
+        for buckets in self._buckets:
+            for key in list(buckets):
+                kept = [aid for aid in buckets[key] if aid not in removed]
+                if kept:
+                    buckets[key] = kept
+                else:
+                    del buckets[key]
+        return len(removed)
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Persist the index (pruned to the dedup window).
+
+        Args:
+            path: Destination ``.npz`` path (default: DEDUP_INDEX_PATH)
+        """
+        path = Path(path or config.DEDUP_INDEX_PATH)
+        self.prune()
+        ids = list(self._signatures)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            ids=np.array(ids, dtype=str),
+            signatures=(
+                np.stack([self._signatures[aid] for aid in ids])
+                if ids
+                else np.empty((0, self.num_perm), dtype=np.uint32)
+            ),
+            timestamps=np.array([self._timestamps[aid] for aid in ids], dtype=np.float64),
+            params=np.array([self.num_perm, self.bands]),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path | None = None) -> "NearDuplicateIndex":
+        """
+        Load a persisted index, or return an empty one if missing or incompatible.
+
+        Args:
+            path: Source ``.npz`` path (default: DEDUP_INDEX_PATH)
+
+        Returns:
+            NearDuplicateIndex: Loaded index
+        """
+        path = Path(path or config.DEDUP_INDEX_PATH)
+        index = cls()
+        if not path.exists():
+            return index
+
+        try:
+            data = np.load(path)
+            if tuple(data["params"]) != (index.num_perm, index.bands):
+                logger.warning(f"Dedup index {path} has different LSH parameters, starting fresh")
+                return index
+            for article_id, signature, ts in zip(
+                data["ids"], data["signatures"], data["timestamps"]
+            ):
+                index._insert(str(article_id), signature, float(ts))
+            logger.info(f"Loaded dedup index with {len(index)} articles from {path}")
+        except Exception as e:
+            logger.error(f"Error loading dedup index {path}: {e}")
+            return cls()
+
+        return index
+
+
+async def rebuild_index_from_db(index: NearDuplicateIndex, hours: int | None = None) -> int:
+    """
+    Seed an index with canonical articles from the news table.
+
+    Used when no persisted index is available (e.g. a fresh container).
+
+    Args:
+        index: Index to populate
+        hours: How far back to load (default: DEDUP_WINDOW_HOURS)
+
+    Returns:
+        int: Number of articles indexed
+    """
+    from sqlalchemy import select
+
+    from packages.db_core.connection import db_manager
+    from packages.db_core.models import News
+
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours or config.DEDUP_WINDOW_HOURS)
+    async with db_manager.get_session() as session:
+        result = await session.execute(
+            select(News.id, News.title, News.content, News.timestamp)
+            .where(News.timestamp >= cutoff_time, News.canonical_id.is_(None))
+            .order_by(News.timestamp)
+        )
+        rows = result.all()
+
+    for row in rows:
+        index.add(str(row.id), normalize_article(row.title, row.content), row.timestamp)
+    return len(rows)
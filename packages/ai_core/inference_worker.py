@@ -0,0 +1,163 @@
+"""
+AUREX.AI - Inference Worker Thread.
+
+This module runs blocking tokenization and forward passes on a dedicated
+thread behind a bounded queue, so the event loop that serves HTTP requests
+and WebSocket broadcasts never stalls on inference.
+"""
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from loguru import logger
+
+from packages.shared.config import config
+
+T = TypeVar("T")
+
+
+class InferenceWorker:
+    """Serializes blocking inference calls onto one thread with a bounded backlog."""
+
+    def __init__(self, max_queue: int | None = None, name: str = "sentiment-inference") -> None:
+        """
+        Initialize the worker (the thread starts on first use).
+
+        Args:
+            max_queue: Maximum calls queued or running; further callers wait
+                asynchronously for a slot (default: INFERENCE_QUEUE_SIZE)
+            name: Thread name prefix
+        """
+        self.max_queue = max_queue or config.INFERENCE_QUEUE_SIZE
+        self.name = name
+        self._executor: ThreadPoolExecutor | None = None
+        # One semaphore per event loop: the analyzer is shared by the API, pipeline
+        # runs and benchmarks, each with its own loop
+        self._slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+        # Counters for observability
+        self._in_flight = 0  # Inside run(): waiting for a slot, queued or running
+        self._queued = 0  # Submitted, not yet started
+        self._blocked = 0  # Waiting for a queue slot
+        self.calls_started = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+
+    def _ensure_started(self) -> ThreadPoolExecutor:
+        """Start the worker thread if needed."""
+        if self._executor is None:
+            # One thread: backends are not shared between concurrent forward passes
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.name)
+            logger.info(f"InferenceWorker started (max_queue={self.max_queue})")
+        return self._executor
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking call on the worker thread.
+
+        Args:
+            fn: Blocking function (tokenization + forward pass)
+            *args: Positional arguments for ``fn``
+
+        Returns:
+            Any: The function's return value
+        """
+        executor = self._ensure_started()
+        submitted = time.perf_counter()  # Wait time includes waiting for a slot
+
+        with self._lock:
+            self._in_flight += 1
+        try:
+            return await self._run(executor, submitted, fn, *args)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _loop_slots(self) -> asyncio.Semaphore:
+        """Get the queue-slot semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            slots = self._slots.get(loop)
+            if slots is None:
+                slots = self._slots[loop] = asyncio.Semaphore(self.max_queue)
+        return slots
+
+    async def _run(
+        self, executor: ThreadPoolExecutor, submitted: float, fn: Callable[..., T], *args: Any
+    ) -> T:
+        """Wait for a queue slot, then run the call on the worker thread."""
+        slots = self._loop_slots()
+        self._blocked += 1
+        try:
+            await slots.acquire()
+        finally:
+            self._blocked -= 1
+
+        try:
+
+            def call() -> T:
+                self._record_start(time.perf_counter() - submitted)
+                return fn(*args)
+
+            with self._lock:
+                self._queued += 1
+            future = executor.submit(call)
+
+            try:
+                return await asyncio.wrap_future(future)
+            except asyncio.CancelledError:
+                # Drop the call if it has not started yet
+                if future.cancel():
+                    with self._lock:
+                        self._queued -= 1
+                raise
+        finally:
+            slots.release()
+
+    def _record_start(self, wait: float) -> None:
+        """Record how long a call waited before the thread picked it up."""
+        with self._lock:
+            self._queued -= 1
+            self.calls_started += 1
+            self.total_wait += wait
+            self.last_wait = wait
+            self.max_wait = max(self.max_wait, wait)
+
+    async def drain(self, poll_interval: float = 0.05) -> None:
+        """
+        Wait until no call is waiting for a slot, queued or running.
+
+        Args:
+            poll_interval: Seconds between checks
+        """
+        while self._in_flight:
+            await asyncio.sleep(poll_interval)
+
+    def shutdown(self) -> None:
+        """Stop the worker thread after running calls finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("InferenceWorker stopped")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get queue depth and wait-time statistics."""
+        with self._lock:
+            return {
+                "max_queue": self.max_queue,
+                "queue_depth": self._queued,
+                "waiting_for_slot": self._blocked,
+                "calls_started": self.calls_started,
+                "avg_wait_ms": (
+                    self.total_wait / self.calls_started * 1000 if self.calls_started else 0.0
+                ),
+                "max_wait_ms": self.max_wait * 1000,
+                "last_wait_ms": self.last_wait * 1000,
+            }
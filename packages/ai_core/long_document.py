@@ -0,0 +1,98 @@
+"""
+AUREX.AI - Long-Document Sentiment Aggregation.
+
+Helpers for scoring articles longer than the model's context: documents are
+tokenized into overlapping windows (see
+``SentimentAnalyzer.analyze_long_documents``), windows are capped per
+document to bound cost, and per-window probabilities are aggregated back
+into one document-level distribution.
+"""
+
+import numpy as np
+
+AGG_MEAN = "mean"
+AGG_MAX_CONFIDENCE = "max_confidence"
+AGG_ATTENTION = "attention"
+AGGREGATIONS = (AGG_MEAN, AGG_MAX_CONFIDENCE, AGG_ATTENTION)
+
+# Lower values let the most opinionated windows dominate the attention weights
+ATTENTION_TEMPERATURE = 0.25
+
+
+def select_windows(doc_index: np.ndarray, max_windows: int) -> np.ndarray:
+    """
+    Pick at most ``max_windows`` windows per document, evenly spaced.
+
+    Spreading the kept windows over the document (instead of keeping the
+    first ones) preserves coverage of the whole article.
+
+    Args:
+        doc_index: Document index of each window, grouped by document
+        max_windows: Maximum windows to keep per document
+
+    Returns:
+        np.ndarray: Indices of the windows to score, in original order
+    """
+    keep = []
+    for doc in np.unique(doc_index):
+        rows = np.flatnonzero(doc_index == doc)
+        if len(rows) > max_windows:
+            rows = rows[np.linspace(0, len(rows) - 1, max_windows).round().astype(int)]
+        keep.append(rows)
+    return np.concatenate(keep) if keep else np.empty(0, dtype=int)
+
+
+def window_weights(
+    probabilities: np.ndarray,
+    token_counts: np.ndarray,
+    method: str,
+    neutral_index: int = 1,
+) -> np.ndarray:
+    """
+    Compute aggregation weights for one document's windows.
+
+    Args:
+        probabilities: Window probabilities of shape (windows, labels)
+        token_counts: Real (non-padding) tokens per window
+        method: One of ``AGGREGATIONS``
+        neutral_index: Column of the neutral label
+
+    Returns:
+        np.ndarray: Non-negative weights summing to 1
+    """
+    if method == AGG_MEAN:
+        # Token-weighted, so a short trailing window does not count as much as a full one
+        weights = token_counts.astype(np.float64)
+    elif method == AGG_MAX_CONFIDENCE:
+        weights = np.zeros(len(probabilities))
+        weights[probabilities.max(axis=1).argmax()] = 1.0
+    elif method == AGG_ATTENTION:
+        # Attend to polar (non-neutral) windows: softmax over 1 - P(neutral)
+        polarity = (1.0 - probabilities[:, neutral_index]) / ATTENTION_TEMPERATURE
+        weights = np.exp(polarity - polarity.max())
+    else:
+        raise ValueError(f"Unknown aggregation '{method}'. Supported: {', '.join(AGGREGATIONS)}")
+
+    return weights / weights.sum()
+
+
+def aggregate_windows(
+    probabilities: np.ndarray,
+    token_counts: np.ndarray,
+    method: str,
+    neutral_index: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aggregate window probabilities into one document distribution.
+
+    Args:
+        probabilities: Window probabilities of shape (windows, labels)
+        token_counts: Real (non-padding) tokens per window
+        method: One of ``AGGREGATIONS``
+        neutral_index: Column of the neutral label
+
+    Returns:
+        tuple: (document probabilities of shape (labels,), per-window weights)
+    """
+    weights = window_weights(probabilities, token_counts, method, neutral_index)
+    return (weights[:, None] * probabilities).sum(axis=0).astype(np.float32), weights
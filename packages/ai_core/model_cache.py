@@ -0,0 +1,244 @@
+"""
+AUREX.AI - Local Model Cache.
+
+This module keeps FinBERT as a self-contained safetensors snapshot under
+MODEL_CACHE_DIR and loads its weights through a copy-on-write memory map.
+Every inference process on a host then maps the same file, so the OS page
+cache holds one copy of the weights instead of one per process, and nothing
+is downloaded at runtime once the cache has been prepared:
+
+    python -m packages.ai_core.model_cache prepare
+"""
+
+import argparse
+import contextlib
+import json
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.shared.config import config
+
+WEIGHTS_FILE = "model.safetensors"
+MANIFEST_FILE = "aurex_manifest.json"
+
+# safetensors dtype tags NumPy can view directly (BF16 has no NumPy dtype)
+SAFETENSORS_DTYPES = {
+    "F64": np.float64,
+    "F32": np.float32,
+    "F16": np.float16,
+    "I64": np.int64,
+    "I32": np.int32,
+    "I16": np.int16,
+    "I8": np.int8,
+    "U8": np.uint8,
+    "BOOL": np.bool_,
+}
+
+
+def get_model_cache_dir(model_name: str, revision: str = "main") -> Path:
+    """
+    Get the local snapshot directory for a model revision.
+
+    Args:
+        model_name: Hugging Face model name
+        revision: Model revision (branch, tag or commit hash)
+
+    Returns:
+        Path: Directory under MODEL_CACHE_DIR/hf
+    """
+    return Path(config.MODEL_CACHE_DIR) / "hf" / model_name.replace("/", "--") / revision
+
+
+def is_model_cached(model_dir: str | Path) -> bool:
+    """
+    Check whether a directory holds a complete snapshot written by ``prepare_model_cache``.
+
+    Args:
+        model_dir: Snapshot directory
+
+    Returns:
+        bool: True if config, weights and manifest are present
+    """
+    model_dir = Path(model_dir)
+    required = ("config.json", WEIGHTS_FILE, MANIFEST_FILE)
+    return all((model_dir / name).is_file() for name in required)
+
+
+def resolve_model_source(model_name: str, revision: str = "main") -> tuple[str, str | None]:
+    """
+    Resolve where ``from_pretrained`` should load a model from.
+
+    Args:
+        model_name: Hugging Face model name or local path
+        revision: Model revision
+
+    Returns:
+        tuple: (local snapshot path, None) when cached, else (model_name, revision)
+
+    Raises:
+        FileNotFoundError: If MODEL_CACHE_OFFLINE is set and the snapshot is missing
+    """
+    model_dir = get_model_cache_dir(model_name, revision)
+    if is_model_cached(model_dir):
+        return str(model_dir), None
+
+    if config.MODEL_CACHE_OFFLINE:
+        raise FileNotFoundError(
+            f"{model_name}@{revision} is not in {model_dir}; "
+            f"run `python -m packages.ai_core.model_cache prepare` first"
+        )
+
+    logger.warning(f"{model_name}@{revision} not in local model cache, loading from the Hub")
+    return model_name, revision
+
+
+def mmap_safetensors(path: str | Path) -> dict[str, np.ndarray]:
+    """
+    Map a safetensors file into memory without reading it.
+
+    The arrays are copy-on-write views of one private mapping: pages are
+    shared with every other process mapping the same file until written.
+
+    Args:
+        path: Path of a ``.safetensors`` file
+
+    Returns:
+        dict: Tensor name -> NumPy array backed by the mapping
+
+    Raises:
+        ValueError: If the file uses a dtype NumPy cannot view (e.g. BF16)
+    """
+    with open(path, "rb") as f:
+        (header_size,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(header_size))
+
+    header.pop("__metadata__", None)
+    if not header:
+        return {}
+
+    data = np.memmap(path, dtype=np.uint8, mode="c")
+    offset = 8 + header_size
+
+    tensors = {}
+    for name, info in header.items():
+        dtype = SAFETENSORS_DTYPES.get(info["dtype"])
+        if dtype is None:
+            raise ValueError(f"Cannot memory-map {name}: unsupported dtype {info['dtype']}")
+        start, end = info["data_offsets"]
+        tensors[name] = data[offset + start : offset + end].view(dtype).reshape(info["shape"])
+    return tensors
+
+
+def load_mmap_model(model_dir: str | Path) -> Any:
+    """
+    Build a sequence-classification model whose parameters alias the mapped weights.
+
+    Args:
+        model_dir: Snapshot directory written by ``prepare_model_cache``
+
+    Returns:
+        PreTrainedModel: Model in eval mode on CPU
+
+    Raises:
+        ValueError: If the snapshot does not cover every model parameter
+    """
+    import torch
+    from transformers import AutoConfig, AutoModelForSequenceClassification
+
+    try:
+        from transformers.modeling_utils import no_init_weights
+    except ImportError:  # Older/newer transformers: pay for the random init instead
+        no_init_weights = contextlib.nullcontext
+
+    model_dir = Path(model_dir)
+    state = {
+        name: torch.from_numpy(array)
+        for name, array in mmap_safetensors(model_dir / WEIGHTS_FILE).items()
+    }
+
+    model_config = AutoConfig.from_pretrained(model_dir)
+    with no_init_weights():
+        model = AutoModelForSequenceClassification.from_config(model_config)
+
+    # assign=True swaps the parameters for the mapped tensors instead of copying into them
+    missing, _ = model.load_state_dict(state, strict=False, assign=True)
+    if missing:
+        raise ValueError(f"Snapshot {model_dir} is missing weights: {missing[:5]}")
+
+    model.eval()
+    return model
+
+
+def prepare_model_cache(
+    model_name: str | None = None,
+    revision: str | None = None,
+    output_dir: str | Path | None = None,
+) -> Path:
+    """
+    Download a model once and write it as a single-file safetensors snapshot.
+
+    Args:
+        model_name: Hugging Face model name (default: FINBERT_MODEL_NAME)
+        revision: Model revision (default: FINBERT_MODEL_REVISION)
+        output_dir: Target directory (default: ``get_model_cache_dir``)
+
+    Returns:
+        Path: Snapshot directory
+    """
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    model_name = model_name or config.FINBERT_MODEL_NAME
+    revision = revision or config.FINBERT_MODEL_REVISION
+    output_dir = Path(output_dir) if output_dir else get_model_cache_dir(model_name, revision)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name, revision=revision)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name, revision=revision)
+
+    # One unsharded fp32 file, so every process maps exactly the same bytes
+    model.save_pretrained(output_dir, safe_serialization=True, max_shard_size="20GB")
+    tokenizer.save_pretrained(output_dir)
+
+    weights = output_dir / WEIGHTS_FILE
+    manifest = {
+        "model_name": model_name,
+        "revision": revision,
+        "weights_bytes": weights.stat().st_size,
+    }
+    (output_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+
+    size_mb = manifest["weights_bytes"] / 1e6
+    logger.info(f"✅ Cached {model_name}@{revision} in {output_dir} ({size_mb:.0f} MB)")
+    return output_dir
+
+
+def main() -> None:
+    """Prepare or inspect the local model cache."""
+    from packages.shared.logging_config import setup_logging
+
+    setup_logging("model-cache", log_level="INFO")
+
+    parser = argparse.ArgumentParser(description="Manage the local safetensors model cache")
+    parser.add_argument("command", choices=["prepare", "status"])
+    parser.add_argument("--model", default=config.FINBERT_MODEL_NAME, help="Model name")
+    parser.add_argument("--revision", default=config.FINBERT_MODEL_REVISION, help="Model revision")
+    parser.add_argument("--output", help="Snapshot directory (default: under MODEL_CACHE_DIR)")
+    args = parser.parse_args()
+
+    model_dir = Path(args.output) if args.output else get_model_cache_dir(args.model, args.revision)
+
+    if args.command == "prepare":
+        prepare_model_cache(args.model, args.revision, model_dir)
+    elif is_model_cached(model_dir):
+        manifest = json.loads((model_dir / MANIFEST_FILE).read_text())
+        logger.info(f"✅ {args.model}@{args.revision} cached in {model_dir}: {manifest}")
+    else:
+        logger.warning(f"❌ {args.model}@{args.revision} is not cached in {model_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+AUREX.AI - Process-Pool Sentiment Inference.
+
+This module shards bulk sentiment scoring across worker processes. Each
+worker pins its torch thread counts, loads the model once, and scores
+chunks of texts; results stream back to the caller in input order.
+"""
+
+import asyncio
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any
+
+from loguru import logger
+
+from packages.ai_core.results import SentimentBatch, SentimentView
+from packages.shared.config import config
+
+# Per-process analyzer, created by the pool initializer
+_worker_analyzer = None
+
+
+def _init_worker(threads: int) -> None:
+    """
+    Initialize a pool worker: pin thread counts and load the model once.
+
+    Args:
+        threads: Intra-op threads for this worker
+    """
+    global _worker_analyzer
+
+    # Pin BLAS/OpenMP pools before torch spins them up
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(threads)
+
+    from packages.ai_core.sentiment import SentimentAnalyzer
+    from packages.ai_core.torch_runtime import TorchRuntimeProfile
+
+    analyzer = SentimentAnalyzer()
+    # Workers split the cores between them: no inter-op parallelism inside one
+    analyzer.runtime_profile = TorchRuntimeProfile(intra_op_threads=threads, inter_op_threads=1)
+    analyzer.result_cache = None  # Bulk re-scoring must not serve stale results
+    asyncio.run(analyzer.load_model())
+    _worker_analyzer = analyzer
+    logger.info(f"Pool worker {os.getpid()} ready ({threads} threads)")
+
+
+def _score_chunk(texts: list[str]) -> SentimentBatch:
+    """
+    Score one chunk of texts in a pool worker.
+
+    Results travel back as two arrays rather than one pickled dict per text.
+
+    Args:
+        texts: Texts to score
+
+    Returns:
+        SentimentBatch: Sentiment results in input order
+    """
+    return SentimentBatch(
+        _worker_analyzer._predict_probs(texts),
+        _worker_analyzer.labels,
+        _worker_analyzer.model_version,
+    )
+
+
+class ProcessPoolAnalyzer:
+    """Scores large text collections across several model-loaded worker processes."""
+
+    def __init__(
+        self,
+        num_workers: int | None = None,
+        threads_per_worker: int | None = None,
+        chunk_size: int | None = None,
+    ) -> None:
+        """
+        Initialize the pool (workers start lazily).
+
+        Args:
+            num_workers: Worker processes (default: INFERENCE_POOL_WORKERS, or cores / threads)
+            threads_per_worker: Torch intra-op threads per worker
+            chunk_size: Texts sent to a worker per task
+        """
+        self.threads_per_worker = threads_per_worker or config.INFERENCE_POOL_THREADS
+        self.num_workers = (
+            num_workers
+            or config.INFERENCE_POOL_WORKERS
+            or max(1, (os.cpu_count() or 1) // self.threads_per_worker)
+        )
+        self.chunk_size = chunk_size or config.INFERENCE_BATCH_SIZE
+        self.max_in_flight = self.num_workers * 2
+        self._executor: ProcessPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        if self._executor is not None:
+            return
+        # Spawn, not fork: forked torch/tokenizer thread pools deadlock
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.num_workers,
+            mp_context=get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,),
+        )
+        logger.info(
+            f"ProcessPoolAnalyzer started ({self.num_workers} workers x "
+            f"{self.threads_per_worker} threads, chunk_size={self.chunk_size})"
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            logger.info("ProcessPoolAnalyzer stopped")
+
+    def __enter__(self) -> "ProcessPoolAnalyzer":
+        """Start the pool on context entry."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Stop the pool on context exit."""
+        self.shutdown()
+
+    def submit(self, texts: list[str]) -> Future:
+        """
+        Submit one chunk of texts to the pool.
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            Future: Resolves to the chunk's ``SentimentBatch``
+        """
+        self.start()
+        return self._executor.submit(_score_chunk, texts)
+
+    def imap(self, texts: Iterable[str]) -> Iterator[SentimentView]:
+        """
+        Score texts and yield results in input order as chunks complete.
+
+        At most ``max_in_flight`` chunks are outstanding, so the input iterable
+        is consumed lazily and memory stays bounded.
+
+        Args:
+            texts: Texts to score (any iterable, consumed lazily)
+
+        Yields:
+            SentimentView: Lazy sentiment result for each input text
+        """
+        pending: deque[Future] = deque()
+
+        for chunk in chunked(texts, self.chunk_size):
+            pending.append(self.submit(chunk))
+            if len(pending) >= self.max_in_flight:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """
+    Split an iterable into lists of at most ``size`` items.
+
+    Args:
+        items: Items to split
+        size: Maximum chunk size
+
+    Yields:
+        list: Consecutive chunks
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
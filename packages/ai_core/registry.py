@@ -0,0 +1,185 @@
+"""
+AUREX.AI - Sentiment Model Registry.
+
+This module holds the active sentiment analyzer and rolls new model
+revisions in without a restart: the candidate is loaded and warmed up in the
+background, then swapped in with a single reference assignment. Requests
+already running keep the analyzer they started with until they finish; the
+replaced analyzer's inference thread is then shut down.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+
+from loguru import logger
+
+
+def make_model_version(model_name: str, revision: str) -> str:
+    """
+    Build the version tag stored with every sentiment result.
+
+    Args:
+        model_name: Hugging Face model name
+        revision: Model revision (branch, tag or commit)
+
+    Returns:
+        str: "<model_name>@<revision>"
+    """
+    return f"{model_name}@{revision}"
+
+
+class ModelRegistry:
+    """Owns the active analyzer and swaps in new model versions atomically."""
+
+    def __init__(self, factory: Callable[..., Any], history_size: int = 20) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            factory: Builds an analyzer from ``model_name``, ``model_revision``
+                and ``backend_name`` keyword arguments (None = configured default)
+            history_size: Number of recent activations kept in ``history``
+        """
+        self._factory = factory
+        self._active = None
+        self._swap_lock = asyncio.Lock()
+        self._swap_task: asyncio.Task | None = None
+        self._retire_tasks: set[asyncio.Task] = set()
+        self._listeners: list[Callable[[Any], None]] = []
+        self.pending_version: str | None = None
+        self.last_error: str | None = None
+        self.history: deque[dict[str, str]] = deque(maxlen=history_size)
+
+    @property
+    def active(self) -> Any:
+        """The analyzer currently serving requests (None before first use)."""
+        return self._active
+
+    def add_listener(self, listener: Callable[[Any], None]) -> None:
+        """
+        Register a callback invoked with the new analyzer after each swap.
+
+        Args:
+            listener: Callback taking the newly active analyzer
+        """
+        self._listeners.append(listener)
+
+    async def get_active(self) -> Any:
+        """
+        Get the active analyzer, creating and loading the configured default on first use.
+
+        Returns:
+            SentimentAnalyzer: Active analyzer
+        """
+        if self._active is None:
+            self._set_active(self._factory())
+        analyzer = self._active
+        await analyzer.load_model()
+        return analyzer
+
+    async def activate(
+        self,
+        model_name: str | None = None,
+        revision: str | None = None,
+        backend: str | None = None,
+        warmup: bool = True,
+    ) -> Any:
+        """
+        Load, warm up and swap in a model version.
+
+        The active analyzer keeps serving until the candidate is ready; if
+        loading fails the active analyzer is left untouched.
+
+        Args:
+            model_name: Model to load (default: current/configured model)
+            revision: Revision to load (default: configured revision)
+            backend: Inference backend (default: configured backend)
+            warmup: Run a dummy forward pass before swapping
+
+        Returns:
+            SentimentAnalyzer: The newly active analyzer
+        """
+        async with self._swap_lock:
+            candidate = self._factory(
+                model_name=model_name,
+                model_revision=revision,
+                backend_name=backend,
+            )
+            self.pending_version = candidate.model_version
+
+            try:
+                logger.info(f"Loading model version {candidate.model_version} for hot-swap...")
+                if warmup:
+                    await candidate.warmup()
+                else:
+                    await candidate.load_model()
+            except Exception as e:
+                self.last_error = f"{candidate.model_version}: {e}"
+                logger.error(f"❌ Model version {candidate.model_version} failed to load: {e}")
+                raise
+            finally:
+                self.pending_version = None
+
+            previous = self._active
+            self._set_active(candidate)
+            self.last_error = None
+            logger.info(
+                f"✅ Swapped sentiment model "
+                f"{previous.model_version if previous else None} → {candidate.model_version}"
+            )
+            if previous is not None and previous is not candidate:
+                task = asyncio.get_running_loop().create_task(self._retire(previous))
+                self._retire_tasks.add(task)
+                task.add_done_callback(self._retire_tasks.discard)
+            return candidate
+
+    def start_activation(self, **kwargs: Any) -> asyncio.Task:
+        """
+        Start ``activate`` in the background (errors are logged, not raised).
+
+        Args:
+            **kwargs: Arguments for ``activate``
+
+        Returns:
+            asyncio.Task: The activation task
+        """
+
+        async def run() -> None:
+            try:
+                await self.activate(**kwargs)
+            except Exception:
+                pass  # Already logged and recorded in last_error
+
+        self._swap_task = asyncio.get_running_loop().create_task(run())
+        return self._swap_task
+
+    async def _retire(self, analyzer: Any) -> None:
+        """Shut down a replaced analyzer's inference thread once its calls have drained."""
+        try:
+            await analyzer.inference_worker.drain()
+            await asyncio.to_thread(analyzer.inference_worker.shutdown)
+            logger.info(f"Retired sentiment model {analyzer.model_version}")
+        except Exception as e:
+            logger.warning(f"Failed to retire sentiment model {analyzer.model_version}: {e}")
+
+    def _set_active(self, analyzer: Any) -> None:
+        """Make an analyzer active (one reference assignment) and notify listeners."""
+        self._active = analyzer
+        self.history.append(
+            {"model_version": analyzer.model_version, "activated_at": datetime.utcnow().isoformat()}
+        )
+        for listener in self._listeners:
+            listener(analyzer)
+
+    def get_status(self) -> dict[str, Any]:
+        """Get the active and pending model versions."""
+        return {
+            "active_version": self._active.model_version if self._active else None,
+            "pending_version": self.pending_version,
+            "swap_in_progress": self._swap_task is not None and not self._swap_task.done(),
+            "last_error": self.last_error,
+            "history": list(self.history),
+        }
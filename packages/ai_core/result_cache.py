@@ -0,0 +1,163 @@
+"""
+AUREX.AI - Sentiment Result Cache.
+
+This module provides a content-addressed cache for sentiment results with an
+in-process LRU tier in front of a shared Redis tier.
+"""
+
+import hashlib
+import re
+import unicodedata
+from collections import OrderedDict
+from typing import Any
+
+from loguru import logger
+
+from packages.db_core.cache import CacheManager
+from packages.shared.config import config
+
+CACHE_KEY_PREFIX = "sentiment:result:"
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text so trivially different copies share a cache entry.
+
+    Args:
+        text: Raw text
+
+    Returns:
+        str: NFKC-normalized text with collapsed whitespace
+    """
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip()
+
+
+class SentimentResultCache:
+    """Two-tier (LRU + Redis) cache of sentiment results keyed by text and model."""
+
+    def __init__(
+        self,
+        model_name: str,
+        model_revision: str = "main",
+        max_entries: int | None = None,
+        cache_manager: CacheManager | None = None,
+        ttl: int | None = None,
+    ) -> None:
+        """
+        Initialize the result cache.
+
+        Args:
+            model_name: Model name, part of every cache key
+            model_revision: Model revision, part of every cache key
+            max_entries: Maximum entries held in the in-process LRU tier
+            cache_manager: Redis cache manager (None = LRU tier only)
+            ttl: Redis entry time to live in seconds
+        """
+        self.model_name = model_name
+        self.model_revision = model_revision
+        self.max_entries = max_entries or config.SENTIMENT_CACHE_SIZE
+        self.cache_manager = cache_manager
+        self.ttl = ttl or config.CACHE_TTL_SENTIMENT_RESULT
+        self._lru: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        # Counters for observability
+        self.lru_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    def make_key(self, text: str) -> str:
+        """
+        Build the content-addressed cache key for a text.
+
+        Args:
+            text: Text to key
+
+        Returns:
+            str: Redis key containing a SHA-256 digest of text + model identity
+        """
+        payload = f"{self.model_name}\0{self.model_revision}\0{normalize_text(text)}"
+        return CACHE_KEY_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _lru_get(self, key: str) -> dict[str, Any] | None:
+        """Get a result from the LRU tier and mark it as recently used."""
+        result = self._lru.get(key)
+        if result is not None:
+            self._lru.move_to_end(key)
+        return result
+
+    def _lru_put(self, key: str, result: dict[str, Any]) -> None:
+        """Put a result into the LRU tier, evicting the least recently used entry."""
+        self._lru[key] = result
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    async def get_many(self, texts: list[str]) -> list[dict[str, Any] | None]:
+        """
+        Look up results for several texts.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            list: Cached results (None for misses), in input order
+        """
+        keys = [self.make_key(text) for text in texts]
+        results: list[dict[str, Any] | None] = [self._lru_get(key) for key in keys]
+        self.lru_hits += sum(result is not None for result in results)
+
+        # Fall through to Redis for LRU misses
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending and self.cache_manager is not None:
+            values = await self.cache_manager.get_many([keys[i] for i in pending])
+            for i, value in zip(pending, values):
+                if value is not None:
+                    results[i] = value
+                    self._lru_put(keys[i], value)
+                    self.redis_hits += 1
+
+        self.misses += sum(result is None for result in results)
+        return [_copy_result(result) if result is not None else None for result in results]
+
+    async def set_many(self, texts: list[str], results: list[dict[str, Any]]) -> None:
+        """
+        Store results for several texts in both tiers.
+
+        Args:
+            texts: Texts that were scored
+            results: Their sentiment results
+        """
+        items = {}
+        for text, result in zip(texts, results):
+            key = self.make_key(text)
+            self._lru_put(key, _copy_result(result))
+            items[key] = result
+
+        if items and self.cache_manager is not None:
+            await self.cache_manager.set_many(items, ttl=self.ttl)
+
+    def clear(self) -> None:
+        """Clear the in-process LRU tier."""
+        self._lru.clear()
+        logger.info("Sentiment result cache (LRU tier) cleared")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.lru_hits + self.redis_hits + self.misses
+        return {
+            "lru_entries": len(self._lru),
+            "lru_hits": self.lru_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_rate": (self.lru_hits + self.redis_hits) / lookups if lookups else 0.0,
+        }
+
+
+def _copy_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Copy a result so callers cannot mutate cached entries."""
+    copied = dict(result)
+    if "probabilities" in copied:
+        copied["probabilities"] = dict(copied["probabilities"])
+    return copied
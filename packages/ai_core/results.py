@@ -0,0 +1,163 @@
+"""
+AUREX.AI - Columnar Sentiment Results.
+
+This module provides an array-backed alternative to lists of result dicts for
+bulk scoring: label indices are stored as one uint8 array and probabilities
+as one float32 (N, 3) array. Per-item views are created lazily, so large
+re-scoring runs do not allocate millions of small Python objects.
+"""
+
+from collections.abc import Iterator
+from typing import Any
+
+import numpy as np
+
+from packages.ai_core.cascade import LABELS, STAGE_MODEL
+
+
+class SentimentView:
+    """Lazy, read-only view of one row of a ``SentimentBatch``."""
+
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "SentimentBatch", index: int) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            batch: Backing batch
+            index: Row index
+        """
+        self._batch = batch
+        self._index = index
+
+    @property
+    def label(self) -> str:
+        """Predicted label."""
+        return self._batch.labels[self._batch.label_ids[self._index]]
+
+    @property
+    def score(self) -> float:
+        """Probability of the predicted label."""
+        return float(self._batch.scores[self._index])
+
+    @property
+    def probabilities(self) -> dict[str, float]:
+        """Per-label probabilities (built on access)."""
+        row = self._batch.probabilities[self._index]
+        return {label: float(p) for label, p in zip(self._batch.labels, row)}
+
+    @property
+    def embedding(self) -> np.ndarray | None:
+        """Pooled float16 sentence embedding (None if not collected)."""
+        if self._batch.embeddings is None:
+            return None
+        return self._batch.embeddings[self._index]
+
+    def __getitem__(self, key: str) -> Any:
+        """Dict-style access, so views can stand in for result dicts."""
+        if key == "stage":
+            return STAGE_MODEL
+        if key == "model_version":
+            return self._batch.model_version
+        if key in ("label", "score", "probabilities", "embedding"):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style ``get``."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> dict[str, Any]:
+        """Materialize the row as a regular sentiment result dict."""
+        return {
+            "label": self.label,
+            "score": self.score,
+            "probabilities": self.probabilities,
+            "stage": STAGE_MODEL,
+            "model_version": self._batch.model_version,
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SentimentView(label={self.label}, score={self.score:.3f})>"
+
+
+class SentimentBatch:
+    """Array-backed sentiment results for a batch of texts."""
+
+    __slots__ = ("probabilities", "label_ids", "labels", "model_version", "embeddings", "_scores")
+
+    def __init__(
+        self,
+        probabilities: np.ndarray,
+        labels: list[str] | None = None,
+        model_version: str | None = None,
+        embeddings: np.ndarray | None = None,
+    ) -> None:
+        """
+        Initialize the batch.
+
+        Args:
+            probabilities: Softmax probabilities of shape (N, num_labels)
+            labels: Label names by column (default: negative, neutral, positive)
+            model_version: Version tag of the model that produced the batch
+            embeddings: Pooled sentence embeddings of shape (N, hidden), stored as float16
+        """
+        self.probabilities = np.ascontiguousarray(probabilities, dtype=np.float32)
+        self.labels = list(labels or LABELS)
+        self.model_version = model_version
+        self.embeddings = None if embeddings is None else np.asarray(embeddings, dtype=np.float16)
+        self.label_ids = self.probabilities.argmax(axis=1).astype(np.uint8)
+        self._scores: np.ndarray | None = None
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Probability of each predicted label, shape (N,)."""
+        if self._scores is None:
+            self._scores = self.probabilities[np.arange(len(self)), self.label_ids]
+        return self._scores
+
+    @property
+    def label_names(self) -> np.ndarray:
+        """Predicted label names, shape (N,)."""
+        return np.asarray(self.labels, dtype=object)[self.label_ids]
+
+    def __len__(self) -> int:
+        """Number of results."""
+        return len(self.label_ids)
+
+    def __getitem__(self, index: int) -> SentimentView:
+        """Lazy view of one result."""
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        return SentimentView(self, index % len(self))
+
+    def __iter__(self) -> Iterator[SentimentView]:
+        """Iterate lazy views in order."""
+        return (SentimentView(self, i) for i in range(len(self)))
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Materialize all rows as regular sentiment result dicts."""
+        return [view.to_dict() for view in self]
+
+    def to_columns(self) -> dict[str, list]:
+        """
+        Convert to column lists for the News sentiment update.
+
+        Returns:
+            dict: {"sentiment_label": [...], "sentiment_score": [...],
+            "sentiment_model_version": [...]}
+        """
+        return {
+            "sentiment_label": self.label_names.tolist(),
+            "sentiment_score": self.scores.astype(np.float64).tolist(),
+            "sentiment_model_version": [self.model_version] * len(self),
+        }
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"<SentimentBatch(size={len(self)})>"
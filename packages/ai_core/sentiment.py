@@ -2,60 +2,152 @@
 AUREX.AI - FinBERT Sentiment Analysis.
 
 This module provides sentiment analysis for financial text using the FinBERT model.
+torch and transformers are imported lazily by ``load_model()`` so that services
+which only import this module do not pay their start-up cost.
 """
 
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator
 from typing import Any
 
-import torch
+import numpy as np
 from loguru import logger
-from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
+from packages.ai_core.backends import InferenceBackend, create_backend, softmax
+from packages.ai_core.batching import MicroBatcher
+from packages.ai_core.calibration import load_calibrator
+from packages.ai_core.cascade import STAGE_LEXICON, STAGE_MODEL, load_pre_classifier
+from packages.ai_core.inference_worker import InferenceWorker
+from packages.ai_core.long_document import AGGREGATIONS, aggregate_windows, select_windows
+from packages.ai_core.model_cache import resolve_model_source
+from packages.ai_core.registry import ModelRegistry, make_model_version
+from packages.ai_core.result_cache import SentimentResultCache
+from packages.ai_core.results import SentimentBatch
+from packages.ai_core.sequence_length import OVERFLOW_LONG_DOC, AdaptiveMaxLength
+from packages.ai_core.torch_runtime import TorchRuntimeProfile
+from packages.db_core.cache import cache_manager
 from packages.shared.config import config
 
 
 class SentimentAnalyzer:
     """FinBERT-based sentiment analyzer for financial text."""
 
-    def __init__(self) -> None:
-        """Initialize the sentiment analyzer."""
-        self.model_name = config.FINBERT_MODEL_NAME
-        self.device = "cuda" if torch.cuda.is_available() and config.DEVICE == "gpu" else "cpu"
+    def __init__(
+        self,
+        model_name: str | None = None,
+        model_revision: str | None = None,
+        backend_name: str | None = None,
+    ) -> None:
+        """
+        Initialize the sentiment analyzer.
+
+        Args:
+            model_name: Model to load (default: FINBERT_MODEL_NAME)
+            model_revision: Model revision (default: FINBERT_MODEL_REVISION)
+            backend_name: Inference backend (default: INFERENCE_BACKEND)
+        """
+        self.model_name = model_name or config.FINBERT_MODEL_NAME
+        self.model_revision = model_revision or config.FINBERT_MODEL_REVISION
+        self.model_version = make_model_version(self.model_name, self.model_revision)
+        # Resolved against torch.cuda.is_available() when the model loads
+        self.device = "cuda" if config.DEVICE in ("gpu", "cuda") else "cpu"
         self.batch_size = config.INFERENCE_BATCH_SIZE
-        self.model = None
+        self.backend_name = backend_name or config.INFERENCE_BACKEND
+        self.backend: InferenceBackend | None = None
         self.tokenizer = None
         self.labels = ["negative", "neutral", "positive"]
-        logger.info(f"SentimentAnalyzer initialized (device: {self.device})")
+        self.warmed_up = False
+        self._load_lock = asyncio.Lock()
+        # Tokenization and forward passes run here, never on the event loop
+        self.inference_worker = InferenceWorker()
+        # Token-length histogram choosing the sequence cap per batch
+        self.sequence_length = AdaptiveMaxLength()
+        # Thread pools, autograd context and fast path of the torch backend
+        self.runtime_profile = TorchRuntimeProfile()
+        # Calibration map fitted offline and stored next to the model snapshot
+        self.calibrator = (
+            load_calibrator(self.model_name, self.model_revision)
+            if config.CALIBRATION_ENABLED
+            else None
+        )
+        self.result_cache = (
+            SentimentResultCache(
+                self.model_name,
+                # Recalibrating changes every score, so it must not hit old entries
+                self.model_revision
+                if self.calibrator is None
+                else f"{self.model_revision}+cal-{self.calibrator.fingerprint}",
+                cache_manager=cache_manager,
+            )
+            if config.SENTIMENT_CACHE_ENABLED
+            else None
+        )
+        self.pre_classifier = load_pre_classifier() if config.CASCADE_ENABLED else None
+        self.cascade_threshold = config.CASCADE_CONFIDENCE_THRESHOLD
+        self.stage_counts = {STAGE_LEXICON: 0, STAGE_MODEL: 0}
+        logger.info(
+            f"SentimentAnalyzer initialized ({self.model_version}, device: {self.device}, "
+            f"backend: {self.backend_name})"
+        )
 
     async def load_model(self) -> None:
         """Load the FinBERT model and tokenizer."""
-        if self.model is not None:
+        if self.backend is not None:
             return  # Already loaded
 
-        try:
-            logger.info(f"Loading FinBERT model: {self.model_name}")
+        async with self._load_lock:
+            if self.backend is not None:
+                return  # Loaded by a concurrent caller
 
-            # Load in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            try:
+                logger.info(f"Loading FinBERT model: {self.model_name}")
 
-            self.tokenizer = await loop.run_in_executor(
-                None,
-                lambda: AutoTokenizer.from_pretrained(self.model_name),
-            )
+                # Load in executor to avoid blocking (this is also where torch
+                # and transformers are first imported)
+                loop = asyncio.get_event_loop()
 
-            self.model = await loop.run_in_executor(
-                None,
-                lambda: AutoModelForSequenceClassification.from_pretrained(self.model_name),
-            )
+                self.device = await loop.run_in_executor(None, self._resolve_device)
+                self.tokenizer = await loop.run_in_executor(None, self._load_tokenizer)
 
-            self.model.to(self.device)
-            self.model.eval()  # Set to evaluation mode
+                backend = create_backend(
+                    self.backend_name,
+                    self.model_name,
+                    device=self.device,
+                    revision=self.model_revision,
+                    profile=self.runtime_profile,
+                )
+                await loop.run_in_executor(None, backend.load)
 
-            logger.info(f"✅ FinBERT model loaded on {self.device}")
+                self.backend = backend
 
-        except Exception as e:
-            logger.error(f"❌ Failed to load FinBERT model: {e}")
-            raise
+                logger.info(f"✅ FinBERT model loaded on {self.device} ({backend.name} backend)")
+
+            except Exception as e:
+                logger.error(f"❌ Failed to load FinBERT model: {e}")
+                raise
+
+    async def warmup(self) -> None:
+        """Load the model and run one dummy forward pass so first requests are fast."""
+        await self.load_model()
+        await self.inference_worker.run(self._predict_probs, ["Gold prices hold steady"])
+        self.warmed_up = True
+
+    def _resolve_device(self) -> str:
+        """Fall back to CPU when a GPU is requested but unavailable."""
+        if self.device == "cuda":
+            import torch
+
+            if not torch.cuda.is_available():
+                logger.warning("GPU requested but CUDA is unavailable, using CPU")
+                return "cpu"
+        return self.device
+
+    def _load_tokenizer(self) -> Any:
+        """Load the tokenizer (blocking)."""
+        from transformers import AutoTokenizer
+
+        source, revision = resolve_model_source(self.model_name, self.model_revision)
+        return AutoTokenizer.from_pretrained(source, revision=revision)
 
     async def analyze_text(self, text: str) -> dict[str, Any]:
         """
@@ -67,38 +159,11 @@ class SentimentAnalyzer:
         Returns:
             dict: {"label": str, "score": float, "probabilities": dict}
         """
-        if self.model is None:
+        if self.backend is None:
             await self.load_model()
 
         try:
-            # Tokenize
-            inputs = self.tokenizer(
-                text,
-                return_tensors="pt",
-                padding=True,
-                truncation=True,
-                max_length=512,
-            ).to(self.device)
-
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
-
-            # Get results
-            probabilities = predictions[0].cpu().numpy()
-            predicted_class = probabilities.argmax()
-            confidence = float(probabilities[predicted_class])
-
-            result = {
-                "label": self.labels[predicted_class],
-                "score": confidence,
-                "probabilities": {
-                    label: float(prob)
-                    for label, prob in zip(self.labels, probabilities)
-                },
-            }
-
+            (result,) = await self._analyze([text])
             return result
 
         except Exception as e:
@@ -115,7 +180,7 @@ class SentimentAnalyzer:
         Returns:
             list: List of sentiment results
         """
-        if self.model is None:
+        if self.backend is None:
             await self.load_model()
 
         if not texts:
@@ -123,87 +188,718 @@ class SentimentAnalyzer:
 
         try:
             logger.info(f"Analyzing batch of {len(texts)} texts")
+            results = await self._analyze(texts)
+            logger.info(f"✅ Batch analysis complete: {len(results)} results")
+            return results
 
-            # Tokenize all texts
-            inputs = self.tokenizer(
-                texts,
-                return_tensors="pt",
+        except Exception as e:
+            logger.error(f"Error in batch analysis: {e}")
+            # Return neutral sentiment for all on error
+            return [{"label": "neutral", "score": 0.33, "probabilities": {}} for _ in texts]
+
+    async def analyze_batch_array(
+        self,
+        texts: list[str],
+        with_embeddings: bool = False,
+    ) -> SentimentBatch:
+        """
+        Score texts with the model and return compact columnar results.
+
+        Intended for bulk re-scoring: results are kept as a uint8 label array
+        and a float32 probability matrix instead of one dict per text. The
+        result cache and pre-classifier are bypassed so every text gets a
+        fresh model score.
+
+        Args:
+            texts: Texts to score
+            with_embeddings: Also keep float16 sentence embeddings pooled from
+                the same forward pass
+
+        Returns:
+            SentimentBatch: Results in input order
+        """
+        if self.backend is None:
+            await self.load_model()
+
+        probabilities, embeddings = await self.inference_worker.run(
+            self._predict, texts, with_embeddings
+        )
+        return SentimentBatch(probabilities, self.labels, self.model_version, embeddings)
+
+    async def _analyze(self, texts: list[str]) -> list[dict[str, Any]]:
+        """
+        Resolve texts through the result cache, the pre-classifier and the model.
+
+        Each stage only sees what the previous one could not answer, and
+        duplicate texts are scored once.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            list: Sentiment results in input order
+        """
+        # 1. Result cache
+        if self.result_cache is not None:
+            results = await self.result_cache.get_many(texts)
+        else:
+            results = [None] * len(texts)
+
+        pending = list(dict.fromkeys(text for text, r in zip(texts, results) if r is None))
+        resolved: dict[str, dict[str, Any]] = {}
+
+        # 2. Cheap pre-classifier: keep confident labels, escalate the rest
+        if pending and self.pre_classifier is not None:
+            for text, result in zip(pending, self.pre_classifier.classify(pending)):
+                if result["score"] >= self.cascade_threshold:
+                    result["model_version"] = self.model_version
+                    resolved[text] = result
+            pending = [text for text in pending if text not in resolved]
+            self.stage_counts[STAGE_LEXICON] += len(resolved)
+
+        # 3. FinBERT for everything still unresolved (on the inference thread)
+        if pending:
+            probabilities = await self.inference_worker.run(self._predict_probs, pending)
+            scored = {text: self._to_result(probs) for text, probs in zip(pending, probabilities)}
+            resolved.update(scored)
+            self.stage_counts[STAGE_MODEL] += len(scored)
+
+            if self.result_cache is not None:
+                await self.result_cache.set_many(list(scored), list(scored.values()))
+
+        return [r if r is not None else dict(resolved[text]) for text, r in zip(texts, results)]
+
+    async def analyze_stream(
+        self,
+        texts: AsyncIterable[str],
+        batch_size: int | None = None,
+        max_in_flight: int | None = None,
+        max_wait_ms: float | None = None,
+        with_embeddings: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Analyze texts from an async iterable, yielding results as batches complete.
+
+        A reader task groups incoming texts into batches (flushed when full, or
+        when the source stalls for ``max_wait_ms``) and hands them over through
+        a queue of at most ``max_in_flight`` batches. When the queue is full the
+        reader stops pulling from the source, so memory stays bounded while
+        producing, tokenizing and inference overlap.
+
+        Args:
+            texts: Async iterable of texts
+            batch_size: Texts per batch (default: INFERENCE_BATCH_SIZE)
+            max_in_flight: Batches buffered ahead of inference (default: INFERENCE_STREAM_MAX_IN_FLIGHT)
+            max_wait_ms: Flush a partial batch after the source is idle this long
+            with_embeddings: Score every text with the model (no cache or
+                cascade) and yield ``SentimentView`` rows carrying an "embedding"
+
+        Yields:
+            dict: Sentiment result for each text, in input order
+        """
+        batch_size = batch_size or self.batch_size
+        max_wait = (
+            max_wait_ms if max_wait_ms is not None else config.INFERENCE_BATCH_WAIT_MS
+        ) / 1000
+        batches: asyncio.Queue = asyncio.Queue(
+            maxsize=max_in_flight or config.INFERENCE_STREAM_MAX_IN_FLIGHT
+        )
+        reader = asyncio.get_running_loop().create_task(
+            _read_batches(texts, batches, batch_size, max_wait)
+        )
+
+        try:
+            # The source is already being read while the model loads
+            if self.backend is None:
+                await self.load_model()
+
+            while True:
+                batch = await batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                if with_embeddings:
+                    results = await self.analyze_batch_array(batch, with_embeddings=True)
+                else:
+                    results = await self.analyze_batch(batch)
+                for result in results:
+                    yield result
+        finally:
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
+
+    def _predict_probs(self, texts: list[str]) -> np.ndarray:
+        """
+        Score texts on the active backend (see ``_predict``).
+
+        Args:
+            texts: Texts to score
+
+        Returns:
+            np.ndarray: Softmax probabilities of shape (len(texts), len(labels)), in input order
+        """
+        return self._predict(texts)[0]
+
+    def _predict(
+        self,
+        texts: list[str],
+        with_embeddings: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Tokenize texts and run length-bucketed forward passes on the active backend.
+
+        Texts are tokenized once without padding, sorted by token length and
+        split into buckets of at most ``batch_size``. Each bucket is padded only
+        to its own longest member, so short headlines are never padded to the
+        length of a long summary.
+
+        With adaptive max length enabled, texts above the batch's sequence cap
+        (a percentile of recent token lengths) are either scored with sliding
+        windows or truncated to the cap, depending on the overflow policy.
+
+        Args:
+            texts: Texts to score
+            with_embeddings: Also return pooled embeddings from the same passes
+
+        Returns:
+            tuple: (softmax probabilities of shape (len(texts), len(labels)),
+            float16 embeddings of shape (len(texts), hidden) or None), in input order
+        """
+        policy = self.sequence_length
+        encoded = self.tokenizer(
+            texts,
+            padding=False,
+            truncation=True,
+            max_length=policy.model_max_length,
+        )
+        features = _split_features(encoded)
+        lengths = np.array([len(feature["input_ids"]) for feature in features], dtype=np.int64)
+        policy.observe(lengths)
+
+        cap = policy.cap
+        over = np.flatnonzero(lengths > cap)
+        batch = {
+            "texts": len(texts),
+            "cap": cap,
+            "real_tokens": 0,
+            "padded_tokens": 0,
+            # Texts that filled the model context were cut by the tokenizer
+            "truncated_texts": int((lengths >= policy.model_max_length).sum()),
+            "truncated_tokens": 0,
+            "overflow_texts": int(over.size),
+        }
+
+        if not over.size:
+            outputs = self._forward(features, batch, with_embeddings)
+            policy.record_batch(batch)
+            return outputs
+
+        within = np.flatnonzero(lengths <= cap)
+        over_texts = [texts[i] for i in over]
+        parts = [(within, self._forward([features[i] for i in within], batch, with_embeddings))]
+
+        if policy.overflow == OVERFLOW_LONG_DOC:
+            parts.append((over, self._predict_documents(over_texts, batch, with_embeddings)))
+        else:
+            encoded = self.tokenizer(over_texts, padding=False, truncation=True, max_length=cap)
+            parts.append(
+                (over, self._forward(_split_features(encoded), batch, with_embeddings))
+            )
+            batch["truncated_texts"] += int((lengths[over] < policy.model_max_length).sum())
+            batch["truncated_tokens"] += int((lengths[over] - cap).sum())
+
+        policy.record_batch(batch)
+        return _merge_rows(len(texts), parts)
+
+    def _predict_documents(
+        self,
+        texts: list[str],
+        stats: dict[str, Any],
+        with_embeddings: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Score texts with sliding windows and aggregate each one to document probabilities.
+
+        Document embeddings are the window embeddings averaged with the same
+        weights as the probabilities.
+
+        Args:
+            texts: Texts longer than the current sequence cap
+            stats: Batch counters to add token counts to
+            with_embeddings: Also return pooled document embeddings
+
+        Returns:
+            tuple: (probabilities of shape (len(texts), len(labels)), embeddings or None)
+        """
+        (window_probs, window_embeddings), doc_index, token_counts, _ = self._predict_windows(
+            texts,
+            config.LONG_DOC_WINDOW_TOKENS,
+            config.LONG_DOC_STRIDE,
+            config.LONG_DOC_MAX_WINDOWS,
+            stats,
+            with_embeddings,
+        )
+        neutral_index = self.labels.index("neutral")
+
+        probabilities = np.empty((len(texts), len(self.labels)), dtype=np.float32)
+        embeddings = None
+        if window_embeddings is not None:
+            embeddings = np.empty((len(texts), window_embeddings.shape[1]), dtype=np.float16)
+
+        for doc in range(len(texts)):
+            rows = np.flatnonzero(doc_index == doc)
+            probabilities[doc], weights = aggregate_windows(
+                window_probs[rows],
+                token_counts[rows],
+                config.LONG_DOC_AGGREGATION,
+                neutral_index,
+            )
+            if embeddings is not None:
+                embeddings[doc] = weights @ window_embeddings[rows].astype(np.float32)
+        return probabilities, embeddings
+
+    def _predict_windows(
+        self,
+        texts: list[str],
+        window_tokens: int,
+        stride: int,
+        max_windows: int,
+        stats: dict[str, Any] | None = None,
+        with_embeddings: bool = False,
+    ) -> tuple[tuple[np.ndarray, np.ndarray | None], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Split texts into overlapping token windows and score them in shared batches.
+
+        Windows of all documents go through the same length buckets, so one
+        long article and many short ones still fill full batches.
+
+        Args:
+            texts: Documents to score
+            window_tokens: Tokens per window, including special tokens
+            stride: Tokens shared by consecutive windows
+            max_windows: Maximum windows scored per document
+            stats: Batch counters to add token counts to
+            with_embeddings: Also return pooled window embeddings
+
+        Returns:
+            tuple: ((window probabilities, window embeddings or None), document
+            index per window, real tokens per window, total windows per document
+            before capping)
+        """
+        encoded = self.tokenizer(
+            texts,
+            padding=False,
+            truncation=True,
+            max_length=window_tokens,
+            stride=stride,
+            return_overflowing_tokens=True,
+        )
+        doc_index = np.asarray(encoded["overflow_to_sample_mapping"])
+        features = _split_features(encoded)
+
+        keep = select_windows(doc_index, max_windows)
+        features = [features[i] for i in keep]
+        token_counts = np.array([len(feature["input_ids"]) for feature in features])
+
+        return (
+            self._forward(features, stats, with_embeddings),
+            doc_index[keep],
+            token_counts,
+            np.bincount(doc_index, minlength=len(texts)),
+        )
+
+    def _forward(
+        self,
+        features: list[dict[str, list[int]]],
+        stats: dict[str, Any] | None = None,
+        with_embeddings: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """
+        Run length-bucketed forward passes over pre-tokenized features.
+
+        Args:
+            features: Unpadded tokenizer features, one dict per sequence
+            stats: Batch counters; "real_tokens" and "padded_tokens" are added to
+            with_embeddings: Also collect pooled embeddings from the same passes
+
+        Returns:
+            tuple: (calibrated softmax probabilities of shape (len(features), len(labels)),
+            float16 embeddings of shape (len(features), hidden), or None when not
+            requested or the backend cannot return them)
+        """
+        lengths = [len(feature["input_ids"]) for feature in features]
+
+        probabilities = np.empty((len(features), len(self.labels)), dtype=np.float32)
+        embeddings = None
+        for bucket in bucket_by_length(lengths, self.batch_size):
+            inputs = self.tokenizer.pad(
+                [features[i] for i in bucket],
                 padding=True,
-                truncation=True,
-                max_length=512,
-            ).to(self.device)
+                return_tensors="np",
+            )
+            if with_embeddings:
+                logits, pooled = self.backend.predict(dict(inputs))
+                if pooled is not None:
+                    if embeddings is None:
+                        embeddings = np.empty((len(features), pooled.shape[1]), dtype=np.float16)
+                    embeddings[bucket] = pooled
+            else:
+                logits = self.backend.predict_logits(dict(inputs))
+            probabilities[bucket] = softmax(logits)
+
+            if stats is not None:
+                stats["real_tokens"] += sum(lengths[i] for i in bucket)
+                stats["padded_tokens"] += inputs["input_ids"].size
+
+        if self.calibrator is not None:
+            probabilities = self.calibrator.apply(probabilities)
+        return probabilities, embeddings
+
+    async def analyze_long_documents(
+        self,
+        texts: list[str],
+        aggregation: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Analyze documents longer than the model context with sliding windows.
+
+        Each document is split into overlapping windows (at most
+        LONG_DOC_MAX_WINDOWS, evenly spaced), windows of all documents are
+        scored in shared batches, and window probabilities are aggregated per
+        document.
+
+        Args:
+            texts: Documents to analyze
+            aggregation: "mean", "max_confidence" or "attention" (default: LONG_DOC_AGGREGATION)
+
+        Returns:
+            list: Sentiment results with an extra "windows" breakdown per document
+        """
+        aggregation = aggregation or config.LONG_DOC_AGGREGATION
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(
+                f"Unknown aggregation '{aggregation}'. Supported: {', '.join(AGGREGATIONS)}"
+            )
 
-            # Run inference
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                predictions = torch.nn.functional.softmax(outputs.logits, dim=-1)
+        if self.backend is None:
+            await self.load_model()
+
+        if not texts:
+            return []
+
+        try:
+            windows = await self.inference_worker.run(
+                self._predict_windows,
+                texts,
+                config.LONG_DOC_WINDOW_TOKENS,
+                config.LONG_DOC_STRIDE,
+                config.LONG_DOC_MAX_WINDOWS,
+            )
+            (probabilities, _), doc_index, token_counts, total_windows = windows
+            neutral_index = self.labels.index("neutral")
 
-            # Process results
             results = []
-            probabilities_np = predictions.cpu().numpy()
-
-            for probs in probabilities_np:
-                predicted_class = probs.argmax()
-                confidence = float(probs[predicted_class])
-
-                result = {
-                    "label": self.labels[predicted_class],
-                    "score": confidence,
-                    "probabilities": {
-                        label: float(prob) for label, prob in zip(self.labels, probs)
-                    },
-                }
+            for doc in range(len(texts)):
+                rows = np.flatnonzero(doc_index == doc)
+                doc_probs, weights = aggregate_windows(
+                    probabilities[rows], token_counts[rows], aggregation, neutral_index
+                )
+                result = self._to_result(doc_probs)
+                result["aggregation"] = aggregation
+                result["windows_total"] = int(total_windows[doc])
+                result["windows"] = [
+                    {
+                        **self._to_result(probabilities[row]),
+                        "tokens": int(token_counts[row]),
+                        "weight": float(weight),
+                    }
+                    for row, weight in zip(rows, weights)
+                ]
                 results.append(result)
 
-            logger.info(f"✅ Batch analysis complete: {len(results)} results")
+            logger.info(
+                f"✅ Long-document analysis complete: {len(texts)} documents, "
+                f"{len(doc_index)} windows"
+            )
             return results
 
         except Exception as e:
-            logger.error(f"Error in batch analysis: {e}")
-            # Return neutral sentiment for all on error
+            logger.error(f"Error in long-document analysis: {e}")
             return [{"label": "neutral", "score": 0.33, "probabilities": {}} for _ in texts]
 
+    def _to_result(self, probabilities: np.ndarray) -> dict[str, Any]:
+        """Convert one row of probabilities into a sentiment result dict."""
+        predicted_class = int(probabilities.argmax())
+        return {
+            "label": self.labels[predicted_class],
+            "score": float(probabilities[predicted_class]),
+            "probabilities": {
+                label: float(prob) for label, prob in zip(self.labels, probabilities)
+            },
+            "stage": STAGE_MODEL,
+            "model_version": self.model_version,
+        }
+
     def get_model_info(self) -> dict[str, Any]:
         """Get information about the loaded model."""
         return {
             "model_name": self.model_name,
+            "model_version": self.model_version,
             "device": self.device,
+            "backend": self.backend.get_info() if self.backend else self.backend_name,
             "batch_size": self.batch_size,
-            "loaded": self.model is not None,
+            "loaded": self.backend is not None,
+            "warmed_up": self.warmed_up,
             "labels": self.labels,
+            "result_cache": self.result_cache.get_stats() if self.result_cache else None,
+            "inference_queue": self.inference_worker.get_stats(),
+            "sequence_length": self.sequence_length.get_stats(),
+            "runtime_profile": self.runtime_profile.get_info(),
+            "calibration": self.calibrator.get_info() if self.calibrator else None,
+            "cascade": {
+                "enabled": self.pre_classifier is not None,
+                "threshold": self.cascade_threshold,
+                "stage_counts": dict(self.stage_counts),
+            },
         }
 
 
-# Global sentiment analyzer instance
-_sentiment_analyzer = None
+async def _read_batches(
+    texts: AsyncIterable[str],
+    batches: asyncio.Queue,
+    batch_size: int,
+    max_wait: float,
+) -> None:
+    """
+    Group an async stream of texts into batches on a bounded queue.
+
+    Puts ``None`` when the stream ends, or the exception if the source fails.
+
+    Args:
+        texts: Source stream
+        batches: Bounded output queue (``put`` blocks when full: backpressure)
+        batch_size: Flush when a batch reaches this size
+        max_wait: Flush a partial batch after the source is idle this many seconds
+    """
+    iterator = aiter(texts)
+    batch: list[str] = []
+    next_text: asyncio.Future | None = None
+
+    try:
+        while True:
+            if next_text is None:
+                next_text = asyncio.ensure_future(anext(iterator))
+
+            # Keep the pending read alive across timeouts; only flush what we have
+            done, _ = await asyncio.wait({next_text}, timeout=max_wait if batch else None)
+            if not done:
+                await batches.put(batch)
+                batch = []
+                continue
+
+            try:
+                text = next_text.result()
+            except StopAsyncIteration:
+                break
+            finally:
+                next_text = None
+
+            batch.append(text)
+            if len(batch) >= batch_size:
+                await batches.put(batch)
+                batch = []
+
+        if batch:
+            await batches.put(batch)
+        await batches.put(None)
+
+    except asyncio.CancelledError:
+        if next_text is not None:
+            next_text.cancel()
+        raise
+    except Exception as e:
+        logger.error(f"Error reading sentiment stream: {e}")
+        await batches.put(e)
+
+
+def _split_features(encoded: Any) -> list[dict[str, list[int]]]:
+    """Split batched tokenizer output into per-sequence model inputs."""
+    keys = [key for key in encoded.keys() if key != "overflow_to_sample_mapping"]
+    count = len(encoded["input_ids"])
+    return [{key: encoded[key][i] for key in keys} for i in range(count)]
+
+
+def _merge_rows(
+    count: int,
+    parts: list[tuple[np.ndarray, tuple[np.ndarray, np.ndarray | None]]],
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """
+    Scatter (probabilities, embeddings) computed for subsets back into input order.
+
+    Args:
+        count: Total number of rows
+        parts: (row indices, (probabilities, embeddings or None)) per subset
+
+    Returns:
+        tuple: (probabilities, embeddings or None if any subset has none)
+    """
+    probabilities = np.empty((count, parts[0][1][0].shape[1]), dtype=np.float32)
+    for rows, (probs, _) in parts:
+        probabilities[rows] = probs
+
+    embedded = [(rows, emb) for rows, (_, emb) in parts if len(rows)]
+    if any(emb is None for _, emb in embedded):
+        return probabilities, None
+
+    embeddings = np.empty((count, embedded[0][1].shape[1]), dtype=np.float16)
+    for rows, emb in embedded:
+        embeddings[rows] = emb
+    return probabilities, embeddings
+
+
+def bucket_by_length(lengths: list[int], max_bucket_size: int) -> list[list[int]]:
+    """
+    Group item indices into buckets of similar length.
+
+    Args:
+        lengths: Token length of each item
+        max_bucket_size: Maximum items per bucket
+
+    Returns:
+        list: Buckets of original indices, shortest items first
+    """
+    order = sorted(range(len(lengths)), key=lengths.__getitem__)
+    return [order[i : i + max_bucket_size] for i in range(0, len(order), max_bucket_size)]
+
+
+# Global sentiment analyzer and micro-batcher instances
+_model_registry = ModelRegistry(SentimentAnalyzer)
+_micro_batcher = None
+_warmup_task: asyncio.Task | None = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get the global model registry.
+
+    Returns:
+        ModelRegistry: Registry holding the active analyzer
+    """
+    return _model_registry
 
 
 async def get_sentiment_analyzer() -> SentimentAnalyzer:
     """
-    Get or create the global sentiment analyzer instance.
+    Get the active sentiment analyzer from the model registry.
+
+    Returns:
+        SentimentAnalyzer: Active analyzer (changes when a new model version is swapped in)
+    """
+    return await _model_registry.get_active()
+
+
+def _on_model_swap(analyzer: SentimentAnalyzer) -> None:
+    """Point the micro-batcher at the newly active analyzer."""
+    if _micro_batcher is not None:
+        _micro_batcher.analyzer = analyzer
+
+
+_model_registry.add_listener(_on_model_swap)
+
+
+async def get_micro_batcher() -> MicroBatcher:
+    """
+    Get or create the global micro-batcher wrapping the global analyzer.
 
     Returns:
-        SentimentAnalyzer: Global analyzer instance
+        MicroBatcher: Global micro-batcher instance
+    """
+    global _micro_batcher
+    if _micro_batcher is None:
+        analyzer = await get_sentiment_analyzer()
+        # Re-check: another caller may have created it while the model loaded
+        if _micro_batcher is None:
+            _micro_batcher = MicroBatcher(analyzer)
+    return _micro_batcher
+
+
+def start_background_warmup() -> asyncio.Task:
     """
-    global _sentiment_analyzer
-    if _sentiment_analyzer is None:
-        _sentiment_analyzer = SentimentAnalyzer()
-        await _sentiment_analyzer.load_model()
-    return _sentiment_analyzer
+    Start loading and warming up the global analyzer without blocking the caller.
+
+    Safe to call more than once; the same task is returned. Failures are
+    logged and do not propagate, so service readiness is never tied to the
+    model being available.
+
+    Returns:
+        asyncio.Task: The warm-up task
+    """
+    global _warmup_task
+    if _warmup_task is None:
+        _warmup_task = asyncio.get_running_loop().create_task(_warmup_global_analyzer())
+    return _warmup_task
+
+
+async def _warmup_global_analyzer() -> None:
+    """Warm up the global analyzer, logging rather than raising on failure."""
+    try:
+        analyzer = await get_sentiment_analyzer()
+        await analyzer.warmup()
+        logger.info("✅ Sentiment model warm-up complete")
+    except Exception as e:
+        logger.error(f"❌ Sentiment model warm-up failed: {e}")
+
+
+def get_inference_queue_stats() -> dict[str, Any] | None:
+    """
+    Get inference queue depth and wait times of the global analyzer.
+
+    Returns:
+        dict | None: Queue statistics, or None if no analyzer was created yet
+    """
+    analyzer = _model_registry.active
+    if analyzer is None:
+        return None
+    return analyzer.inference_worker.get_stats()
+
+
+def get_warmup_status() -> str:
+    """
+    Get the state of the background warm-up.
+
+    Returns:
+        str: "not_started", "running", "ready" or "failed"
+    """
+    if _warmup_task is None:
+        return "not_started"
+    if not _warmup_task.done():
+        return "running"
+    analyzer = _model_registry.active
+    if analyzer is not None and analyzer.warmed_up:
+        return "ready"
+    return "failed"
 
 
 async def analyze_sentiment(text: str) -> dict[str, Any]:
     """
     Analyze sentiment of a single text (convenience function).
 
+    Concurrent callers are coalesced into shared batches by the global
+    micro-batcher, so bursts of single-text calls cost one forward pass
+    per batch instead of one per text.
+
     Args:
         text: Text to analyze
 
     Returns:
         dict: Sentiment result
     """
-    analyzer = await get_sentiment_analyzer()
-    return await analyzer.analyze_text(text)
+    batcher = await get_micro_batcher()
+    return await batcher.analyze(text)
 
 
 async def analyze_sentiments_batch(texts: list[str]) -> list[dict[str, Any]]:
@@ -220,6 +916,57 @@ async def analyze_sentiments_batch(texts: list[str]) -> list[dict[str, Any]]:
     return await analyzer.analyze_batch(texts)
 
 
+async def analyze_stream(
+    texts: AsyncIterable[str],
+    with_embeddings: bool = False,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Analyze an async stream of texts with the global analyzer (convenience function).
+
+    Args:
+        texts: Async iterable of texts
+        with_embeddings: Also yield pooled sentence embeddings
+
+    Yields:
+        dict: Sentiment result for each text, in input order
+    """
+    analyzer = await get_sentiment_analyzer()
+    async for result in analyzer.analyze_stream(texts, with_embeddings=with_embeddings):
+        yield result
+
+
+async def embed_texts(texts: list[str]) -> SentimentBatch:
+    """
+    Score texts and keep their pooled embeddings (convenience function).
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        SentimentBatch: Results with ``embeddings`` set (None if the backend has none)
+    """
+    analyzer = await get_sentiment_analyzer()
+    return await analyzer.analyze_batch_array(texts, with_embeddings=True)
+
+
+async def analyze_long_documents(
+    texts: list[str],
+    aggregation: str | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Analyze long documents with sliding windows (convenience function).
+
+    Args:
+        texts: Documents to analyze
+        aggregation: Window aggregation method (default: LONG_DOC_AGGREGATION)
+
+    Returns:
+        list: Sentiment results with per-window breakdowns
+    """
+    analyzer = await get_sentiment_analyzer()
+    return await analyzer.analyze_long_documents(texts, aggregation)
+
+
 async def main() -> None:
     """Main entry point for testing."""
     from packages.shared.logging_config import setup_logging
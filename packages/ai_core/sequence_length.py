@@ -0,0 +1,160 @@
+"""
+AUREX.AI - Adaptive Sequence Length.
+
+This module tracks a running histogram of token lengths and picks the
+sequence cap for each batch from a configurable percentile, so headlines are
+never tokenized and attended at the model's full 512-token context. It also
+keeps padding and truncation metrics per batch.
+"""
+
+import threading
+from typing import Any
+
+import numpy as np
+
+from packages.shared.config import config
+
+OVERFLOW_LONG_DOC = "long_doc"  # Score texts above the cap with sliding windows
+OVERFLOW_TRUNCATE = "truncate"  # Cut texts above the cap
+OVERFLOW_POLICIES = (OVERFLOW_LONG_DOC, OVERFLOW_TRUNCATE)
+
+
+class AdaptiveMaxLength:
+    """Running token-length histogram with a percentile-based sequence cap."""
+
+    def __init__(
+        self,
+        model_max_length: int | None = None,
+        enabled: bool | None = None,
+        percentile: float | None = None,
+        min_length: int | None = None,
+        min_samples: int | None = None,
+        overflow: str | None = None,
+        round_to: int = 8,
+        max_count: int = 100_000,
+    ) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            model_max_length: Model context limit (default: INFERENCE_MAX_LENGTH)
+            enabled: Cap batches at the percentile (default: ADAPTIVE_MAX_LENGTH_ENABLED)
+            percentile: Length percentile used as the cap (default: ADAPTIVE_MAX_LENGTH_PERCENTILE)
+            min_length: Lower bound of the cap (default: ADAPTIVE_MAX_LENGTH_MIN)
+            min_samples: Lengths observed before the cap drops below the model
+                limit (default: ADAPTIVE_MAX_LENGTH_MIN_SAMPLES)
+            overflow: "long_doc" or "truncate" for texts above the cap
+                (default: ADAPTIVE_MAX_LENGTH_OVERFLOW)
+            round_to: Round the cap up to a multiple of this
+            max_count: Halve the histogram past this many samples, so it follows drift
+        """
+        self.model_max_length = model_max_length or config.INFERENCE_MAX_LENGTH
+        self.enabled = config.ADAPTIVE_MAX_LENGTH_ENABLED if enabled is None else enabled
+        self.percentile = percentile or config.ADAPTIVE_MAX_LENGTH_PERCENTILE
+        self.min_length = min_length or config.ADAPTIVE_MAX_LENGTH_MIN
+        self.min_samples = (
+            config.ADAPTIVE_MAX_LENGTH_MIN_SAMPLES if min_samples is None else min_samples
+        )
+        self.overflow = overflow or config.ADAPTIVE_MAX_LENGTH_OVERFLOW
+        if self.overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{self.overflow}'. "
+                f"Supported: {', '.join(OVERFLOW_POLICIES)}"
+            )
+        self.round_to = round_to
+        self.max_count = max_count
+
+        self._counts = np.zeros(self.model_max_length + 1, dtype=np.int64)
+        self._lock = threading.Lock()
+        self.last_batch: dict[str, Any] | None = None
+        self.totals = {
+            "batches": 0,
+            "texts": 0,
+            "real_tokens": 0,
+            "padded_tokens": 0,
+            "truncated_texts": 0,
+            "truncated_tokens": 0,
+            "overflow_texts": 0,
+        }
+
+    @property
+    def samples(self) -> int:
+        """Lengths currently in the histogram."""
+        return int(self._counts.sum())
+
+    def observe(self, lengths: np.ndarray) -> None:
+        """
+        Add token lengths to the histogram.
+
+        Args:
+            lengths: Token length per text (values above the model limit are clipped)
+        """
+        clipped = np.minimum(np.asarray(lengths, dtype=np.int64), self.model_max_length)
+        with self._lock:
+            self._counts += np.bincount(clipped, minlength=len(self._counts))
+            if self._counts.sum() > self.max_count:
+                self._counts //= 2
+
+    def length_at_percentile(self, percentile: float) -> int:
+        """
+        Get the smallest length covering ``percentile`` percent of observed texts.
+
+        Args:
+            percentile: Percentile in (0, 100]
+
+        Returns:
+            int: Token length (the model limit when nothing was observed)
+        """
+        with self._lock:
+            cumulative = np.cumsum(self._counts)
+        if cumulative[-1] == 0:
+            return self.model_max_length
+        return int(np.searchsorted(cumulative, cumulative[-1] * percentile / 100))
+
+    @property
+    def cap(self) -> int:
+        """Sequence cap for the next batch."""
+        if not self.enabled or self.samples < self.min_samples:
+            return self.model_max_length
+        length = self.length_at_percentile(self.percentile)
+        length = -(-length // self.round_to) * self.round_to
+        return int(min(max(length, self.min_length), self.model_max_length))
+
+    def record_batch(self, batch: dict[str, Any]) -> None:
+        """
+        Record padding and truncation counts of one scored batch.
+
+        Args:
+            batch: {"texts", "cap", "real_tokens", "padded_tokens", "truncated_texts",
+                "truncated_tokens", "overflow_texts"}
+        """
+        padded = batch["padded_tokens"]
+        batch["padding_ratio"] = 1 - batch["real_tokens"] / padded if padded else 0.0
+        with self._lock:
+            self.last_batch = batch
+            self.totals["batches"] += 1
+            for key in self.totals.keys() - {"batches"}:
+                self.totals[key] += batch[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get the current cap, percentiles and padding/truncation totals."""
+        with self._lock:
+            totals = dict(self.totals)
+            last_batch = dict(self.last_batch) if self.last_batch else None
+        padded = totals["padded_tokens"]
+        return {
+            "enabled": self.enabled,
+            "overflow": self.overflow,
+            "percentile": self.percentile,
+            "cap": self.cap,
+            "samples": self.samples,
+            "p50": self.length_at_percentile(50),
+            "p95": self.length_at_percentile(95),
+            "p99": self.length_at_percentile(99),
+            "padding_ratio": 1 - totals["real_tokens"] / padded if padded else 0.0,
+            "truncation_rate": (
+                totals["truncated_texts"] / totals["texts"] if totals["texts"] else 0.0
+            ),
+            "totals": totals,
+            "last_batch": last_batch,
+        }
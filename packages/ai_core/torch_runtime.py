@@ -0,0 +1,180 @@
+"""
+AUREX.AI - Torch Runtime Profile.
+
+This module pins torch's intra/inter-op thread pools, picks the autograd
+context used for forward passes, and optionally applies a fast path
+(``torch.compile`` or BetterTransformer) to the loaded model. A fast path
+that fails to apply, or fails on its first forward pass, falls back to the
+eager model and records why, so profiles can be A/B tested on real nodes.
+"""
+
+import contextlib
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+from packages.shared.config import config
+
+FAST_PATH_NONE = "none"
+FAST_PATH_COMPILE = "compile"
+FAST_PATH_BETTERTRANSFORMER = "bettertransformer"
+FAST_PATHS = (FAST_PATH_NONE, FAST_PATH_COMPILE, FAST_PATH_BETTERTRANSFORMER)
+
+# Thread pools are process-wide and the inter-op pool can only be sized once
+_threads_lock = threading.Lock()
+_applied_threads: tuple[int, int] | None = None
+
+
+class TorchRuntimeProfile:
+    """Thread, autograd and fast-path settings for torch inference."""
+
+    def __init__(
+        self,
+        intra_op_threads: int | None = None,
+        inter_op_threads: int | None = None,
+        inference_mode: bool | None = None,
+        fast_path: str | None = None,
+        compile_mode: str | None = None,
+    ) -> None:
+        """
+        Initialize the profile.
+
+        Args:
+            intra_op_threads: Threads per operator, 0 = torch default
+                (default: TORCH_INTRA_OP_THREADS)
+            inter_op_threads: Threads running independent operators, 0 = torch
+                default (default: TORCH_INTER_OP_THREADS)
+            inference_mode: Use ``torch.inference_mode`` instead of ``no_grad``
+                (default: TORCH_INFERENCE_MODE)
+            fast_path: "none", "compile" or "bettertransformer" (default: TORCH_FAST_PATH)
+            compile_mode: ``torch.compile`` mode (default: TORCH_COMPILE_MODE)
+        """
+        self.intra_op_threads = (
+            config.TORCH_INTRA_OP_THREADS if intra_op_threads is None else intra_op_threads
+        )
+        self.inter_op_threads = (
+            config.TORCH_INTER_OP_THREADS if inter_op_threads is None else inter_op_threads
+        )
+        self.inference_mode = (
+            config.TORCH_INFERENCE_MODE if inference_mode is None else inference_mode
+        )
+        self.fast_path = (fast_path or config.TORCH_FAST_PATH).lower()
+        if self.fast_path not in FAST_PATHS:
+            raise ValueError(
+                f"Unknown torch fast path '{self.fast_path}'. Supported: {', '.join(FAST_PATHS)}"
+            )
+        self.compile_mode = compile_mode or config.TORCH_COMPILE_MODE
+
+        # What actually took effect
+        self.active_fast_path = FAST_PATH_NONE
+        self.fallback_reason: str | None = None
+        self.threads: tuple[int, int] | None = None
+
+    def apply_threads(self) -> None:
+        """Size torch's thread pools (once per process; later profiles keep the first sizing)."""
+        global _applied_threads
+
+        import torch
+
+        with _threads_lock:
+            if _applied_threads is None:
+                if self.intra_op_threads > 0:
+                    torch.set_num_threads(self.intra_op_threads)
+                if self.inter_op_threads > 0:
+                    try:
+                        torch.set_num_interop_threads(self.inter_op_threads)
+                    except RuntimeError as e:  # Parallel work already started
+                        logger.warning(f"Cannot resize torch inter-op pool: {e}")
+                _applied_threads = (torch.get_num_threads(), torch.get_num_interop_threads())
+            self.threads = _applied_threads
+
+    def grad_context(self) -> contextlib.AbstractContextManager:
+        """Autograd context for forward passes."""
+        import torch
+
+        return torch.inference_mode() if self.inference_mode else torch.no_grad()
+
+    def optimize(self, model: Any) -> Any:
+        """
+        Apply the configured fast path to a loaded model.
+
+        Args:
+            model: Eager model in eval mode
+
+        Returns:
+            Model to run (the eager model if the fast path is unavailable)
+        """
+        if self.fast_path == FAST_PATH_NONE:
+            return model
+
+        try:
+            if self.fast_path == FAST_PATH_COMPILE:
+                import torch
+
+                # dynamic=True: length buckets produce a new sequence length per batch
+                optimized = torch.compile(model, mode=self.compile_mode, dynamic=True)
+            else:
+                optimized = model.to_bettertransformer()
+        except Exception as e:
+            return self.fall_back(model, e)
+
+        self.active_fast_path = self.fast_path
+        logger.info(f"✅ Torch fast path enabled: {self.fast_path}")
+        return optimized
+
+    def fall_back(self, model: Any, error: Exception) -> Any:
+        """
+        Record a fast-path failure and return the eager model.
+
+        Args:
+            model: Eager model
+            error: Why the fast path failed
+
+        Returns:
+            The eager model
+        """
+        self.active_fast_path = FAST_PATH_NONE
+        self.fallback_reason = f"{self.fast_path}: {type(error).__name__}: {error}"
+        logger.warning(f"Torch fast path {self.fast_path} unavailable, using eager model: {error}")
+        return model
+
+    def run(self, model: Any, eager_model: Any, forward: Callable[[Any], Any]) -> tuple[Any, Any]:
+        """
+        Run a forward pass, falling back to the eager model if the fast path fails.
+
+        Compiled models only fail when first called, so the fallback has to
+        happen at forward time as well as at load time.
+
+        Args:
+            model: Model currently in use (possibly optimized)
+            eager_model: Unoptimized model
+            forward: Runs the forward pass on a given model
+
+        Returns:
+            tuple: (forward output, model to use from now on)
+        """
+        with self.grad_context():
+            if model is eager_model:
+                return forward(model), model
+            try:
+                return forward(model), model
+            except Exception as e:
+                model = self.fall_back(eager_model, e)
+                return forward(model), model
+
+    def get_info(self) -> dict[str, Any]:
+        """Get requested and effective settings."""
+        return {
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+            "effective_threads": (
+                {"intra_op": self.threads[0], "inter_op": self.threads[1]} if self.threads else None
+            ),
+            "inference_mode": self.inference_mode,
+            "fast_path": self.fast_path,
+            "active_fast_path": self.active_fast_path,
+            "compile_mode": self.compile_mode if self.fast_path == FAST_PATH_COMPILE else None,
+            "fallback_reason": self.fallback_reason,
+        }
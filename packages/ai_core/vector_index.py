@@ -0,0 +1,262 @@
+"""
+AUREX.AI - In-Process Embedding Index.
+
+This module keeps FinBERT sentence embeddings of past articles in one
+L2-normalized float16 matrix and answers k-nearest-neighbour queries with a
+blocked matrix product and ``argpartition``. It needs no second model and no
+external vector database; at 768 dimensions each article costs 1.5 KB.
+"""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from loguru import logger
+
+from packages.shared.config import config
+
+# Rows scored per matrix product, bounding the float32 scratch space of a search
+SEARCH_BLOCK_ROWS = 65_536
+
+
+def normalize(embeddings: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize embeddings so dot products are cosine similarities.
+
+    Args:
+        embeddings: Array of shape (n, dim) or (dim,)
+
+    Returns:
+        np.ndarray: float32 unit vectors with the same shape
+    """
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+class EmbeddingIndex:
+    """Brute-force cosine kNN over a growing float16 embedding matrix."""
+
+    def __init__(
+        self,
+        model_version: str | None = None,
+        max_items: int | None = None,
+    ) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            model_version: Version of the model producing the embeddings
+                (embeddings of different versions are not comparable)
+            max_items: Keep at most this many articles, dropping the oldest
+                (default: EMBEDDING_INDEX_MAX_ITEMS)
+        """
+        self.model_version = model_version
+        self.max_items = max_items or config.EMBEDDING_INDEX_MAX_ITEMS
+        self._matrix: np.ndarray | None = None  # (capacity, dim), first len(self) rows used
+        self._timestamps = np.empty(0, dtype=np.float64)
+        self._ids: list[str] = []
+        self._rows: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        """Number of indexed articles."""
+        return len(self._ids)
+
+    @property
+    def dim(self) -> int | None:
+        """Embedding dimension (None while empty)."""
+        return None if self._matrix is None else self._matrix.shape[1]
+
+    def add(
+        self,
+        ids: list[Any],
+        embeddings: np.ndarray,
+        timestamps: list[float] | None = None,
+    ) -> None:
+        """
+        Add or replace article embeddings.
+
+        Args:
+            ids: Article ids
+            embeddings: Embeddings of shape (len(ids), dim)
+            timestamps: Publication times (Unix seconds, default: now)
+        """
+        if not len(ids):
+            return
+
+        vectors = normalize(embeddings).astype(np.float16)
+        if timestamps is None:
+            timestamps = [time.time()] * len(ids)
+        if self._matrix is None:
+            self._matrix = np.empty((0, vectors.shape[1]), dtype=np.float16)
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Expected {self.dim}-dim embeddings, got {vectors.shape[1]}")
+
+        for article_id, vector, ts in zip(map(str, ids), vectors, timestamps):
+            row = self._rows.get(article_id)
+            if row is None:
+                row = len(self._ids)
+                self._reserve(row + 1)
+                self._ids.append(article_id)
+                self._rows[article_id] = row
+            self._matrix[row] = vector
+            self._timestamps[row] = ts
+
+        if len(self) > self.max_items:
+            self._evict_oldest(len(self) - self.max_items)
+
+    def _reserve(self, size: int) -> None:
+        """Grow the backing arrays geometrically to hold ``size`` rows."""
+        capacity = len(self._matrix)
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2, 1024)
+        matrix = np.empty((capacity, self._matrix.shape[1]), dtype=np.float16)
+        matrix[: len(self)] = self._matrix[: len(self)]
+        timestamps = np.empty(capacity, dtype=np.float64)
+        timestamps[: len(self)] = self._timestamps[: len(self)]
+        self._matrix, self._timestamps = matrix, timestamps
+
+    def _evict_oldest(self, count: int) -> None:
+        """Drop the ``count`` oldest articles and compact the arrays."""
+        size = len(self)
+        keep = np.sort(np.argsort(self._timestamps[:size], kind="stable")[count:])
+        self._matrix = self._matrix[keep]
+        self._timestamps = self._timestamps[keep]
+        self._ids = [self._ids[i] for i in keep]
+        self._rows = {article_id: row for row, article_id in enumerate(self._ids)}
+
+    def get(self, article_id: Any) -> np.ndarray | None:
+        """
+        Get an article's stored (normalized) embedding.
+
+        Args:
+            article_id: Article id
+
+        Returns:
+            np.ndarray: float16 vector, or None if not indexed
+        """
+        row = self._rows.get(str(article_id))
+        return None if row is None else self._matrix[row]
+
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude: set[Any] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Find the k most similar articles to a query embedding.
+
+        Args:
+            query: Query embedding of shape (dim,)
+            k: Number of neighbours
+            exclude: Article ids to leave out (e.g. the query article itself)
+
+        Returns:
+            list: (article id, cosine similarity) pairs, most similar first
+        """
+        if not len(self) or k <= 0:
+            return []
+
+        exclude_rows = [self._rows[str(i)] for i in exclude or () if str(i) in self._rows]
+        scores = np.empty(len(self), dtype=np.float32)
+        q = normalize(query)
+        for start in range(0, len(self), SEARCH_BLOCK_ROWS):
+            block = self._matrix[start : min(start + SEARCH_BLOCK_ROWS, len(self))]
+            scores[start : start + len(block)] = block.astype(np.float32) @ q
+        scores[exclude_rows] = -np.inf
+
+        k = min(k, len(self) - len(exclude_rows))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self._ids[row], float(scores[row])) for row in top]
+
+    def save(self, path: str | Path | None = None) -> None:
+        """
+        Persist the index atomically (readers never see a partial file).
+
+        Args:
+            path: Destination ``.npz`` path (default: EMBEDDING_INDEX_PATH)
+        """
+        path = Path(path or config.EMBEDDING_INDEX_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        size = len(self)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                ids=np.array(self._ids, dtype=str),
+                embeddings=(self._matrix[:size] if size else np.empty((0, 0), dtype=np.float16)),
+                timestamps=self._timestamps[:size],
+                model_version=np.array(self.model_version or ""),
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path | None = None,
+        model_version: str | None = None,
+    ) -> "EmbeddingIndex":
+        """
+        Load a persisted index, or return an empty one if missing or incompatible.
+
+        Args:
+            path: Source ``.npz`` path (default: EMBEDDING_INDEX_PATH)
+            model_version: Expected model version (None = accept any)
+
+        Returns:
+            EmbeddingIndex: Loaded index
+        """
+        path = Path(path or config.EMBEDDING_INDEX_PATH)
+        index = cls(model_version=model_version)
+        if not path.exists():
+            return index
+
+        try:
+            data = np.load(path)
+            stored_version = str(data["model_version"]) or None
+            if model_version is not None and stored_version != model_version:
+                logger.warning(
+                    f"Embedding index {path} was built with {stored_version}, starting fresh"
+                )
+                return index
+            index.model_version = stored_version
+            if len(data["ids"]):
+                index._ids = [str(article_id) for article_id in data["ids"]]
+                index._rows = {article_id: row for row, article_id in enumerate(index._ids)}
+                index._matrix = np.array(data["embeddings"], dtype=np.float16)
+                index._timestamps = np.array(data["timestamps"], dtype=np.float64)
+            logger.info(f"Loaded embedding index with {len(index)} articles from {path}")
+        except Exception as e:
+            logger.error(f"Error loading embedding index {path}: {e}")
+            return cls(model_version=model_version)
+
+        return index
+
+
+# Read-side index shared by API requests, reloaded when the pipeline rewrites the file
+_embedding_index: EmbeddingIndex | None = None
+_embedding_index_mtime: float | None = None
+
+
+def get_embedding_index() -> EmbeddingIndex:
+    """
+    Get the persisted embedding index, reloading it if the file changed.
+
+    Returns:
+        EmbeddingIndex: Current index (empty if nothing has been persisted)
+    """
+    global _embedding_index, _embedding_index_mtime
+
+    path = Path(config.EMBEDDING_INDEX_PATH)
+    mtime = path.stat().st_mtime if path.exists() else None
+    if _embedding_index is None or mtime != _embedding_index_mtime:
+        _embedding_index = EmbeddingIndex.load(path)
+        _embedding_index_mtime = mtime
+    return _embedding_index
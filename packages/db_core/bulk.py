@@ -0,0 +1,367 @@
+"""
+AUREX.AI - Bulk Database Writes.
+
+Set-based helpers for writing many rows at once without building one ORM
+object or parameter dict per row.
+"""
+
+import time
+from collections.abc import Sequence
+from datetime import datetime
+from hashlib import md5
+from typing import Any
+
+from loguru import logger
+from sqlalchemy import Table, bindparam, func, insert, literal_column, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import News
+
+# PostgreSQL's bind parameter limit per statement (multi-row INSERT fallback)
+_PG_MAX_PARAMS = 32767
+
+# One statement for the whole batch: the columns travel as array parameters
+_PG_UPDATE_NEWS_SENTIMENT = text(
+    """
+    UPDATE news
+    SET sentiment_label = v.label,
+        sentiment_score = v.score,
+        sentiment_model_version = v.model_version,
+        sentiment_relevance = v.relevance
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:labels AS varchar[]),
+        CAST(:scores AS double precision[]),
+        CAST(:model_versions AS varchar[]),
+        CAST(:relevances AS double precision[])
+    ) AS v(id, label, score, model_version, relevance)
+    WHERE news.id = v.id
+    """
+)
+
+
+async def update_news_sentiment(
+    session: AsyncSession,
+    ids: Sequence[Any],
+    columns: dict[str, Sequence[Any]],
+) -> int:
+    """
+    Write sentiment labels and scores for many news rows.
+
+    On PostgreSQL this is a single ``UPDATE ... FROM unnest(...)`` with the
+    columns bound as arrays; other dialects fall back to an executemany.
+
+    Args:
+        session: Open database session
+        ids: News ids
+        columns: {"sentiment_label": [...], "sentiment_score": [...],
+            "sentiment_model_version": [...], "sentiment_relevance": [...]}
+            aligned with ``ids`` (e.g. ``SentimentBatch.to_columns()``); the
+            last two are optional and default to NULL
+
+    Returns:
+        int: Number of rows written
+    """
+    if not len(ids):
+        return 0
+
+    labels = columns["sentiment_label"]
+    scores = columns["sentiment_score"]
+    model_versions = columns.get("sentiment_model_version") or [None] * len(ids)
+    relevances = columns.get("sentiment_relevance") or [None] * len(ids)
+    connection = await session.connection()
+
+    if connection.dialect.name == "postgresql":
+        await session.execute(
+            _PG_UPDATE_NEWS_SENTIMENT,
+            {
+                "ids": list(ids),
+                "labels": list(labels),
+                "scores": list(scores),
+                "model_versions": list(model_versions),
+                "relevances": list(relevances),
+            },
+        )
+    else:
+        table = News.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("news_id"))
+            .values(
+                sentiment_label=bindparam("label"),
+                sentiment_score=bindparam("score"),
+                sentiment_model_version=bindparam("model_version"),
+                sentiment_relevance=bindparam("relevance"),
+            )
+        )
+        await connection.execute(
+            statement,
+            [
+                {
+                    "news_id": news_id,
+                    "label": label,
+                    "score": score,
+                    "model_version": version,
+                    "relevance": relevance,
+                }
+                for news_id, label, score, version, relevance in zip(
+                    ids, labels, scores, model_versions, relevances
+                )
+            ],
+        )
+
+    return len(ids)
+
+
+def _to_columns(
+    table: Table,
+    rows: Sequence[dict[str, Any]] | dict[str, Sequence[Any]],
+) -> dict[str, list[Any]]:
+    """
+    Normalize row dicts or a columnar batch into columns, filling Python-side defaults.
+
+    COPY and Core inserts bypass the ORM, so defaults such as ``id=uuid4`` and
+    ``created_at=datetime.utcnow`` are applied here for values that are
+    missing (absent from a row dict, or None in a column).
+
+    Args:
+        table: Target table
+        rows: List of row dicts, or column name -> values
+
+    Returns:
+        dict: Column name -> values, one list per table column written
+    """
+    if isinstance(rows, dict):
+        columns = {name: list(values) for name, values in rows.items()}
+        count = len(next(iter(columns.values()))) if columns else 0
+    else:
+        names = {name for row in rows for name in row}
+        columns = {name: [row.get(name) for row in rows] for name in names}
+        count = len(rows)
+
+    unknown = set(columns) - set(table.c.keys())
+    if unknown:
+        raise ValueError(f"Unknown {table.name} columns: {', '.join(sorted(unknown))}")
+
+    for column in table.c:
+        default = column.default
+        if default is None or not (default.is_callable or default.is_scalar):
+            continue
+        values = columns.setdefault(column.key, [None] * count)
+        for i, value in enumerate(values):
+            if value is None:
+                values[i] = default.arg(None) if default.is_callable else default.arg
+
+    return columns
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    table: Table,
+    rows: Sequence[dict[str, Any]] | dict[str, Sequence[Any]],
+) -> dict[str, Any]:
+    """
+    Insert many rows in one round trip.
+
+    On PostgreSQL with asyncpg the rows are streamed with ``COPY``; other
+    PostgreSQL drivers get multi-row ``INSERT`` statements and other dialects
+    (SQLite in tests) an executemany. Every path, COPY included, runs inside
+    the session's transaction: the rows become visible on the caller's
+    ``session.commit()`` and a ``session.rollback()`` discards them.
+
+    Args:
+        session: Open database session
+        table: Target table (e.g. ``News.__table__``)
+        rows: List of row dicts, or column name -> values
+
+    Returns:
+        dict: {"rows": rows written, "seconds": elapsed, "rows_per_sec": throughput,
+        "method": "copy", "insert" or "executemany"}
+    """
+    started = time.perf_counter()
+    columns = _to_columns(table, rows)
+    names = list(columns)
+    count = len(columns[names[0]]) if names else 0
+    if not count:
+        return {"rows": 0, "seconds": 0.0, "rows_per_sec": 0.0, "method": None}
+
+    connection = await session.connection()
+    records = list(zip(*(columns[name] for name in names)))
+
+    if connection.dialect.name == "postgresql" and connection.dialect.driver == "asyncpg":
+        method = "copy"
+        # The asyncpg adapter only sends BEGIN with its first statement; COPY on
+        # the raw driver connection before that would autocommit on its own
+        await connection.execute(text("SELECT 1"))
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=names
+        )
+    elif connection.dialect.name == "postgresql":
+        method = "insert"
+        chunk = max(_PG_MAX_PARAMS // len(names), 1)
+        for start in range(0, count, chunk):
+            await connection.execute(
+                insert(table).values(
+                    [dict(zip(names, record)) for record in records[start : start + chunk]]
+                )
+            )
+    else:
+        method = "executemany"
+        await connection.execute(insert(table), [dict(zip(names, record)) for record in records])
+
+    seconds = time.perf_counter() - started
+    stats = {
+        "rows": count,
+        "seconds": seconds,
+        "rows_per_sec": count / seconds if seconds > 0 else float("inf"),
+        "method": method,
+    }
+    logger.debug(
+        f"Bulk inserted {count} {table.name} rows via {method} ({stats['rows_per_sec']:.0f}/s)"
+    )
+    return stats
+
+
+def make_url_hash(url: str | None) -> str | None:
+    """
+    Hash an article URL for the ``news.url_hash`` unique key.
+
+    Matches ``md5(btrim(url))`` used to backfill existing rows.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        str | None: 32-char md5 hex digest, or None for a missing/empty URL
+            (such rows never conflict)
+    """
+    url = (url or "").strip()
+    return md5(url.encode()).hexdigest() if url else None
+
+
+async def fill_undated_news(session: AsyncSession, rows: Sequence[dict[str, Any]]) -> int:
+    """
+    Give undated articles a timestamp that is stable across re-fetches.
+
+    The news unique key is ``(url_hash, timestamp)``, so an undated article
+    stamped with the fetch time would never conflict with its stored copy.
+    Undated rows reuse the timestamp of the stored row with the same URL and
+    only fall back to the current time for URLs never stored before.
+
+    Args:
+        session: Open database session
+        rows: Article dicts (updated in place: "url_hash" and "timestamp")
+
+    Returns:
+        int: Number of undated rows matched to a stored copy
+    """
+    undated = [row for row in rows if row.get("timestamp") is None]
+    if not undated:
+        return 0
+
+    for row in undated:
+        if row.get("url_hash") is None:
+            row["url_hash"] = make_url_hash(row.get("url"))
+
+    stored = {}
+    hashes = {row["url_hash"] for row in undated if row["url_hash"]}
+    if hashes:
+        result = await session.execute(
+            select(News.url_hash, func.min(News.timestamp))
+            .where(News.url_hash.in_(hashes))
+            .group_by(News.url_hash)
+        )
+        stored = dict(result.all())
+
+    now = datetime.utcnow()
+    for row in undated:
+        row["timestamp"] = stored.get(row["url_hash"], now)
+    return sum(1 for row in undated if row["url_hash"] in stored)
+
+
+async def upsert_news(
+    session: AsyncSession,
+    rows: Sequence[dict[str, Any]],
+    update_columns: Sequence[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Insert news rows, skipping (or updating) rows whose URL is already stored.
+
+    Rows conflict on ``(url_hash, timestamp)``; ``url_hash`` is derived from
+    ``url`` when missing and undated rows get a stable timestamp (see
+    ``fill_undated_news``). One ``INSERT ... ON CONFLICT DO NOTHING`` (or
+    ``DO UPDATE`` with ``update_columns``) per chunk lets the database decide
+    which rows are new, even across process restarts.
+
+    Args:
+        session: Open database session (the caller commits)
+        rows: Article dicts with News column names
+        update_columns: Columns to overwrite on conflicting rows (None = skip them)
+
+    Returns:
+        dict: {"inserted": n, "skipped": n, "updated": n, "inserted_ids": set}
+    """
+    table = News.__table__
+    for row in rows:
+        if row.get("url_hash") is None:
+            row["url_hash"] = make_url_hash(row.get("url"))
+    await fill_undated_news(session, rows)
+
+    columns = _to_columns(table, rows)
+    names = list(columns)
+    records = [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
+    if not records:
+        return {"inserted": 0, "skipped": 0, "updated": 0, "inserted_ids": set()}
+
+    connection = await session.connection()
+    is_postgresql = connection.dialect.name == "postgresql"
+    dialect_insert = postgresql.insert if is_postgresql else sqlite.insert
+
+    if update_columns:
+        # DO UPDATE may touch each key once per statement: keep the last copy
+        keyed = {}
+        for record in records:
+            key = (record["url_hash"], record["timestamp"]) if record["url_hash"] else id(record)
+            keyed[key] = record
+        records = list(keyed.values())
+
+    inserted_ids = set()
+    updated = 0
+    chunk = max(_PG_MAX_PARAMS // len(names), 1)
+    for start in range(0, len(records), chunk):
+        batch = records[start : start + chunk]
+        statement = dialect_insert(table).values(batch)
+        if update_columns:
+            statement = statement.on_conflict_do_update(
+                index_elements=["url_hash", "timestamp"],
+                set_={name: statement.excluded[name] for name in update_columns},
+            )
+        else:
+            statement = statement.on_conflict_do_nothing(index_elements=["url_hash", "timestamp"])
+
+        if is_postgresql:
+            # xmax is 0 for freshly inserted tuples and set for updated ones
+            result = await connection.execute(
+                statement.returning(table.c.id, literal_column("(xmax = 0)"))
+            )
+            returned = result.all()
+        else:
+            # SQLite has no xmax; updated rows return the stored row's id, not ours
+            batch_ids = {record["id"] for record in batch}
+            result = await connection.execute(statement.returning(table.c.id))
+            returned = [(row_id, row_id in batch_ids) for row_id in result.scalars().all()]
+
+        for row_id, was_inserted in returned:
+            if was_inserted:
+                inserted_ids.add(row_id)
+            else:
+                updated += 1
+
+    return {
+        "inserted": len(inserted_ids),
+        "skipped": len(rows) - len(inserted_ids) - updated,
+        "updated": updated,
+        "inserted_ids": inserted_ids,
+    }
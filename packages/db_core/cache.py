@@ -94,6 +94,55 @@ class CacheManager:
             logger.error(f"Cache GET error for {key}: {e}")
             return None
 
+    async def get_many(self, keys: list[str]) -> list[Any | None]:
+        """
+        Get several cache values in one round trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            list: Cached values (None for misses), in key order
+        """
+        if not keys:
+            return []
+        try:
+            client = await self.get_client()
+            values = await client.mget(keys)
+            return [json.loads(value) if value is not None else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache MGET error for {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def set_many(self, items: dict[str, Any], ttl: int | None = None) -> bool:
+        """
+        Set several cache values in one round trip.
+
+        Args:
+            items: Mapping of cache key to value (values will be JSON serialized)
+            ttl: Time to live in seconds (None = no expiration)
+
+        Returns:
+            bool: True if successful
+        """
+        if not items:
+            return True
+        try:
+            client = await self.get_client()
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized = json.dumps(value)
+                    if ttl:
+                        pipe.setex(key, ttl, serialized)
+                    else:
+                        pipe.set(key, serialized)
+                await pipe.execute()
+            logger.debug(f"Cache MSET: {len(items)} keys (TTL: {ttl}s)")
+            return True
+        except Exception as e:
+            logger.error(f"Cache MSET error for {len(items)} keys: {e}")
+            return False
+
     async def delete(self, key: str) -> bool:
         """
         Delete cache value.
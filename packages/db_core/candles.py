@@ -0,0 +1,268 @@
+"""
+AUREX.AI - Price Candles.
+
+Multi-resolution OHLCV candles for price charts. On TimescaleDB the candles
+come from the ``price_ohlcv_*`` continuous aggregates defined in
+infra/init_db.sql; on plain PostgreSQL and SQLite the same buckets are
+computed from raw ticks with portable SQL (window functions + GROUP BY).
+
+Candles are built from the tick ``price`` column. The feed's open/high/low/close
+columns are session-level values and say nothing about a single bucket.
+"""
+
+import math
+from datetime import datetime, timezone
+
+from loguru import logger
+from sqlalchemy import BigInteger, Integer, case, cast, column, func, select, table, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from .models import Price
+
+# Bucket width in seconds, finest first
+RESOLUTIONS = {"1m": 60, "5m": 300, "1h": 3600, "1d": 86400}
+
+CONTINUOUS_AGGREGATES = {name: f"price_ohlcv_{name}" for name in RESOLUTIONS}
+
+SOURCE_CONTINUOUS_AGGREGATE = "continuous_aggregate"
+SOURCE_RAW = "raw"
+
+# Whether the continuous aggregates exist (checked once per process)
+_continuous_aggregates: bool | None = None
+
+
+def candle_count(start: datetime, end: datetime, resolution: str) -> int:
+    """
+    Count the buckets a range spans at a resolution.
+
+    Args:
+        start: Start of the range
+        end: End of the range
+        resolution: Resolution name
+
+    Returns:
+        int: Number of candles (an upper bound; empty buckets are skipped)
+    """
+    span = max((end - start).total_seconds(), 0.0)
+    return math.ceil(span / RESOLUTIONS[resolution])
+
+
+def choose_resolution(start: datetime, end: datetime, max_points: int) -> str:
+    """
+    Pick the resolution for a chart range.
+
+    Returns the finest resolution whose bucket count fits in the point budget,
+    so the chart is never coarser than it needs to be. Ranges too long for
+    any resolution get daily candles.
+
+    Args:
+        start: Start of the range
+        end: End of the range
+        max_points: Maximum number of candles wanted
+
+    Returns:
+        str: Resolution name (key of RESOLUTIONS)
+    """
+    for name in RESOLUTIONS:
+        if candle_count(start, end, name) <= max_points:
+            return name
+    return next(reversed(RESOLUTIONS))
+
+
+async def has_continuous_aggregates(session: AsyncSession) -> bool:
+    """
+    Check whether the TimescaleDB candle aggregates are installed.
+
+    Args:
+        session: Database session
+
+    Returns:
+        bool: True if every price_ohlcv_* view exists
+    """
+    global _continuous_aggregates
+
+    if _continuous_aggregates is None:
+        connection = await session.connection()
+        if connection.dialect.name != "postgresql":
+            _continuous_aggregates = False
+        else:
+            checks = ", ".join(
+                f"to_regclass('{view}') IS NOT NULL" for view in CONTINUOUS_AGGREGATES.values()
+            )
+            row = (await session.execute(text(f"SELECT {checks}"))).one()
+            _continuous_aggregates = all(row)
+        if not _continuous_aggregates:
+            logger.info("📊 Price candles computed from raw ticks (no continuous aggregates)")
+
+    return _continuous_aggregates
+
+
+def continuous_aggregate_query(
+    resolution: str, start: datetime, end: datetime, symbol: str | None = None
+) -> Select:
+    """
+    Build the candle query against a continuous aggregate.
+
+    Args:
+        resolution: Resolution name
+        start: Start of the range (inclusive, bucket start)
+        end: End of the range (exclusive)
+        symbol: Restrict to one symbol (all symbols if None)
+
+    Returns:
+        Select: (bucket, open, high, low, close, volume, ticks) rows
+    """
+    view = table(
+        CONTINUOUS_AGGREGATES[resolution],
+        column("bucket"),
+        column("symbol"),
+        column("open"),
+        column("high"),
+        column("low"),
+        column("close"),
+        column("volume"),
+        column("ticks"),
+    )
+    # Include the bucket that contains the range start
+    since = _floor(start, RESOLUTIONS[resolution])
+    query = select(
+        view.c.bucket,
+        view.c.open,
+        view.c.high,
+        view.c.low,
+        view.c.close,
+        view.c.volume,
+        view.c.ticks,
+    ).where(view.c.bucket >= since, view.c.bucket < end)
+    if symbol:
+        query = query.where(view.c.symbol == symbol)
+    return query.order_by(view.c.bucket)
+
+
+def raw_candle_query(
+    dialect: str, resolution: str, start: datetime, end: datetime, symbol: str | None = None
+) -> Select:
+    """
+    Build the candle query over raw ticks for databases without TimescaleDB.
+
+    Buckets are aligned on the Unix epoch, like ``time_bucket`` for these
+    widths. Open and close are picked with ``row_number()`` in each bucket.
+
+    Args:
+        dialect: SQLAlchemy dialect name ("postgresql" or "sqlite")
+        resolution: Resolution name
+        start: Start of the range (inclusive, bucket start)
+        end: End of the range (exclusive)
+        symbol: Restrict to one symbol (all symbols if None)
+
+    Returns:
+        Select: (bucket epoch seconds, open, high, low, close, volume, ticks) rows
+    """
+    seconds = RESOLUTIONS[resolution]
+    if dialect == "postgresql":
+        epoch = cast(func.floor(func.extract("epoch", Price.timestamp)), BigInteger)
+    else:
+        epoch = cast(func.strftime("%s", Price.timestamp), Integer)
+    bucket = (epoch // seconds) * seconds
+
+    ticks = select(
+        bucket.label("bucket"),
+        Price.price,
+        Price.volume,
+        func.row_number()
+        .over(partition_by=bucket, order_by=(Price.timestamp.asc(), Price.id.asc()))
+        .label("first_rank"),
+        func.row_number()
+        .over(partition_by=bucket, order_by=(Price.timestamp.desc(), Price.id.desc()))
+        .label("last_rank"),
+    ).where(Price.timestamp >= _floor(start, seconds), Price.timestamp < end)
+    if symbol:
+        ticks = ticks.where(Price.symbol == symbol)
+    ticks = ticks.subquery()
+
+    return (
+        select(
+            ticks.c.bucket,
+            func.max(case((ticks.c.first_rank == 1, ticks.c.price))).label("open"),
+            func.max(ticks.c.price).label("high"),
+            func.min(ticks.c.price).label("low"),
+            func.max(case((ticks.c.last_rank == 1, ticks.c.price))).label("close"),
+            func.max(case((ticks.c.last_rank == 1, ticks.c.volume))).label("volume"),
+            func.count().label("ticks"),
+        )
+        .group_by(ticks.c.bucket)
+        .order_by(ticks.c.bucket)
+    )
+
+
+async def get_candles(
+    session: AsyncSession,
+    start: datetime,
+    end: datetime,
+    symbol: str | None = None,
+    resolution: str | None = None,
+    max_points: int = 500,
+) -> dict:
+    """
+    Fetch OHLCV candles for a range.
+
+    Args:
+        session: Database session
+        start: Start of the range
+        end: End of the range
+        symbol: Restrict to one symbol (all symbols if None)
+        resolution: Resolution name, or None to pick one from max_points
+        max_points: Point budget used when resolution is None
+
+    Returns:
+        dict: resolution, source and candles (timestamp, open, high, low,
+        close, volume, ticks)
+
+    Raises:
+        ValueError: If the resolution is unknown
+    """
+    if resolution is None:
+        resolution = choose_resolution(start, end, max_points)
+    elif resolution not in RESOLUTIONS:
+        raise ValueError(
+            f"Unknown resolution '{resolution}' (expected one of {', '.join(RESOLUTIONS)})"
+        )
+
+    if await has_continuous_aggregates(session):
+        source = SOURCE_CONTINUOUS_AGGREGATE
+        query = continuous_aggregate_query(resolution, start, end, symbol)
+    else:
+        source = SOURCE_RAW
+        connection = await session.connection()
+        query = raw_candle_query(connection.dialect.name, resolution, start, end, symbol)
+
+    result = await session.execute(query)
+    candles = [
+        {
+            "timestamp": _to_datetime(row.bucket),
+            "open": row.open,
+            "high": row.high,
+            "low": row.low,
+            "close": row.close,
+            "volume": row.volume,
+            "ticks": row.ticks,
+        }
+        for row in result
+    ]
+
+    return {"resolution": resolution, "source": source, "candles": candles}
+
+
+def _floor(moment: datetime, seconds: int) -> datetime:
+    """Round a datetime down to its bucket start (epoch-aligned, tz preserved)."""
+    aware = moment if moment.tzinfo else moment.replace(tzinfo=timezone.utc)
+    floored = datetime.fromtimestamp(aware.timestamp() // seconds * seconds, tz=timezone.utc)
+    return floored if moment.tzinfo else floored.replace(tzinfo=None)
+
+
+def _to_datetime(bucket) -> datetime:
+    """Normalize a bucket (timestamp or epoch seconds) to an aware UTC datetime."""
+    if isinstance(bucket, datetime):
+        return bucket if bucket.tzinfo else bucket.replace(tzinfo=timezone.utc)
+    return datetime.fromtimestamp(int(bucket), tz=timezone.utc)
@@ -14,6 +14,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    Index,
     Integer,
     String,
     Text,
@@ -27,15 +28,21 @@ class News(Base):
     """News articles with sentiment analysis."""
 
     __tablename__ = "news"
+    # Unique indexes on a hypertable must include its time column
+    __table_args__ = (Index("uq_news_url_hash", "url_hash", "timestamp", unique=True),)
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
     title = Column(Text, nullable=False)
     source = Column(String(100), nullable=False)
     url = Column(Text, nullable=True)
+    url_hash = Column(String(32), nullable=True)  # md5 hex of the URL (idempotent ingestion)
     content = Column(Text, nullable=True)
     timestamp = Column(DateTime(timezone=True), nullable=False, default=datetime.utcnow)
     sentiment_label = Column(String(20), nullable=True)  # positive, negative, neutral
     sentiment_score = Column(Float, nullable=True)  # 0-1 confidence
+    sentiment_model_version = Column(String(200), nullable=True)  # "<model>@<revision>"
+    sentiment_relevance = Column(Float, nullable=True)  # 0-1 gold relevance of the scored spans
+    canonical_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Near-duplicate of
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
     updated_at = Column(DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -78,6 +85,7 @@ class SentimentSummary(Base):
     negative_count = Column(Integer, default=0)
     neutral_count = Column(Integer, default=0)
     sample_size = Column(Integer, nullable=False)
+    confidence = Column(Float, nullable=True)  # Mean calibrated probability of the labels
     symbol = Column(String(20), default="XAUUSD", index=True)
     created_at = Column(DateTime(timezone=True), default=datetime.utcnow)
 
@@ -0,0 +1,118 @@
+"""
+AUREX.AI - Aggregate Queries.
+
+Read-side statistics computed by the database in a single statement, so a
+long window returns one row instead of streaming every tick or article to
+the API process.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from .models import News, Price
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+
+
+def _price_window(query: Select, since: datetime, symbol: str | None) -> Select:
+    """Restrict a price query to the window (and symbol, if given)."""
+    query = query.where(Price.timestamp >= since)
+    if symbol:
+        query = query.where(Price.symbol == symbol)
+    return query
+
+
+def price_stats_query(since: datetime, symbol: str | None = None) -> Select:
+    """
+    Build the price statistics query.
+
+    First and last close are correlated ``ORDER BY timestamp LIMIT 1``
+    subqueries, which both PostgreSQL and SQLite answer from the timestamp
+    index; min/max/avg skip NULLs like the aggregates they replace.
+
+    Args:
+        since: Start of the window (inclusive)
+        symbol: Restrict to one symbol (all symbols if None)
+
+    Returns:
+        Select: One-row statement
+    """
+    closes = _price_window(select(Price.close), since, symbol).where(Price.close.isnot(None))
+    first_close = closes.order_by(Price.timestamp.asc()).limit(1).scalar_subquery()
+    last_close = closes.order_by(Price.timestamp.desc()).limit(1).scalar_subquery()
+
+    return _price_window(
+        select(
+            func.count().label("data_points"),
+            func.count(Price.close).label("close_points"),
+            func.min(Price.timestamp).label("first_timestamp"),
+            func.max(Price.timestamp).label("last_timestamp"),
+            func.max(Price.high).label("high"),
+            func.min(Price.low).label("low"),
+            func.avg(Price.close).label("average"),
+            first_close.label("first_close"),
+            last_close.label("last_close"),
+        ),
+        since,
+        symbol,
+    )
+
+
+async def get_price_stats(
+    session: AsyncSession, since: datetime, symbol: str | None = None
+) -> dict | None:
+    """
+    Compute price statistics for a window in one round trip.
+
+    Args:
+        session: Database session
+        since: Start of the window (inclusive)
+        symbol: Restrict to one symbol (all symbols if None)
+
+    Returns:
+        dict: data_points, close_points, first/last timestamp, high, low,
+        average, first_close and last_close; None if the window is empty
+    """
+    row = (await session.execute(price_stats_query(since, symbol))).mappings().one()
+    if not row["data_points"]:
+        return None
+    return dict(row)
+
+
+def sentiment_distribution_query(since: datetime) -> Select:
+    """
+    Build the label count query for scored articles.
+
+    Args:
+        since: Start of the window (inclusive)
+
+    Returns:
+        Select: (sentiment_label, count) rows
+    """
+    return (
+        select(News.sentiment_label, func.count().label("count"))
+        .where(News.timestamp >= since, News.sentiment_label.isnot(None))
+        .group_by(News.sentiment_label)
+    )
+
+
+async def get_sentiment_distribution(session: AsyncSession, since: datetime) -> dict[str, int]:
+    """
+    Count scored articles per sentiment label.
+
+    Args:
+        session: Database session
+        since: Start of the window (inclusive)
+
+    Returns:
+        dict: Count for each of SENTIMENT_LABELS (labels outside it are ignored)
+    """
+    distribution = dict.fromkeys(SENTIMENT_LABELS, 0)
+    result = await session.execute(sentiment_distribution_query(since))
+    for label, count in result.all():
+        if label in distribution:
+            distribution[label] = count
+    return distribution
@@ -48,13 +48,89 @@ class Config:
 
     # FinBERT Model
     FINBERT_MODEL_NAME: str = os.getenv("FINBERT_MODEL_NAME", "ProsusAI/finbert")
+    FINBERT_MODEL_REVISION: str = os.getenv("FINBERT_MODEL_REVISION", "main")
+    # Models the admin endpoint may activate (comma-separated; default: FINBERT_MODEL_NAME)
+    MODEL_ALLOWLIST: list[str] = [
+        name.strip()
+        for name in os.getenv("MODEL_ALLOWLIST", FINBERT_MODEL_NAME).split(",")
+        if name.strip()
+    ]
     MODEL_CACHE_DIR: str = os.getenv("MODEL_CACHE_DIR", "./models")
+    # Memory-map cached safetensors weights so CPU workers on one host share them
+    MODEL_MMAP_WEIGHTS: bool = os.getenv("MODEL_MMAP_WEIGHTS", "True").lower() == "true"
+    # Never download at runtime: fail if the model is missing from MODEL_CACHE_DIR
+    MODEL_CACHE_OFFLINE: bool = os.getenv("MODEL_CACHE_OFFLINE", "False").lower() == "true"
     DEVICE: str = os.getenv("DEVICE", "cpu")  # cpu or cuda
+    INFERENCE_BACKEND: str = os.getenv("INFERENCE_BACKEND", "torch")  # torch, onnx, onnx-int8
     INFERENCE_BATCH_SIZE: int = int(os.getenv("INFERENCE_BATCH_SIZE", "32"))
+    INFERENCE_BATCH_WAIT_MS: float = float(os.getenv("INFERENCE_BATCH_WAIT_MS", "5"))
+    INFERENCE_MAX_LENGTH: int = int(os.getenv("INFERENCE_MAX_LENGTH", "512"))  # Model context
+    INFERENCE_QUEUE_SIZE: int = int(os.getenv("INFERENCE_QUEUE_SIZE", "8"))
+    INFERENCE_STREAM_MAX_IN_FLIGHT: int = int(os.getenv("INFERENCE_STREAM_MAX_IN_FLIGHT", "4"))
+    INFERENCE_POOL_WORKERS: int = int(os.getenv("INFERENCE_POOL_WORKERS", "0"))  # 0 = auto
+    INFERENCE_POOL_THREADS: int = int(os.getenv("INFERENCE_POOL_THREADS", "4"))
+    SENTIMENT_WARMUP_ON_STARTUP: bool = (
+        os.getenv("SENTIMENT_WARMUP_ON_STARTUP", "False").lower() == "true"
+    )
+
+    # Torch runtime profile (thread pools, autograd context, optional fast path)
+    TORCH_INTRA_OP_THREADS: int = int(os.getenv("TORCH_INTRA_OP_THREADS", "0"))  # 0 = default
+    TORCH_INTER_OP_THREADS: int = int(os.getenv("TORCH_INTER_OP_THREADS", "0"))  # 0 = default
+    TORCH_INFERENCE_MODE: bool = os.getenv("TORCH_INFERENCE_MODE", "True").lower() == "true"
+    TORCH_FAST_PATH: str = os.getenv("TORCH_FAST_PATH", "none")  # none, compile, bettertransformer
+    TORCH_COMPILE_MODE: str = os.getenv("TORCH_COMPILE_MODE", "default")
+
+    # Pre-classifier cascade (only low-confidence texts reach FinBERT)
+    CASCADE_ENABLED: bool = os.getenv("CASCADE_ENABLED", "False").lower() == "true"
+    CASCADE_CONFIDENCE_THRESHOLD: float = float(os.getenv("CASCADE_CONFIDENCE_THRESHOLD", "0.9"))
+    CASCADE_MODEL_PATH: str = os.getenv(
+        "CASCADE_MODEL_PATH", os.path.join(MODEL_CACHE_DIR, "cascade.npz")
+    )
+
+    # Adaptive max length (sequence cap per batch from a token-length percentile)
+    ADAPTIVE_MAX_LENGTH_ENABLED: bool = (
+        os.getenv("ADAPTIVE_MAX_LENGTH_ENABLED", "False").lower() == "true"
+    )
+    ADAPTIVE_MAX_LENGTH_PERCENTILE: float = float(
+        os.getenv("ADAPTIVE_MAX_LENGTH_PERCENTILE", "99")
+    )
+    ADAPTIVE_MAX_LENGTH_MIN: int = int(os.getenv("ADAPTIVE_MAX_LENGTH_MIN", "32"))
+    ADAPTIVE_MAX_LENGTH_MIN_SAMPLES: int = int(os.getenv("ADAPTIVE_MAX_LENGTH_MIN_SAMPLES", "256"))
+    # Texts above the cap: long_doc (sliding windows) or truncate
+    ADAPTIVE_MAX_LENGTH_OVERFLOW: str = os.getenv("ADAPTIVE_MAX_LENGTH_OVERFLOW", "long_doc")
+
+    # Sentence embeddings pooled from the sentiment forward pass (similar-news lookup)
+    EMBEDDINGS_ENABLED: bool = os.getenv("EMBEDDINGS_ENABLED", "False").lower() == "true"
+    EMBEDDING_INDEX_PATH: str = os.getenv("EMBEDDING_INDEX_PATH", "./data/embedding_index.npz")
+    EMBEDDING_INDEX_MAX_ITEMS: int = int(os.getenv("EMBEDDING_INDEX_MAX_ITEMS", "200000"))
+
+    # Aspect extraction (only gold/Fed/dollar-relevant sentences are scored)
+    ASPECT_EXTRACTION_ENABLED: bool = (
+        os.getenv("ASPECT_EXTRACTION_ENABLED", "False").lower() == "true"
+    )
+    ASPECT_MAX_SENTENCES: int = int(os.getenv("ASPECT_MAX_SENTENCES", "8"))
+
+    # Long-document mode (overlapping token windows, aggregated per article)
+    LONG_DOC_ENABLED: bool = os.getenv("LONG_DOC_ENABLED", "False").lower() == "true"
+    LONG_DOC_WINDOW_TOKENS: int = int(os.getenv("LONG_DOC_WINDOW_TOKENS", "512"))
+    LONG_DOC_STRIDE: int = int(os.getenv("LONG_DOC_STRIDE", "128"))  # Overlap in tokens
+    LONG_DOC_MAX_WINDOWS: int = int(os.getenv("LONG_DOC_MAX_WINDOWS", "8"))
+    LONG_DOC_AGGREGATION: str = os.getenv("LONG_DOC_AGGREGATION", "mean")
+    NEWS_CONTENT_MAX_CHARS: int = int(os.getenv("NEWS_CONTENT_MAX_CHARS", "500"))
+
+    # Probability calibration (applied when MODEL_CACHE_DIR holds a fitted map for the model)
+    CALIBRATION_ENABLED: bool = os.getenv("CALIBRATION_ENABLED", "True").lower() == "true"
+
+    # Sentiment Result Cache
+    SENTIMENT_CACHE_ENABLED: bool = os.getenv("SENTIMENT_CACHE_ENABLED", "True").lower() == "true"
+    SENTIMENT_CACHE_SIZE: int = int(os.getenv("SENTIMENT_CACHE_SIZE", "10000"))
+    CACHE_TTL_SENTIMENT_RESULT: int = int(os.getenv("CACHE_TTL_SENTIMENT_RESULT", "604800"))
 
     # Data Sources
     YFINANCE_SYMBOL: str = os.getenv("YFINANCE_SYMBOL", "GC=F")  # XAUUSD
     PRICE_FETCH_INTERVAL: int = int(os.getenv("PRICE_FETCH_INTERVAL", "10"))  # seconds
+    # Default candle budget for /price/candles (finest 1m/5m/1h/1d that fits)
+    PRICE_CANDLES_MAX_POINTS: int = int(os.getenv("PRICE_CANDLES_MAX_POINTS", "500"))
 
     FOREXFACTORY_RSS_URL: str = os.getenv(
         "FOREXFACTORY_RSS_URL",
@@ -66,6 +142,14 @@ class Config:
     )
     NEWS_FETCH_INTERVAL: int = int(os.getenv("NEWS_FETCH_INTERVAL", "300"))  # seconds
 
+    # Near-duplicate news detection (MinHash/LSH over title + summary)
+    DEDUP_ENABLED: bool = os.getenv("DEDUP_ENABLED", "True").lower() == "true"
+    DEDUP_INDEX_PATH: str = os.getenv("DEDUP_INDEX_PATH", "./data/dedup_index.npz")
+    DEDUP_THRESHOLD: float = float(os.getenv("DEDUP_THRESHOLD", "0.8"))  # Estimated Jaccard
+    DEDUP_NUM_PERM: int = int(os.getenv("DEDUP_NUM_PERM", "128"))
+    DEDUP_BANDS: int = int(os.getenv("DEDUP_BANDS", "32"))
+    DEDUP_WINDOW_HOURS: int = int(os.getenv("DEDUP_WINDOW_HOURS", "72"))
+
     # Sentiment Analysis
     SENTIMENT_POSITIVE_THRESHOLD: float = float(
         os.getenv("SENTIMENT_POSITIVE_THRESHOLD", "0.7"),
@@ -77,6 +161,7 @@ class Config:
     # Security
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key-change-this")
     API_KEY: str = os.getenv("API_KEY", "your-api-key-here")
+    API_KEY_PLACEHOLDER: str = "your-api-key-here"  # Admin endpoints stay disabled with this
 
     # Feature Flags
     ENABLE_ALERTS: bool = os.getenv("ENABLE_ALERTS", "False").lower() == "true"
@@ -125,6 +210,8 @@ class Config:
         logger.info(f"Redis: {cls.REDIS_URL.split('@')[-1]}")
         logger.info(f"FinBERT Model: {cls.FINBERT_MODEL_NAME}")
         logger.info(f"Device: {cls.DEVICE}")
+        logger.info(f"Inference Backend: {cls.INFERENCE_BACKEND}")
+        logger.info(f"Torch Fast Path: {cls.TORCH_FAST_PATH}")
         logger.info(f"Price Symbol: {cls.YFINANCE_SYMBOL}")
         logger.info("=" * 50)
 
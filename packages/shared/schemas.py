@@ -50,6 +50,7 @@ class SentimentSummary(BaseModel):
     negative_count: int = Field(0, ge=0)
     neutral_count: int = Field(0, ge=0)
     sample_size: int = Field(..., gt=0)
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
     symbol: str = Field("XAUUSD", min_length=1, max_length=20)
 
 
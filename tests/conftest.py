@@ -14,6 +14,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from packages.db_core.models import Base
+from tests.helpers import FakeBackend, FakeTokenizer
 
 # Set test environment
 os.environ["ENVIRONMENT"] = "test"
@@ -97,3 +98,14 @@ def sample_sentiment_data():
         "probabilities": {"positive": 0.92, "neutral": 0.06, "negative": 0.02},
     }
 
+
+@pytest.fixture
+def stub_analyzer():
+    """SentimentAnalyzer wired to a fake tokenizer and backend (no model download)."""
+    from packages.ai_core.sentiment import SentimentAnalyzer
+
+    analyzer = SentimentAnalyzer()
+    analyzer.tokenizer = FakeTokenizer()
+    analyzer.backend = FakeBackend()
+    analyzer.result_cache = None
+    return analyzer
@@ -0,0 +1,85 @@
+"""
+AUREX.AI - Test Helpers.
+
+Fake tokenizer and backend that stand in for a Hugging Face model.
+"""
+
+import numpy as np
+
+from packages.ai_core.backends import mean_pool
+
+
+class FakeTokenizer:
+    """Whitespace tokenizer mimicking the Hugging Face tokenizer call/pad API."""
+
+    def __call__(
+        self,
+        texts,
+        padding=False,
+        truncation=True,
+        max_length=512,
+        stride=0,
+        return_overflowing_tokens=False,
+        **kwargs,
+    ):
+        if isinstance(texts, str):
+            texts = [texts]
+        input_ids, sample_mapping = [], []
+        for sample, text in enumerate(texts):
+            body = [1000 + len(word) for word in text.split()]
+            if return_overflowing_tokens:
+                # Overlapping windows of max_length - 2 body tokens, like fast tokenizers
+                step = max_length - 2 - stride
+                for start in range(0, max(len(body) - stride, 1), step):
+                    input_ids.append([101] + body[start : start + max_length - 2] + [102])
+                    sample_mapping.append(sample)
+            else:
+                ids = [101] + body + [102]
+                input_ids.append(ids[:max_length] if truncation else ids)
+        encoded = {
+            "input_ids": input_ids,
+            "attention_mask": [[1] * len(ids) for ids in input_ids],
+        }
+        if return_overflowing_tokens:
+            encoded["overflow_to_sample_mapping"] = sample_mapping
+        return encoded
+
+    def pad(self, features, padding=True, return_tensors="np", **kwargs):
+        width = max(len(f["input_ids"]) for f in features)
+        return {
+            key: np.array(
+                [list(f[key]) + [0] * (width - len(f[key])) for f in features],
+                dtype=np.int64,
+            )
+            for key in features[0]
+        }
+
+
+class FakeBackend:
+    """Backend whose label is (real token count % 3), recording padded batch shapes."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.shapes = []
+
+    def load(self) -> None:
+        pass
+
+    def predict_logits(self, inputs):
+        self.shapes.append(inputs["input_ids"].shape)
+        real_tokens = inputs["attention_mask"].sum(axis=1)
+        return np.eye(3, dtype=np.float32)[real_tokens % 3] * 5.0
+
+    def predict(self, inputs):
+        """Logits plus mean-pooled one-hot "hidden states" of (token id % 8)."""
+        hidden = np.eye(8, dtype=np.float32)[inputs["input_ids"] % 8]
+        return self.predict_logits(inputs), mean_pool(hidden, inputs["attention_mask"])
+
+    def get_info(self):
+        return {"backend": self.name}
+
+
+def expected_label(text: str) -> str:
+    """Label the fake backend assigns: (word count + 2 special tokens) % 3."""
+    return ["negative", "neutral", "positive"][(len(text.split()) + 2) % 3]
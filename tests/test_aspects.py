@@ -0,0 +1,84 @@
+"""
+AUREX.AI - Aspect Extraction Tests.
+"""
+
+from packages.ai_core.aspects import (
+    ASPECT_DOLLAR,
+    ASPECT_FED,
+    ASPECT_GOLD,
+    AspectExtractor,
+    KeywordAutomaton,
+    split_sentences,
+)
+
+SIDE_MENTION = (
+    "Tech stocks rally on AI optimism. Nvidia led gains on the Nasdaq. "
+    "Chipmakers extended their advance into the close. Apple rose 2%. "
+    "Gold was little changed. Bond traders looked ahead to jobs data."
+)
+GOLD_STORY = (
+    "Gold hits record high as Fed rate cut bets grow. "
+    "Spot XAU/USD climbed 1.2% to $2,450. A weaker dollar supported bullion."
+)
+
+
+class TestKeywordAutomaton:
+    """Test the Aho-Corasick keyword matcher."""
+
+    def test_finds_overlapping_keywords(self):
+        """Test keywords sharing prefixes and suffixes are all found."""
+        automaton = KeywordAutomaton({"rate cut": "fed", "cut": "other", "rate cuts": "fed"})
+        matches = automaton.find("Rate cuts and a rate cut")
+        assert (0, 9, "fed") in matches
+        assert (16, 24, "fed") in matches
+        assert (21, 24, "other") in matches
+
+    def test_whole_words_only(self):
+        """Test keywords inside longer words do not match."""
+        automaton = KeywordAutomaton({"gold": "gold", "fed": "fed"})
+        assert automaton.find("Goldman Sachs fed up with golden goose") == [(14, 17, "fed")]
+        assert [m[2] for m in automaton.find("GOLD, gold; (gold)")] == ["gold"] * 3
+
+
+class TestAspectExtractor:
+    """Test span selection and relevance weights."""
+
+    def test_split_sentences_keeps_decimals(self):
+        """Test decimal points do not split sentences."""
+        assert split_sentences("Gold rose 1.5%. Silver fell!\nCopper flat") == [
+            "Gold rose 1.5%.",
+            "Silver fell!",
+            "Copper flat",
+        ]
+
+    def test_gold_story_is_fully_relevant(self):
+        """Test an article about gold keeps every sentence."""
+        extraction = AspectExtractor().extract(GOLD_STORY)
+        assert extraction["text"] == GOLD_STORY
+        assert extraction["relevance"] == 1.0
+        assert extraction["aspects"] == {ASPECT_GOLD: 3, ASPECT_FED: 1, ASPECT_DOLLAR: 2}
+
+    def test_side_mention_is_down_weighted(self):
+        """Test passing mentions keep only their sentence and get a low weight."""
+        extraction = AspectExtractor().extract(SIDE_MENTION)
+        assert extraction["text"] == "Gold was little changed."
+        assert extraction["relevance"] == round(1 / 6, 4)
+
+    def test_irrelevant_article_keeps_title(self):
+        """Test articles without any keyword are still scored on their first sentence."""
+        extraction = AspectExtractor().extract("Oil slides as OPEC+ weighs output. Crude fell.")
+        assert extraction["text"] == "Oil slides as OPEC+ weighs output."
+        assert extraction["relevance"] == 0.0
+        assert extraction["aspects"] == {}
+
+    def test_max_sentences_prefers_gold(self):
+        """Test the sentence cap keeps the most relevant sentences in reading order."""
+        text = "The dollar rose. Gold fell. The Fed held. Bullion slipped."
+        extraction = AspectExtractor(max_sentences=2).extract(text)
+        assert extraction["text"] == "Gold fell. Bullion slipped."
+
+    def test_focus_is_aligned(self):
+        """Test batch extraction returns texts and weights in input order."""
+        texts, relevances = AspectExtractor().focus([GOLD_STORY, SIDE_MENTION])
+        assert texts[1] == "Gold was little changed."
+        assert relevances == [1.0, round(1 / 6, 4)]
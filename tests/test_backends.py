@@ -0,0 +1,95 @@
+"""
+AUREX.AI - Inference Backend Tests.
+"""
+
+import numpy as np
+import pytest
+
+from packages.ai_core.backends import (
+    BACKEND_ONNX_INT8,
+    OnnxBackend,
+    TorchBackend,
+    check_parity,
+    compare_logits,
+    create_backend,
+    softmax,
+)
+
+
+class FakeSession:
+    """ONNX Runtime session stand-in with no inputs or outputs."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def get_inputs(self):
+        return []
+
+    def get_outputs(self):
+        return []
+
+
+class TestInferenceBackends:
+    """Test backend selection and parity checks."""
+
+    def test_create_backend_by_name(self):
+        """Test backend factory selection."""
+        assert isinstance(create_backend("torch", "ProsusAI/finbert"), TorchBackend)
+
+        int8 = create_backend(BACKEND_ONNX_INT8, "ProsusAI/finbert")
+        assert isinstance(int8, OnnxBackend)
+        assert int8.quantized
+        assert int8.model_path.name == "model.int8.onnx"
+
+    def test_create_backend_rejects_unknown(self):
+        """Test unknown backend names raise."""
+        with pytest.raises(ValueError):
+            create_backend("tensorrt", "ProsusAI/finbert")
+
+    def test_compare_logits_parity(self):
+        """Test parity report for matching and drifting logits."""
+        reference = np.array([[2.0, 0.1, -1.0], [-0.5, 0.2, 1.5]], dtype=np.float32)
+
+        close = compare_logits(reference, reference + 0.01)
+        assert close["passed"]
+        assert close["label_agreement"] == 1.0
+
+        flipped = reference.copy()
+        flipped[1] = [1.6, 0.2, 1.5]
+        drift = compare_logits(reference, flipped)
+        assert not drift["passed"]
+        assert drift["label_agreement"] == 0.5
+
+    def test_check_parity_respects_offline_cache(self, tmp_path, monkeypatch):
+        """Test parity checks resolve the model like the analyzer and never hit the Hub offline."""
+        from packages.shared.config import config
+
+        monkeypatch.setattr(config, "MODEL_CACHE_DIR", str(tmp_path))
+        monkeypatch.setattr(config, "MODEL_CACHE_OFFLINE", True)
+
+        with pytest.raises(FileNotFoundError, match="model_cache prepare"):
+            check_parity(["Gold rallies"], "onnx", model_name="ProsusAI/finbert")
+
+    def test_int8_reuses_cached_fp32_graph(self, tmp_path, monkeypatch):
+        """Test a missing int8 graph is quantized from the cached fp32 graph, not re-exported."""
+        ort = pytest.importorskip("onnxruntime")
+        from packages.ai_core import backends
+
+        (tmp_path / "model.onnx").write_bytes(b"fp32")
+        quantized = []
+
+        def export_onnx(*args):
+            raise AssertionError("fp32 graph re-exported")
+
+        monkeypatch.setattr(backends, "export_onnx", export_onnx)
+        monkeypatch.setattr(backends, "quantize_onnx", quantized.append)
+        monkeypatch.setattr(ort, "InferenceSession", FakeSession)
+
+        OnnxBackend("ProsusAI/finbert", quantized=True, export_dir=str(tmp_path)).load()
+        assert quantized == [tmp_path / "model.onnx"]
+
+    def test_softmax_rows_sum_to_one(self):
+        """Test numpy softmax used by all backends."""
+        probs = softmax(np.array([[1000.0, 0.0, -1000.0], [0.0, 0.0, 0.0]]))
+        np.testing.assert_allclose(probs.sum(axis=-1), 1.0)
+        np.testing.assert_allclose(probs[1], 1 / 3)
@@ -0,0 +1,63 @@
+"""
+AUREX.AI - Micro-Batching Tests.
+"""
+
+import asyncio
+
+import pytest
+
+from packages.ai_core.batching import MicroBatcher
+
+
+class FakeAnalyzer:
+    """Records batch sizes and echoes each text back as its label."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.batch_sizes = []
+        self.fail = fail
+
+    async def analyze_batch(self, texts):
+        self.batch_sizes.append(len(texts))
+        if self.fail:
+            raise RuntimeError("boom")
+        return [{"label": text, "score": 1.0, "probabilities": {}} for text in texts]
+
+
+@pytest.mark.asyncio
+class TestMicroBatcher:
+    """Test dynamic micro-batching."""
+
+    async def test_concurrent_requests_share_batches(self):
+        """Test that concurrent callers are flushed together at the size cap."""
+        analyzer = FakeAnalyzer()
+        batcher = MicroBatcher(analyzer, max_batch_size=4, max_wait_ms=50)
+
+        texts = [f"headline {i}" for i in range(10)]
+        results = await asyncio.gather(*(batcher.analyze(t) for t in texts))
+        await batcher.stop()
+
+        assert [r["label"] for r in results] == texts
+        assert analyzer.batch_sizes == [4, 4, 2]
+        assert batcher.get_stats()["items_processed"] == 10
+
+    async def test_deadline_flushes_partial_batch(self):
+        """Test that a lone request is flushed once the deadline passes."""
+        analyzer = FakeAnalyzer()
+        batcher = MicroBatcher(analyzer, max_batch_size=32, max_wait_ms=1)
+
+        result = await asyncio.wait_for(batcher.analyze("gold rises"), timeout=1)
+        await batcher.stop()
+
+        assert result["label"] == "gold rises"
+        assert analyzer.batch_sizes == [1]
+
+    async def test_batch_failure_propagates_to_callers(self):
+        """Test that every caller in a failed batch receives the exception."""
+        batcher = MicroBatcher(FakeAnalyzer(fail=True), max_batch_size=2, max_wait_ms=10)
+
+        results = await asyncio.gather(
+            batcher.analyze("a"), batcher.analyze("b"), return_exceptions=True
+        )
+        await batcher.stop()
+
+        assert all(isinstance(r, RuntimeError) for r in results)
@@ -0,0 +1,118 @@
+"""
+AUREX.AI - Sentiment Benchmark Harness Tests.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pytest
+
+from packages.ai_core import benchmark
+from packages.ai_core.benchmark import (
+    MODE_BATCH,
+    MODE_SINGLE,
+    RssSampler,
+    build_scenarios,
+    compare_to_baseline,
+    latency_summary,
+    make_texts,
+    run_scenario,
+)
+
+
+def test_make_texts_is_deterministic():
+    """Test that corpora are reproducible and follow the length mix."""
+    headlines = make_texts(50, "headlines")
+    bodies = make_texts(50, "bodies")
+
+    assert headlines == make_texts(50, "headlines")
+    assert max(len(text.split()) for text in headlines) < 16
+    assert min(len(text.split()) for text in bodies) >= 150
+
+
+def test_build_scenarios():
+    """Test the scenario matrix; thread counts only apply to torch."""
+    scenarios = build_scenarios(["torch", "onnx"], [8, 32], ["headlines"], [1, 4])
+
+    torch_runs = [s for s in scenarios if s["backend"] == "torch"]
+    onnx_runs = [s for s in scenarios if s["backend"] == "onnx"]
+    assert len(torch_runs) == 2 * 3  # 2 thread counts x (single + 2 batch sizes)
+    assert {s["threads"] for s in onnx_runs} == {0}
+    assert [s["mode"] for s in onnx_runs] == [MODE_SINGLE, MODE_BATCH, MODE_BATCH]
+
+
+def test_latency_summary():
+    """Test latency percentiles in milliseconds."""
+    summary = latency_summary([0.001] * 99 + [0.101])
+
+    assert summary["p50_ms"] == pytest.approx(1.0)
+    assert summary["p99_ms"] == pytest.approx(2.0)
+    assert summary["mean_ms"] == pytest.approx(2.0)
+
+
+def test_compare_to_baseline():
+    """Test that only changes beyond tolerance, in the bad direction, are flagged."""
+    baseline = [
+        {"name": "a", "texts_per_sec": 100.0, "p99_ms": 10.0, "peak_rss_mb": 500.0},
+        {"name": "b", "texts_per_sec": 100.0, "p99_ms": 10.0, "peak_rss_mb": 500.0},
+    ]
+    results = [
+        {"name": "a", "texts_per_sec": 80.0, "p99_ms": 8.0, "peak_rss_mb": 510.0},
+        {"name": "b", "texts_per_sec": 150.0, "p99_ms": 20.0, "peak_rss_mb": 500.0},
+        {"name": "new", "texts_per_sec": 1.0, "p99_ms": 999.0, "peak_rss_mb": 999.0},
+    ]
+
+    regressions = compare_to_baseline(results, baseline)
+
+    assert [(r["name"], r["metric"]) for r in regressions] == [
+        ("a", "texts_per_sec"),
+        ("b", "p99_ms"),
+    ]
+    assert regressions[0]["change"] == pytest.approx(0.2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode,batch_size,calls", [(MODE_SINGLE, 1, 10), (MODE_BATCH, 4, 3)])
+async def test_run_scenario(stub_analyzer, mode, batch_size, calls):
+    """Test that a scenario scores every text and reports the expected metrics."""
+    scenario = {
+        "backend": "fake",
+        "mode": mode,
+        "batch_size": batch_size,
+        "mix": "headlines",
+        "threads": 0,
+    }
+
+    result = await run_scenario(stub_analyzer, scenario, make_texts(10, "headlines"), 0)
+
+    assert result["name"] == f"fake/{mode}/bs{batch_size}/headlines/t0"
+    assert result["texts"] == 10
+    assert result["texts_per_sec"] > 0
+    assert result["p99_ms"] >= result["p50_ms"] > 0
+    assert result["peak_rss_mb"] > 0
+    assert len(stub_analyzer.backend.shapes) == calls
+
+
+@pytest.mark.skipif(benchmark.current_rss_mb() is None, reason="needs /proc")
+def test_rss_sampler_is_per_block():
+    """Test a block after a heavy one reports its own peak, not the process peak."""
+    with RssSampler() as heavy:
+        block = np.ones(64 * 1024 * 1024 // 8)  # 64 MB, pages touched
+        time.sleep(0.05)
+        del block
+    with RssSampler() as light:
+        time.sleep(0.02)
+
+    assert heavy.peak_mb - light.peak_mb > 32
+
+
+def test_missing_baseline_is_a_clear_error(tmp_path, monkeypatch):
+    """Test a missing baseline exits with a hint instead of a traceback."""
+    missing = tmp_path / "baseline.json"
+    monkeypatch.setattr(sys, "argv", ["benchmark", "--baseline", str(missing)])
+    monkeypatch.setattr(benchmark, "run_benchmark", pytest.fail)
+
+    with pytest.raises(SystemExit) as exc:
+        benchmark.main()
+    assert exc.value.code == 2
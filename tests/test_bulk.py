@@ -0,0 +1,194 @@
+"""
+AUREX.AI - Bulk Write Tests.
+"""
+
+import os
+from datetime import datetime
+from hashlib import md5
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from packages.db_core.bulk import bulk_insert, make_url_hash, upsert_news
+from packages.db_core.connection import Base
+from packages.db_core.models import News, Price
+
+
+@pytest.fixture
+async def sqlite_session():
+    """In-memory SQLite session with the news and price tables."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda c: Base.metadata.create_all(c, tables=[News.__table__, Price.__table__])
+        )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestBulkInsert:
+    """Test the bulk-write API on SQLite (executemany path)."""
+
+    async def test_row_dicts_get_python_defaults(self, sqlite_session):
+        """Test ids, timestamps and created_at are filled like the ORM would."""
+        now = datetime(2025, 10, 26, 12, 0)
+        rows = [
+            {"symbol": "XAUUSD", "price": 2400.0 + i, "timestamp": now if i % 2 else None}
+            for i in range(5)
+        ]
+        stats = await bulk_insert(sqlite_session, Price.__table__, rows)
+        await sqlite_session.commit()
+
+        assert stats["rows"] == 5
+        assert stats["method"] == "executemany"
+        assert stats["rows_per_sec"] > 0
+
+        stored = (await sqlite_session.execute(select(Price).order_by(Price.price))).scalars().all()
+        assert [p.price for p in stored] == [2400.0, 2401.0, 2402.0, 2403.0, 2404.0]
+        assert len({p.id for p in stored}) == 5
+        assert all(p.timestamp is not None and p.created_at is not None for p in stored)
+        assert stored[1].timestamp.replace(tzinfo=None) == now
+
+    async def test_columnar_batch(self, sqlite_session):
+        """Test a column name -> values batch is written row by row."""
+        columns = {
+            "title": ["Gold rallies", "Gold slips"],
+            "source": ["Reuters", "Kitco"],
+            "sentiment_label": ["positive", None],
+        }
+        stats = await bulk_insert(sqlite_session, News.__table__, columns)
+        await sqlite_session.commit()
+
+        assert stats["rows"] == 2
+        rows = (await sqlite_session.execute(select(News.title, News.sentiment_label))).all()
+        assert sorted(rows) == [("Gold rallies", "positive"), ("Gold slips", None)]
+
+    async def test_empty_and_unknown_columns(self, sqlite_session):
+        """Test empty batches are a no-op and unknown columns are rejected."""
+        assert (await bulk_insert(sqlite_session, News.__table__, []))["rows"] == 0
+
+        with pytest.raises(ValueError, match="published"):
+            await bulk_insert(sqlite_session, News.__table__, [{"title": "x", "published": 1}])
+
+
+class TestUpsertNews:
+    """Test idempotent news ingestion on the url_hash unique key."""
+
+    @staticmethod
+    def article(n: int, **extra) -> dict:
+        """Article dict as produced by the news fetcher."""
+        return {
+            "title": f"Gold story {n}",
+            "source": "Reuters",
+            "url": f"https://example.com/gold/{n}",
+            "timestamp": datetime(2025, 10, 26, 12, n),
+            **extra,
+        }
+
+    @staticmethod
+    def counts(result: dict) -> tuple[int, int, int]:
+        """(inserted, skipped, updated) from an upsert result."""
+        return result["inserted"], result["skipped"], result["updated"]
+
+    def test_url_hash(self):
+        """Test URLs hash like md5(btrim(url)) and blank URLs never conflict."""
+        assert make_url_hash(" https://example.com/a ") == md5(b"https://example.com/a").hexdigest()
+        assert make_url_hash("") is None
+        assert make_url_hash(None) is None
+
+    async def test_skips_stored_urls(self, sqlite_session):
+        """Test re-ingesting the same articles after a restart inserts nothing twice."""
+        first = await upsert_news(sqlite_session, [self.article(n) for n in range(3)])
+        await sqlite_session.commit()
+        assert self.counts(first) == (3, 0, 0)
+
+        rows = [self.article(n, id=uuid4()) for n in range(2, 5)]
+        second = await upsert_news(sqlite_session, rows)
+        await sqlite_session.commit()
+        assert self.counts(second) == (2, 1, 0)
+        assert second["inserted_ids"] == {row["id"] for row in rows[1:]}
+
+        count = (await sqlite_session.execute(select(func.count(News.id)))).scalar_one()
+        assert count == 5
+
+    async def test_updates_conflicting_rows(self, sqlite_session):
+        """Test DO UPDATE-style upserts overwrite the chosen columns."""
+        await upsert_news(sqlite_session, [self.article(0)])
+        counts = await upsert_news(
+            sqlite_session,
+            [self.article(0, sentiment_label="positive"), self.article(1)],
+            update_columns=["sentiment_label"],
+        )
+        await sqlite_session.commit()
+        assert self.counts(counts) == (1, 0, 1)
+
+        labels = (await sqlite_session.execute(select(News.url, News.sentiment_label))).all()
+        assert dict(labels)["https://example.com/gold/0"] == "positive"
+
+    async def test_rows_without_url_always_insert(self, sqlite_session):
+        """Test articles without a URL are never treated as duplicates."""
+        rows = [self.article(0, url=""), self.article(0, url="")]
+        assert (await upsert_news(sqlite_session, rows))["inserted"] == 2
+
+    async def test_undated_article_stored_once(self, sqlite_session):
+        """Test an undated article re-fetched in a later ingest reuses its stored timestamp."""
+        first = await upsert_news(sqlite_session, [self.article(0, timestamp=None)])
+        await sqlite_session.commit()
+
+        refetched = self.article(0, timestamp=None)
+        second = await upsert_news(sqlite_session, [refetched])
+        await sqlite_session.commit()
+
+        assert self.counts(first) == (1, 0, 0)
+        assert self.counts(second) == (0, 1, 0)
+        stored = (await sqlite_session.execute(select(News.timestamp))).scalars().all()
+        assert len(stored) == 1
+        assert refetched["timestamp"] == stored[0]
+
+
+class TestBulkInsertTransaction:
+    """Test bulk writes belong to the caller's transaction."""
+
+    async def test_rollback_discards_rows(self, sqlite_session):
+        """Test a rollback after bulk_insert leaves no rows behind."""
+        await bulk_insert(sqlite_session, Price.__table__, [{"symbol": "XAUUSD", "price": 1.0}])
+        await sqlite_session.rollback()
+
+        count = (await sqlite_session.execute(select(func.count(Price.id)))).scalar_one()
+        assert count == 0
+
+    @pytest.mark.integration
+    @pytest.mark.skipif(
+        not os.getenv("TEST_DATABASE_URL"), reason="Requires PostgreSQL (TEST_DATABASE_URL)"
+    )
+    async def test_rollback_discards_copy(self):
+        """Test a rollback also undoes rows streamed with COPY (asyncpg)."""
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"])
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        symbol = f"TEST-{uuid4().hex[:8]}"
+        try:
+            async with session_factory() as session:
+                stats = await bulk_insert(
+                    session, Price.__table__, [{"symbol": symbol, "price": 1.0}] * 3
+                )
+                assert stats["method"] == "copy"
+                await session.rollback()
+
+            async with session_factory() as session:
+                count = (
+                    await session.execute(
+                        select(func.count(Price.id)).where(Price.symbol == symbol)
+                    )
+                ).scalar_one()
+            assert count == 0
+        finally:
+            await engine.dispose()
@@ -0,0 +1,90 @@
+"""
+AUREX.AI - Probability Calibration Tests.
+"""
+
+import numpy as np
+import pytest
+
+from packages.ai_core.backends import softmax
+from packages.ai_core.calibration import (
+    METHOD_ISOTONIC,
+    METHOD_TEMPERATURE,
+    Calibrator,
+    expected_calibration_error,
+    get_calibration_path,
+    isotonic_regression,
+    load_calibrator,
+)
+from packages.shared.config import config
+
+
+def overconfident_sample(size: int = 4000, sharpen: float = 3.0, seed: int = 0):
+    """Labels drawn from softmax(logits), reported probabilities from softmax(logits * sharpen)."""
+    rng = np.random.default_rng(seed)
+    logits = rng.normal(scale=1.5, size=(size, 3))
+    true_probs = softmax(logits)
+    labels = (rng.random((size, 1)) > true_probs.cumsum(axis=1)).sum(axis=1)
+    return softmax(logits * sharpen).astype(np.float32), labels
+
+
+class TestCalibration:
+    """Test fitting, applying and persisting calibration maps."""
+
+    def test_isotonic_regression_pools_violators(self):
+        """Test PAV output is non-decreasing and averages violating runs."""
+        x, y = isotonic_regression(np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.0, 1.0, 0.0, 1.0]))
+        fitted = np.interp([0.1, 0.2, 0.3, 0.4], x, y)
+        np.testing.assert_allclose(fitted, [0.0, 0.5, 0.5, 1.0])
+        assert np.all(np.diff(x) > 0)
+
+    def test_temperature_recovers_sharpening(self):
+        """Test the fitted temperature undoes over-confident logits."""
+        probs, labels = overconfident_sample()
+        calibrator = Calibrator.fit(probs, labels, method=METHOD_TEMPERATURE)
+        assert calibrator.temperature == pytest.approx(3.0, rel=0.15)
+        assert calibrator.metrics["ece_after"] < calibrator.metrics["ece_before"] / 2
+
+    def test_isotonic_reduces_calibration_error(self):
+        """Test isotonic calibration reduces ECE and keeps rows normalized."""
+        probs, labels = overconfident_sample()
+        calibrator = Calibrator.fit(probs, labels, method=METHOD_ISOTONIC)
+        calibrated = calibrator.apply(probs)
+
+        np.testing.assert_allclose(calibrated.sum(axis=1), 1.0, rtol=1e-5)
+        assert calibrated.dtype == np.float32
+        assert expected_calibration_error(calibrated, labels) < calibrator.metrics["ece_before"]
+
+    def test_unknown_method_rejected(self):
+        """Test invalid methods and missing isotonic knots raise."""
+        with pytest.raises(ValueError):
+            Calibrator("platt")
+        with pytest.raises(ValueError):
+            Calibrator(METHOD_ISOTONIC)
+
+    def test_persisted_next_to_model(self, tmp_path, monkeypatch):
+        """Test calibrators round-trip through the model cache directory."""
+        monkeypatch.setattr(config, "MODEL_CACHE_DIR", str(tmp_path))
+        assert load_calibrator("ProsusAI/finbert", "main") is None
+
+        probs, labels = overconfident_sample(size=500)
+        calibrator = Calibrator.fit(probs, labels, method=METHOD_ISOTONIC)
+        path = get_calibration_path("ProsusAI/finbert", "main")
+        calibrator.save(path)
+
+        assert path.parent == tmp_path / "hf" / "ProsusAI--finbert" / "main"
+        loaded = load_calibrator("ProsusAI/finbert", "main")
+        assert loaded.fingerprint == calibrator.fingerprint
+        assert loaded.metrics == pytest.approx(calibrator.metrics)
+        np.testing.assert_allclose(loaded.apply(probs), calibrator.apply(probs))
+
+    async def test_analyzer_applies_calibration(self, stub_analyzer):
+        """Test batch inference returns calibrated probabilities."""
+        texts = ["gold rallies", "dollar slips on weak data today", "fed holds"]
+        raw = (await stub_analyzer.analyze_batch_array(texts)).probabilities
+
+        stub_analyzer.calibrator = Calibrator(METHOD_TEMPERATURE, temperature=2.0)
+        calibrated = (await stub_analyzer.analyze_batch_array(texts)).probabilities
+
+        np.testing.assert_allclose(calibrated, stub_analyzer.calibrator.apply(raw), rtol=1e-5)
+        assert calibrated.max(axis=1).max() < raw.max(axis=1).max()
+        assert stub_analyzer.get_model_info()["calibration"]["temperature"] == 2.0
@@ -0,0 +1,145 @@
+"""
+AUREX.AI - Price Candle Tests.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from packages.db_core import candles
+from packages.db_core.candles import (
+    SOURCE_RAW,
+    candle_count,
+    choose_resolution,
+    continuous_aggregate_query,
+    get_candles,
+)
+from packages.db_core.connection import Base
+from packages.db_core.models import Price
+
+START = datetime(2025, 10, 26, 12, 0)
+
+
+@pytest.fixture
+async def price_session(monkeypatch):
+    """In-memory SQLite session with 5-second XAUUSD ticks for 15 minutes."""
+    monkeypatch.setattr(candles, "_continuous_aggregates", None)
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[Price.__table__]))
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        # Inserted newest first so open/close must come from the timestamps
+        session.add_all(
+            Price(
+                symbol="XAUUSD",
+                price=2400.0 + (i % 12),
+                volume=1000 + i,
+                timestamp=START + timedelta(seconds=5 * i),
+            )
+            for i in reversed(range(180))
+        )
+        session.add(Price(symbol="XAGUSD", price=30.0, volume=1, timestamp=START))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestResolution:
+    """Test resolution selection against the point budget."""
+
+    @pytest.mark.parametrize(
+        ("hours", "max_points", "expected"),
+        [
+            (1, 500, "1m"),
+            (24, 500, "5m"),
+            (24 * 7, 500, "1h"),
+            (24 * 90, 500, "1d"),
+            (24, 1440, "1m"),
+            (24 * 3650, 100, "1d"),
+        ],
+    )
+    def test_finest_that_fits(self, hours, max_points, expected):
+        """Test the chosen resolution is the finest within the budget."""
+        assert choose_resolution(START, START + timedelta(hours=hours), max_points) == expected
+
+    async def test_explicit_resolution_respects_budget(self):
+        """Test an explicit resolution that needs too many candles is a 400."""
+        from fastapi import HTTPException
+
+        from apps.backend.app.api.v1.price import get_price_candles
+
+        assert candle_count(START, START + timedelta(hours=8760), "1m") == 525600
+        with pytest.raises(HTTPException) as exc:
+            await get_price_candles(hours=8760, max_points=None, resolution="1m", symbol="XAUUSD")
+        assert exc.value.status_code == 400
+        assert "525600 candles" in exc.value.detail
+
+
+class TestCandles:
+    """Test OHLCV candles computed from raw ticks on SQLite."""
+
+    async def test_minute_candles(self, price_session):
+        """Test open/high/low/close/volume per minute bucket."""
+        result = await get_candles(
+            price_session, START, START + timedelta(minutes=15), symbol="XAUUSD", resolution="1m"
+        )
+
+        assert result["resolution"] == "1m"
+        assert result["source"] == SOURCE_RAW
+        assert len(result["candles"]) == 15
+
+        first = result["candles"][0]
+        assert first["timestamp"] == START.replace(tzinfo=timezone.utc)
+        assert (first["open"], first["high"], first["low"], first["close"]) == (
+            2400.0,
+            2411.0,
+            2400.0,
+            2411.0,
+        )
+        assert first["volume"] == 1011
+        assert first["ticks"] == 12
+
+    async def test_range_start_inside_bucket(self, price_session):
+        """Test the bucket containing the range start is returned whole."""
+        result = await get_candles(
+            price_session,
+            START + timedelta(minutes=2, seconds=30),
+            START + timedelta(minutes=15),
+            symbol="XAUUSD",
+            resolution="5m",
+        )
+
+        assert [c["timestamp"].minute for c in result["candles"]] == [0, 5, 10]
+        assert all(c["ticks"] == 60 for c in result["candles"])
+
+    async def test_auto_resolution_and_symbol_filter(self, price_session):
+        """Test max_points picks the resolution and other symbols are excluded."""
+        result = await get_candles(
+            price_session, START, START + timedelta(minutes=15), symbol="XAUUSD", max_points=5
+        )
+
+        assert result["resolution"] == "5m"
+        assert sum(c["ticks"] for c in result["candles"]) == 180
+
+    async def test_unknown_resolution(self, price_session):
+        """Test an unknown resolution is rejected."""
+        with pytest.raises(ValueError, match="2m"):
+            await get_candles(price_session, START, START + timedelta(hours=1), resolution="2m")
+
+    def test_continuous_aggregate_query(self):
+        """Test TimescaleDB candles are read from the matching aggregate."""
+        query = continuous_aggregate_query(
+            "1h", START + timedelta(minutes=30), START + timedelta(days=1), "XAUUSD"
+        )
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert "FROM price_ohlcv_1h" in str(compiled)
+        assert compiled.params["bucket_1"] == START
@@ -0,0 +1,109 @@
+"""
+AUREX.AI - Sentiment Cascade Tests.
+"""
+
+import pytest
+
+from packages.ai_core.cascade import (
+    STAGE_LEXICON,
+    STAGE_MODEL,
+    HashedNgramClassifier,
+    evaluate_cascade,
+)
+
+
+class TestHashedNgramClassifier:
+    """Test the first-stage hashed n-gram classifier."""
+
+    def test_lexicon_labels_clear_headlines(self):
+        """Test that unambiguous headlines get confident lexicon labels."""
+        classifier = HashedNgramClassifier.from_lexicon()
+
+        positive, negative, neutral = classifier.classify(
+            [
+                "Gold surges to record high as dollar slips",
+                "Gold prices plunge and slide lower on rate hike fears",
+                "Central bank publishes quarterly report",
+            ]
+        )
+
+        assert positive["label"] == "positive"
+        assert negative["label"] == "negative"
+        assert neutral["label"] == "neutral"
+        assert positive["score"] > 0.9
+        assert negative["score"] > 0.9
+        assert positive["stage"] == STAGE_LEXICON
+
+    def test_mixed_headline_is_low_confidence(self):
+        """Test that mixed signals stay below a typical escalation threshold."""
+        classifier = HashedNgramClassifier.from_lexicon()
+        (result,) = classifier.classify(["Gold rises early then falls"])
+        assert result["score"] < 0.9
+
+    def test_fit_save_load_roundtrip(self, tmp_path):
+        """Test fitting on labels and reloading the saved weights."""
+        texts = ["quiet session ahead", "market awaits data", "gold mixed today"]
+        labels = ["positive", "negative", "neutral"]
+
+        classifier = HashedNgramClassifier.from_lexicon().fit(texts, labels, epochs=300)
+        assert [r["label"] for r in classifier.classify(texts)] == labels
+
+        path = tmp_path / "cascade.npz"
+        classifier.save(path)
+        reloaded = HashedNgramClassifier.load(path)
+        assert [r["label"] for r in reloaded.classify(texts)] == labels
+
+
+class TestEvaluateCascade:
+    """Test offline cascade evaluation."""
+
+    def test_calls_saved_and_agreement(self):
+        """Test calls saved and agreement at each threshold."""
+        first_stage = [
+            {"label": "positive", "score": 0.95},
+            {"label": "negative", "score": 0.95},
+            {"label": "neutral", "score": 0.5},
+            {"label": "positive", "score": 0.8},
+        ]
+        model_labels = ["positive", "positive", "neutral", "negative"]
+
+        high, low = evaluate_cascade(first_stage, model_labels, thresholds=[0.9, 0.7])
+
+        assert high["calls_saved"] == 0.5
+        assert high["accepted_agreement"] == 0.5
+        assert high["overall_agreement"] == 0.75
+
+        assert low["calls_saved"] == 0.75
+        assert low["accepted_agreement"] == pytest.approx(1 / 3)
+        assert low["overall_agreement"] == 0.5
+
+
+@pytest.mark.asyncio
+class TestAnalyzerCascade:
+    """Test the pre-classifier stage inside SentimentAnalyzer."""
+
+    async def test_confident_texts_skip_the_model(self, stub_analyzer):
+        """Test that only low-confidence texts are escalated to the model."""
+        stub_analyzer.pre_classifier = HashedNgramClassifier.from_lexicon()
+        stub_analyzer.cascade_threshold = 0.9
+
+        results = await stub_analyzer.analyze_batch(
+            [
+                "Gold surges to record high as dollar slips",
+                "Central bank publishes quarterly report",
+            ]
+        )
+
+        assert results[0]["stage"] == STAGE_LEXICON
+        assert results[0]["label"] == "positive"
+        assert results[1]["stage"] == STAGE_MODEL
+        assert len(stub_analyzer.backend.shapes) == 1
+        assert stub_analyzer.backend.shapes[0][0] == 1
+
+        counts = stub_analyzer.get_model_info()["cascade"]["stage_counts"]
+        assert counts == {STAGE_LEXICON: 1, STAGE_MODEL: 1}
+
+    async def test_disabled_cascade_uses_model(self, stub_analyzer):
+        """Test that every text reaches the model without a pre-classifier."""
+        result = await stub_analyzer.analyze_text("Gold surges to record high")
+        assert result["stage"] == STAGE_MODEL
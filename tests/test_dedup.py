@@ -0,0 +1,129 @@
+"""
+AUREX.AI - Near-Duplicate Detection Tests.
+"""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from packages.ai_core.dedup import NearDuplicateIndex, normalize_article
+from packages.db_core.connection import Base
+from packages.db_core.models import News
+
+WIRE_STORY = (
+    "Gold hits record high as Fed rate cut bets grow - Reuters",
+    "Gold prices climbed to an all-time high on Tuesday as traders ramped up bets on "
+    "a Federal Reserve rate cut in September.",
+)
+SYNDICATED_COPY = (
+    "Gold hits record high as Fed rate-cut bets grow | Kitco News",
+    "Gold prices climbed to an all-time high on Tuesday, as traders ramped up their bets "
+    "on a Federal Reserve rate cut in September, analysts said.",
+)
+UNRELATED = (
+    "Oil slides as OPEC+ weighs output increase",
+    "Crude futures fell for a third session amid supply concerns.",
+)
+
+
+class TestNearDuplicateIndex:
+    """Test the MinHash/LSH index."""
+
+    def test_normalization_strips_source_suffix(self):
+        """Test that source attributions and punctuation are ignored."""
+        assert (
+            normalize_article("Gold rallies - Reuters", "Spot up 1%.") == "gold rallies spot up 1"
+        )
+
+    def test_syndicated_copy_maps_to_canonical(self):
+        """Test that a reworded wire copy is linked and unrelated news is not."""
+        index = NearDuplicateIndex(num_perm=128, bands=32, threshold=0.7)
+
+        assert index.find_or_add("a", normalize_article(*WIRE_STORY)) is None
+        assert index.find_or_add("b", normalize_article(*SYNDICATED_COPY)) == "a"
+        assert index.find_or_add("c", normalize_article(*UNRELATED)) is None
+        assert len(index) == 2  # duplicates are not indexed themselves
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test that the index persists across runs."""
+        path = tmp_path / "dedup.npz"
+        index = NearDuplicateIndex(num_perm=128, bands=32, threshold=0.7)
+        index.add("a", normalize_article(*WIRE_STORY))
+        index.save(path)
+
+        reloaded = NearDuplicateIndex.load(path)
+        canonical_id, similarity = reloaded.query(normalize_article(*SYNDICATED_COPY))
+        assert canonical_id == "a"
+        assert similarity >= 0.7
+
+    def test_prune_drops_old_articles(self):
+        """Test pruning outside the dedup window."""
+        index = NearDuplicateIndex(num_perm=128, bands=32)
+        index.add("old", normalize_article(*WIRE_STORY), datetime.now() - timedelta(hours=100))
+        index.add("new", normalize_article(*UNRELATED))
+
+        assert index.prune(max_age_hours=72) == 1
+        assert len(index) == 1
+        assert index.query(normalize_article(*WIRE_STORY))[0] is None
+
+
+@pytest.mark.asyncio
+async def test_store_news_links_duplicates(tmp_path, monkeypatch):
+    """Test that store_news stores duplicates with canonical_id set."""
+    from apps.pipeline.tasks import fetch_news
+    from packages.shared.config import config
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[News.__table__]))
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def get_session():
+        async with session_factory() as session:
+            yield session
+
+    monkeypatch.setattr(fetch_news.db_manager, "get_session", get_session)
+    monkeypatch.setattr(config, "DEDUP_INDEX_PATH", str(tmp_path / "dedup.npz"))
+    monkeypatch.setattr(config, "DEDUP_THRESHOLD", 0.7)
+
+    fetcher = fetch_news.NewsFetcher()
+    articles = [
+        {
+            "title": title,
+            "content": content,
+            "source": source,
+            "url": url,
+            "timestamp": datetime.utcnow(),
+        }
+        for (title, content), source, url in [
+            (WIRE_STORY, "Reuters", "https://a"),
+            (SYNDICATED_COPY, "Kitco", "https://b"),
+        ]
+    ]
+    assert await fetcher.store_news(articles) == 2
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(News).order_by(News.source.desc()))).scalars().all()
+    reuters, kitco = rows
+    assert reuters.canonical_id is None
+    assert kitco.canonical_id == reuters.id
+    assert (tmp_path / "dedup.npz").exists()
+
+    # A re-fetched copy is skipped by the upsert and must not stay in the index
+    refetched = [{**articles[0]}]
+    for key in ("id", "canonical_id"):
+        refetched[0].pop(key)
+    assert await fetcher.store_news(refetched) == 0
+    assert len(fetcher.dedup_index) == 1
+    assert fetcher.dedup_index.query(normalize_article(*WIRE_STORY))[0] == str(reuters.id)
+
+    await engine.dispose()
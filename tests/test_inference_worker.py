@@ -0,0 +1,90 @@
+"""
+AUREX.AI - Inference Worker Tests.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from packages.ai_core.inference_worker import InferenceWorker
+from tests.helpers import FakeBackend
+
+
+class SlowBackend(FakeBackend):
+    """Fake backend whose forward pass blocks its thread for 50 ms."""
+
+    def predict_logits(self, inputs):
+        time.sleep(0.05)
+        return super().predict_logits(inputs)
+
+
+async def measure_loop_lag(stop: asyncio.Event, interval: float = 0.005) -> float:
+    """Return the worst event-loop scheduling delay seen until ``stop`` is set."""
+    loop = asyncio.get_running_loop()
+    worst = 0.0
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        worst = max(worst, loop.time() - expected)
+    return worst
+
+
+@pytest.mark.asyncio
+class TestInferenceWorker:
+    """Test the bounded inference thread."""
+
+    async def test_loop_latency_stays_flat_under_scoring(self, stub_analyzer):
+        """Test that concurrent forward passes do not stall the event loop."""
+        stub_analyzer.backend = SlowBackend()
+        stop = asyncio.Event()
+        lag_probe = asyncio.create_task(measure_loop_lag(stop))
+
+        await asyncio.gather(
+            *(stub_analyzer.analyze_batch([f"headline number {i}"]) for i in range(8))
+        )
+        stop.set()
+        worst_lag = await lag_probe
+
+        # 8 x 50 ms of inference ran, yet the loop never waited for a forward pass
+        assert len(stub_analyzer.backend.shapes) == 8
+        assert worst_lag < 0.04
+
+    async def test_queue_is_bounded_and_reports_waits(self):
+        """Test that callers beyond max_queue wait for a slot and waits are recorded."""
+        worker = InferenceWorker(max_queue=2)
+        release = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def blocking(i: int) -> int:
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return i
+
+        tasks = [asyncio.create_task(worker.run(blocking, i)) for i in range(5)]
+        await asyncio.sleep(0.02)
+
+        stats = worker.get_stats()
+        assert stats["queue_depth"] == 1  # one running, one queued
+        assert stats["waiting_for_slot"] == 3
+
+        release.set()
+        assert await asyncio.gather(*tasks) == [0, 1, 2, 3, 4]
+
+        stats = worker.get_stats()
+        assert stats["calls_started"] == 5
+        assert stats["max_wait_ms"] > 0
+        worker.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_usable_from_several_event_loops():
+    """Test one worker serves callers from this loop and from another thread's loop."""
+    worker = InferenceWorker(max_queue=1)
+
+    async def contend() -> list[int]:
+        # max_queue=1 makes the second call wait on the loop's semaphore
+        return await asyncio.gather(worker.run(time.sleep, 0.01), worker.run(abs, -1))
+
+    assert await contend() == [None, 1]
+    assert await asyncio.to_thread(asyncio.run, contend()) == [None, 1]
+    worker.shutdown()
@@ -0,0 +1,93 @@
+"""
+AUREX.AI - Long-Document Sentiment Tests.
+"""
+
+import numpy as np
+import pytest
+
+from packages.ai_core.long_document import aggregate_windows, select_windows
+from packages.shared.config import config
+
+# negative, neutral, positive
+WINDOW_PROBS = np.array(
+    [
+        [0.1, 0.8, 0.1],
+        [0.1, 0.8, 0.1],
+        [0.05, 0.15, 0.8],
+    ],
+    dtype=np.float32,
+)
+
+
+class TestAggregation:
+    """Test window aggregation methods."""
+
+    def test_mean_is_token_weighted(self):
+        """Test that the mean weights windows by their real token count."""
+        probs, weights = aggregate_windows(WINDOW_PROBS, np.array([100, 100, 50]), "mean")
+        np.testing.assert_allclose(weights, [0.4, 0.4, 0.2])
+        assert probs.argmax() == 1
+        assert probs.sum() == pytest.approx(1.0)
+
+    def test_max_confidence_picks_one_window(self):
+        """Test that max-confidence uses the single most confident window."""
+        probs, weights = aggregate_windows(WINDOW_PROBS, np.array([1, 1, 1]), "max_confidence")
+        np.testing.assert_allclose(probs, WINDOW_PROBS[0])
+        assert weights.tolist() == [1.0, 0.0, 0.0]
+
+    def test_attention_favors_polar_windows(self):
+        """Test that attention lets an opinionated window outweigh neutral ones."""
+        probs, weights = aggregate_windows(WINDOW_PROBS, np.array([1, 1, 1]), "attention")
+        assert weights[2] > weights[0]
+        assert probs.argmax() == 2
+
+    def test_unknown_method_raises(self):
+        """Test that unknown aggregation names are rejected."""
+        with pytest.raises(ValueError):
+            aggregate_windows(WINDOW_PROBS, np.array([1, 1, 1]), "median")
+
+    def test_select_windows_spreads_over_document(self):
+        """Test that capped documents keep evenly spaced windows."""
+        doc_index = np.array([0, 0, 0, 0, 0, 1])
+        assert select_windows(doc_index, 3).tolist() == [0, 2, 4, 5]
+
+
+@pytest.mark.asyncio
+class TestLongDocuments:
+    """Test sliding-window scoring through SentimentAnalyzer."""
+
+    @pytest.fixture(autouse=True)
+    def small_windows(self, monkeypatch):
+        """Use 6-token windows (4 body tokens) overlapping by 1 token."""
+        monkeypatch.setattr(config, "LONG_DOC_WINDOW_TOKENS", 6)
+        monkeypatch.setattr(config, "LONG_DOC_STRIDE", 1)
+        monkeypatch.setattr(config, "LONG_DOC_MAX_WINDOWS", 8)
+
+    async def test_windows_share_batches(self, stub_analyzer):
+        """Test that windows of all documents are scored together with a breakdown."""
+        long_doc = " ".join(f"w{i}" for i in range(10))  # 3 windows of 6 tokens
+        short_doc = "gold steady"  # 1 window of 4 tokens
+
+        long_result, short_result = await stub_analyzer.analyze_long_documents(
+            [long_doc, short_doc], aggregation="mean"
+        )
+
+        assert sum(shape[0] for shape in stub_analyzer.backend.shapes) == 4
+        assert len(stub_analyzer.backend.shapes) == 1  # one shared forward pass
+
+        assert long_result["windows_total"] == 3
+        assert [w["tokens"] for w in long_result["windows"]] == [6, 6, 6]
+        assert long_result["label"] == "negative"  # FakeBackend: 6 % 3 == 0
+        assert short_result["label"] == "neutral"  # FakeBackend: 4 % 3 == 1
+        assert long_result["aggregation"] == "mean"
+
+    async def test_window_cap_bounds_cost(self, stub_analyzer, monkeypatch):
+        """Test that LONG_DOC_MAX_WINDOWS caps scored windows per document."""
+        monkeypatch.setattr(config, "LONG_DOC_MAX_WINDOWS", 2)
+        long_doc = " ".join(f"w{i}" for i in range(10))
+
+        (result,) = await stub_analyzer.analyze_long_documents([long_doc])
+
+        assert result["windows_total"] == 3
+        assert len(result["windows"]) == 2
+        assert sum(shape[0] for shape in stub_analyzer.backend.shapes) == 2
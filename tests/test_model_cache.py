@@ -0,0 +1,108 @@
+"""
+AUREX.AI - Local Model Cache Tests.
+"""
+
+import json
+
+import numpy as np
+import pytest
+from safetensors.numpy import save_file
+
+from packages.ai_core import model_cache
+from packages.ai_core.model_cache import (
+    MANIFEST_FILE,
+    WEIGHTS_FILE,
+    get_model_cache_dir,
+    is_model_cached,
+    mmap_safetensors,
+    resolve_model_source,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point MODEL_CACHE_DIR at a temporary directory."""
+    monkeypatch.setattr(model_cache.config, "MODEL_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(model_cache.config, "MODEL_CACHE_OFFLINE", False)
+    return tmp_path
+
+
+def write_snapshot(model_dir, tensors):
+    """Write a minimal snapshot like prepare_model_cache does."""
+    model_dir.mkdir(parents=True, exist_ok=True)
+    save_file(tensors, str(model_dir / WEIGHTS_FILE))
+    (model_dir / "config.json").write_text("{}")
+    (model_dir / MANIFEST_FILE).write_text(json.dumps({"model_name": "test/bert"}))
+
+
+class TestMmapSafetensors:
+    """Test memory-mapped safetensors loading."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that mapped arrays match what was saved, across dtypes."""
+        tensors = {
+            "classifier.weight": np.arange(12, dtype=np.float32).reshape(3, 4),
+            "classifier.bias": np.array([0.5, -1.0, 2.0], dtype=np.float16),
+            "embeddings.position_ids": np.arange(8, dtype=np.int64).reshape(1, 8),
+        }
+        path = tmp_path / WEIGHTS_FILE
+        save_file(tensors, str(path))
+
+        mapped = mmap_safetensors(path)
+
+        assert mapped.keys() == tensors.keys()
+        for name, expected in tensors.items():
+            assert mapped[name].dtype == expected.dtype
+            np.testing.assert_array_equal(mapped[name], expected)
+
+    def test_arrays_share_one_copy_on_write_mapping(self, tmp_path):
+        """Test that tensors are views of one mapping and writes never reach the file."""
+        path = tmp_path / WEIGHTS_FILE
+        tensors = {"a": np.ones(4, dtype=np.float32), "b": np.zeros(4, dtype=np.float32)}
+        save_file(tensors, str(path))
+        on_disk = path.read_bytes()
+
+        mapped = mmap_safetensors(path)
+        assert isinstance(mapped["a"].base, np.memmap)
+        assert mapped["a"].base is mapped["b"].base
+
+        mapped["a"][:] = 7.0
+        assert path.read_bytes() == on_disk
+        np.testing.assert_array_equal(mmap_safetensors(path)["a"], np.ones(4))
+
+    def test_unsupported_dtype(self, tmp_path):
+        """Test that dtypes NumPy cannot view are rejected (caller falls back)."""
+        path = tmp_path / WEIGHTS_FILE
+        header = json.dumps({"w": {"dtype": "BF16", "shape": [2], "data_offsets": [0, 4]}})
+        path.write_bytes(len(header).to_bytes(8, "little") + header.encode() + b"\0" * 4)
+
+        with pytest.raises(ValueError, match="BF16"):
+            mmap_safetensors(path)
+
+
+class TestResolveModelSource:
+    """Test choosing between the local snapshot and the Hub."""
+
+    def test_cached_snapshot_is_used(self, cache_dir):
+        """Test that a complete snapshot is loaded locally without a revision."""
+        model_dir = get_model_cache_dir("test/bert", "v1")
+        write_snapshot(model_dir, {"w": np.zeros(2, dtype=np.float32)})
+
+        assert model_dir.is_relative_to(cache_dir)
+        assert is_model_cached(model_dir)
+        assert resolve_model_source("test/bert", "v1") == (str(model_dir), None)
+
+    def test_incomplete_snapshot_falls_back_to_hub(self, cache_dir):
+        """Test that a snapshot without its manifest is ignored."""
+        model_dir = get_model_cache_dir("test/bert", "v1")
+        write_snapshot(model_dir, {"w": np.zeros(2, dtype=np.float32)})
+        (model_dir / MANIFEST_FILE).unlink()
+
+        assert resolve_model_source("test/bert", "v1") == ("test/bert", "v1")
+
+    def test_offline_mode_requires_snapshot(self, cache_dir, monkeypatch):
+        """Test that MODEL_CACHE_OFFLINE refuses to download."""
+        monkeypatch.setattr(model_cache.config, "MODEL_CACHE_OFFLINE", True)
+
+        with pytest.raises(FileNotFoundError, match="model_cache prepare"):
+            resolve_model_source("test/bert", "v1")
@@ -0,0 +1,116 @@
+"""
+AUREX.AI - Cursor Pagination Tests.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from apps.backend.app.api.pagination import decode_cursor, encode_cursor, paginate
+from packages.db_core.connection import Base
+from packages.db_core.models import Price
+
+
+@pytest.fixture
+async def price_session():
+    """In-memory SQLite session with 25 prices, several sharing a timestamp."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[Price.__table__]))
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        start = datetime(2025, 10, 26, 12, 0)
+        session.add_all(
+            Price(symbol="XAUUSD", price=2400.0 + i, timestamp=start + timedelta(minutes=i // 3))
+            for i in range(25)
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+class TestCursorPagination:
+    """Test keyset pagination over (timestamp, id)."""
+
+    def test_cursor_round_trip(self):
+        """Test cursors are opaque, URL-safe and decode to the same position."""
+        timestamp = datetime(2025, 10, 26, 12, 30)
+        cursor = encode_cursor(timestamp, "9b2f")
+
+        assert "=" not in cursor and "/" not in cursor
+        assert decode_cursor(cursor) == (timestamp, "9b2f")
+
+        with pytest.raises(HTTPException) as exc:
+            decode_cursor("not-a-cursor")
+        assert exc.value.status_code == 400
+
+    async def test_walks_all_rows_once(self, price_session):
+        """Test following next_cursor visits every row exactly once, newest first."""
+        query = select(Price)
+        seen, cursor, pages = [], None, 0
+        while True:
+            rows, pagination = await paginate(
+                price_session, query, Price.timestamp, Price.id, 4, cursor=cursor
+            )
+            seen.extend(rows)
+            pages += 1
+            cursor = pagination["next_cursor"]
+            if cursor is None:
+                assert pagination["has_more"] is False
+                break
+
+        assert pages == 7
+        assert len({p.id for p in seen}) == 25
+        timestamps = [p.timestamp for p in seen]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    async def test_total_is_optional(self, price_session):
+        """Test totals are only counted on request and respect the filters."""
+        query = select(Price).where(Price.price >= 2410.0)
+
+        _, pagination = await paginate(price_session, query, Price.timestamp, Price.id, 10)
+        assert pagination["total_items"] is None and pagination["total_pages"] is None
+        assert pagination["has_more"] is True
+
+        _, pagination = await paginate(
+            price_session, query, Price.timestamp, Price.id, 10, include_total=True
+        )
+        assert pagination["total_items"] == 15
+        assert pagination["total_pages"] == 2
+
+    async def test_page_number_still_supported(self, price_session):
+        """Test the deprecated page parameter matches the cursor walk."""
+        query = select(Price)
+        first, pagination = await paginate(price_session, query, Price.timestamp, Price.id, 10)
+        by_cursor, _ = await paginate(
+            price_session,
+            query,
+            Price.timestamp,
+            Price.id,
+            10,
+            cursor=pagination["next_cursor"],
+        )
+        by_page, pagination = await paginate(
+            price_session, query, Price.timestamp, Price.id, 10, page=2
+        )
+
+        assert [p.id for p in by_page] == [p.id for p in by_cursor]
+        assert pagination["page"] == 2
+        assert not {p.id for p in first} & {p.id for p in by_page}
+
+    async def test_bad_cursor_id_rejected(self, price_session):
+        """Test a cursor whose id is not a UUID is a client error."""
+        cursor = encode_cursor(datetime(2025, 10, 26, 12, 0), "not-a-uuid")
+        with pytest.raises(HTTPException) as exc:
+            await paginate(
+                price_session, select(Price), Price.timestamp, Price.id, 5, cursor=cursor
+            )
+        assert exc.value.status_code == 400
@@ -0,0 +1,47 @@
+"""
+AUREX.AI - Process-Pool Inference Tests.
+"""
+
+from concurrent.futures import Future
+
+from packages.ai_core.process_pool import ProcessPoolAnalyzer, chunked
+
+
+def completed(value) -> Future:
+    """Build an already-resolved future."""
+    future = Future()
+    future.set_result(value)
+    return future
+
+
+class TestProcessPoolAnalyzer:
+    """Test chunking and streaming order of the process pool."""
+
+    def test_chunked(self):
+        """Test splitting an iterable into bounded chunks."""
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+        assert list(chunked([], 3)) == []
+
+    def test_imap_streams_in_order_with_bounded_in_flight(self, monkeypatch):
+        """Test that imap yields results in order without consuming all input upfront."""
+        pool = ProcessPoolAnalyzer(num_workers=1, threads_per_worker=1, chunk_size=2)
+        submitted = []
+
+        def fake_submit(texts):
+            submitted.append(list(texts))
+            return completed([{"label": text} for text in texts])
+
+        monkeypatch.setattr(pool, "submit", fake_submit)
+
+        stream = pool.imap(f"t{i}" for i in range(7))
+        first = next(stream)
+
+        assert first == {"label": "t0"}
+        assert len(submitted) == pool.max_in_flight  # input consumed lazily
+        assert [r["label"] for r in stream] == [f"t{i}" for i in range(1, 7)]
+
+    def test_worker_count_defaults_from_threads(self, monkeypatch):
+        """Test automatic worker count from CPU cores and threads per worker."""
+        monkeypatch.setattr("os.cpu_count", lambda: 32)
+        pool = ProcessPoolAnalyzer(threads_per_worker=4)
+        assert pool.num_workers == 8
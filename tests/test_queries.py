@@ -0,0 +1,127 @@
+"""
+AUREX.AI - Aggregate Query Tests.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from packages.db_core.connection import Base
+from packages.db_core.models import News, Price
+from packages.db_core.queries import (
+    get_price_stats,
+    get_sentiment_distribution,
+    price_stats_query,
+    sentiment_distribution_query,
+)
+
+START = datetime(2025, 10, 26, 12, 0)
+
+
+@pytest.fixture
+async def sqlite_session():
+    """In-memory SQLite session with the news and price tables."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda c: Base.metadata.create_all(c, tables=[News.__table__, Price.__table__])
+        )
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestPriceStats:
+    """Test price statistics aggregated in SQL."""
+
+    async def test_matches_python_stats(self, sqlite_session):
+        """Test min/max/avg/first/last agree with the row-by-row computation."""
+        closes = [2400.0, None, 2410.0, 2390.0, 2405.0, None]
+        # Inserted out of order so first/last must come from the timestamps
+        sqlite_session.add_all(
+            Price(
+                symbol="XAUUSD",
+                price=close or 0.0,
+                close=close,
+                high=close + 5 if close else None,
+                low=close - 5 if close else None,
+                timestamp=START + timedelta(minutes=i),
+            )
+            for i, close in reversed(list(enumerate(closes)))
+        )
+        sqlite_session.add(
+            Price(symbol="XAUUSD", price=1.0, close=1.0, timestamp=START - timedelta(hours=1))
+        )
+        await sqlite_session.commit()
+
+        stats = await get_price_stats(sqlite_session, START)
+
+        valid = [c for c in closes if c is not None]
+        assert stats["data_points"] == 6
+        assert stats["close_points"] == 4
+        assert stats["first_close"] == 2400.0
+        assert stats["last_close"] == 2405.0
+        assert stats["high"] == max(valid) + 5
+        assert stats["low"] == min(valid) - 5
+        assert stats["average"] == pytest.approx(sum(valid) / len(valid))
+        assert stats["first_timestamp"].replace(tzinfo=None) == START
+        assert stats["last_timestamp"].replace(tzinfo=None) == START + timedelta(minutes=5)
+
+    async def test_symbol_filter_and_empty_window(self, sqlite_session):
+        """Test the symbol filter and that an empty window returns None."""
+        sqlite_session.add_all(
+            [
+                Price(symbol="XAUUSD", price=2400.0, close=2400.0, timestamp=START),
+                Price(symbol="XAGUSD", price=30.0, close=30.0, timestamp=START),
+            ]
+        )
+        await sqlite_session.commit()
+
+        assert (await get_price_stats(sqlite_session, START, symbol="XAGUSD"))["average"] == 30.0
+        assert await get_price_stats(sqlite_session, START + timedelta(days=1)) is None
+
+    def test_single_statement_on_postgresql(self):
+        """Test the PostgreSQL statement is one aggregate SELECT without GROUP BY."""
+        sql = str(price_stats_query(START).compile(dialect=postgresql.dialect()))
+        assert sql.count("count(") == 2
+        assert "max(price.high)" in sql and "min(price.low)" in sql and "avg(price.close)" in sql
+        assert "GROUP BY" not in sql
+        assert sql.count("LIMIT") == 2
+
+
+class TestSentimentDistribution:
+    """Test label counts grouped in SQL."""
+
+    async def test_counts_per_label(self, sqlite_session):
+        """Test labels are counted, unscored and old articles are ignored."""
+        labels = ["positive"] * 3 + ["negative"] * 2 + [None, "mixed"]
+        sqlite_session.add_all(
+            News(title=f"Gold {i}", source="Reuters", sentiment_label=label, timestamp=START)
+            for i, label in enumerate(labels)
+        )
+        sqlite_session.add(
+            News(
+                title="Old",
+                source="Reuters",
+                sentiment_label="neutral",
+                timestamp=START - timedelta(days=2),
+            )
+        )
+        await sqlite_session.commit()
+
+        distribution = await get_sentiment_distribution(sqlite_session, START)
+        assert distribution == {"positive": 3, "neutral": 0, "negative": 2}
+
+    def test_group_by_on_postgresql(self):
+        """Test the PostgreSQL statement groups by label."""
+        sql = str(sentiment_distribution_query(START).compile(dialect=postgresql.dialect()))
+        assert "GROUP BY news.sentiment_label" in sql
+        assert "sentiment_label IS NOT NULL" in sql
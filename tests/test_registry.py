@@ -0,0 +1,210 @@
+"""
+AUREX.AI - Model Registry Tests.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from packages.ai_core.registry import ModelRegistry, make_model_version
+from tests.helpers import FakeBackend, FakeTokenizer
+
+
+class GatedBackend(FakeBackend):
+    """Fake backend that blocks each forward pass until released."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def predict_logits(self, inputs):
+        self.entered.set()
+        self.release.wait(timeout=5)
+        return super().predict_logits(inputs)
+
+
+def make_factory(fail_revisions=(), backend_cls=FakeBackend):
+    """Build stub analyzers whose load fails for the given revisions."""
+    from packages.ai_core.sentiment import SentimentAnalyzer
+
+    def factory(**kwargs):
+        analyzer = SentimentAnalyzer(**kwargs)
+        analyzer.result_cache = None
+
+        async def load_model():
+            if analyzer.model_revision in fail_revisions:
+                raise RuntimeError("weights not found")
+            if analyzer.backend is None:
+                analyzer.tokenizer = FakeTokenizer()
+                analyzer.backend = backend_cls()
+
+        analyzer.load_model = load_model
+        return analyzer
+
+    return factory
+
+
+@pytest.mark.asyncio
+class TestModelRegistry:
+    """Test ModelRegistry hot-swapping."""
+
+    async def test_default_analyzer_created_on_first_use(self):
+        """Test that get_active builds and loads the configured default."""
+        registry = ModelRegistry(make_factory())
+
+        analyzer = await registry.get_active()
+
+        assert registry.active is analyzer
+        assert analyzer.backend is not None
+        assert registry.get_status()["active_version"] == analyzer.model_version
+
+    async def test_results_carry_model_version(self):
+        """Test that results and columns are tagged with the producing version."""
+        registry = ModelRegistry(make_factory())
+        analyzer = await registry.activate(model_name="test/finbert", revision="v2")
+
+        result = await analyzer.analyze_text("Gold prices rise")
+        batch = await analyzer.analyze_batch_array(["Gold prices rise", "Gold falls"])
+
+        assert result["model_version"] == make_model_version("test/finbert", "v2")
+        assert batch.to_columns()["sentiment_model_version"] == ["test/finbert@v2"] * 2
+
+    async def test_swap_does_not_interrupt_in_flight_requests(self):
+        """Test that a request running on the old model finishes on it after the swap."""
+        registry = ModelRegistry(make_factory(backend_cls=GatedBackend))
+        old = await registry.activate(revision="v1", warmup=False)
+
+        in_flight = asyncio.create_task(old.analyze_text("Gold prices rise"))
+        await asyncio.to_thread(old.backend.entered.wait, 5)
+
+        new = await registry.activate(revision="v2", warmup=False)
+        old.backend.release.set()
+        result = await in_flight
+
+        assert registry.active is new
+        assert result["model_version"].endswith("@v1")
+        assert [entry["model_version"].rsplit("@", 1)[1] for entry in registry.history] == [
+            "v1",
+            "v2",
+        ]
+
+    async def test_replaced_analyzer_is_shut_down_after_draining(self):
+        """Test the old worker thread stops only once its in-flight call is done."""
+        registry = ModelRegistry(make_factory(backend_cls=GatedBackend))
+        old = await registry.activate(revision="v1", warmup=False)
+
+        in_flight = asyncio.create_task(old.analyze_text("Gold prices rise"))
+        await asyncio.to_thread(old.backend.entered.wait, 5)
+        await registry.activate(revision="v2", warmup=False)
+        retiring = list(registry._retire_tasks)
+
+        await asyncio.sleep(0.1)
+        assert old.inference_worker._executor is not None
+
+        old.backend.release.set()
+        await in_flight
+        await asyncio.wait_for(asyncio.gather(*retiring), 5)
+        assert old.inference_worker._executor is None
+
+    async def test_failed_load_keeps_active_model(self):
+        """Test that a candidate that fails to load is never swapped in."""
+        registry = ModelRegistry(make_factory(fail_revisions={"broken"}))
+        old = await registry.activate(revision="v1")
+
+        with pytest.raises(RuntimeError, match="weights not found"):
+            await registry.activate(revision="broken")
+
+        status = registry.get_status()
+        assert registry.active is old
+        assert status["pending_version"] is None
+        assert "weights not found" in status["last_error"]
+
+    async def test_background_activation_notifies_listeners(self):
+        """Test that start_activation swaps in the background and notifies listeners."""
+        registry = ModelRegistry(make_factory(fail_revisions={"broken"}))
+        swapped = []
+        registry.add_listener(swapped.append)
+
+        await registry.start_activation(revision="v2")
+        await registry.start_activation(revision="broken")  # error recorded, not raised
+
+        assert [analyzer.model_revision for analyzer in swapped] == ["v2"]
+        assert registry.get_status()["swap_in_progress"] is False
+        assert registry.last_error.startswith(registry.active.model_name + "@broken")
+
+    async def test_history_is_bounded(self):
+        """Test that only the most recent activations are kept."""
+        registry = ModelRegistry(make_factory(), history_size=3)
+        for revision in ("v1", "v2", "v3", "v4", "v5"):
+            await registry.activate(revision=revision, warmup=False)
+
+        history = registry.get_status()["history"]
+        assert [entry["model_version"].rsplit("@", 1)[1] for entry in history] == [
+            "v3",
+            "v4",
+            "v5",
+        ]
+
+
+@pytest.mark.asyncio
+class TestModelActivationEndpoint:
+    """Test the guards on POST /sentiment/model."""
+
+    @pytest.fixture
+    def endpoint(self, monkeypatch):
+        """The activation endpoint with a fake registry and a configured key."""
+        from apps.backend.app.api.v1 import sentiment
+        from packages.shared.config import config
+
+        activations = []
+
+        class FakeRegistry:
+            def get_status(self):
+                return {"swap_in_progress": False}
+
+            def start_activation(self, **kwargs):
+                activations.append(kwargs)
+
+        monkeypatch.setattr(sentiment, "get_model_registry", FakeRegistry)
+        monkeypatch.setattr(config, "API_KEY", "s3cret")
+        monkeypatch.setattr(config, "MODEL_ALLOWLIST", ["ProsusAI/finbert"])
+
+        async def call(api_key, **request):
+            return await sentiment.activate_sentiment_model(
+                sentiment.ModelActivationRequest(**request), x_api_key=api_key
+            )
+
+        call.activations = activations
+        return call
+
+    async def test_disabled_without_configured_key(self, endpoint, monkeypatch):
+        """Test the placeholder key disables the endpoint instead of authorizing it."""
+        from fastapi import HTTPException
+
+        from packages.shared.config import config
+
+        monkeypatch.setattr(config, "API_KEY", config.API_KEY_PLACEHOLDER)
+        with pytest.raises(HTTPException) as exc:
+            await endpoint(config.API_KEY_PLACEHOLDER, model_name="ProsusAI/finbert")
+        assert exc.value.status_code == 503
+        assert endpoint.activations == []
+
+    async def test_rejects_wrong_key_and_unlisted_model(self, endpoint):
+        """Test a wrong key is 401 and models outside the allowlist are 403."""
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as exc:
+            await endpoint("wrong", model_name="ProsusAI/finbert")
+        assert exc.value.status_code == 401
+
+        with pytest.raises(HTTPException) as exc:
+            await endpoint("s3cret", model_name="someone/untrusted-model")
+        assert exc.value.status_code == 403
+
+        response = await endpoint("s3cret", model_name="ProsusAI/finbert", revision="v2")
+        assert response["status"] == "accepted"
+        assert endpoint.activations == [
+            {"model_name": "ProsusAI/finbert", "revision": "v2", "backend": None}
+        ]
@@ -0,0 +1,22 @@
+"""
+AUREX.AI - Bulk Re-Scoring CLI Tests.
+"""
+
+import sys
+from datetime import datetime, timezone
+
+from apps.pipeline.rescore_news import parse_args, parse_utc
+
+
+def test_range_bounds_are_aware_utc(monkeypatch):
+    """Test --start/--end are parsed as aware UTC datetimes, with or without an offset."""
+    monkeypatch.setattr(
+        sys, "argv", ["rescore_news", "--start", "2025-10-01", "--end", "2025-10-02T02:00+02:00"]
+    )
+    args = parse_args()
+
+    assert args.start == datetime(2025, 10, 1, tzinfo=timezone.utc)
+    assert args.end == datetime(2025, 10, 2, tzinfo=timezone.utc)
+    assert args.end.tzinfo is timezone.utc
+    assert args.start < datetime.now(timezone.utc)
+    assert parse_utc("2025-10-01T12:00Z").utcoffset().total_seconds() == 0
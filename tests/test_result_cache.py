@@ -0,0 +1,83 @@
+"""
+AUREX.AI - Sentiment Result Cache Tests.
+"""
+
+import pytest
+
+from packages.ai_core.result_cache import SentimentResultCache, normalize_text
+
+
+class FakeCacheManager:
+    """In-memory stand-in for the Redis CacheManager bulk API."""
+
+    def __init__(self) -> None:
+        self.store = {}
+
+    async def get_many(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set_many(self, items, ttl=None):
+        self.store.update(items)
+        return True
+
+
+def make_result(label: str) -> dict:
+    """Build a minimal sentiment result."""
+    return {"label": label, "score": 0.9, "probabilities": {label: 0.9}}
+
+
+@pytest.mark.asyncio
+class TestSentimentResultCache:
+    """Test the two-tier sentiment result cache."""
+
+    async def test_key_is_content_addressed(self):
+        """Test that keys depend on normalized text and model identity."""
+        cache = SentimentResultCache("ProsusAI/finbert", "main")
+
+        assert normalize_text("  Gold rises \n today ") == "Gold rises today"
+        assert cache.make_key("Gold rises  today") == cache.make_key(" Gold rises today")
+        assert cache.make_key("Gold rises") != cache.make_key("Gold falls")
+
+        other_revision = SentimentResultCache("ProsusAI/finbert", "v2")
+        assert cache.make_key("Gold rises") != other_revision.make_key("Gold rises")
+
+    async def test_lru_tier_hits_and_evicts(self):
+        """Test LRU hits, misses and least-recently-used eviction."""
+        cache = SentimentResultCache("finbert", max_entries=2)
+        await cache.set_many(["a", "b"], [make_result("positive"), make_result("negative")])
+
+        assert (await cache.get_many(["a"]))[0]["label"] == "positive"
+        await cache.set_many(["c"], [make_result("neutral")])  # evicts "b"
+
+        results = await cache.get_many(["a", "b", "c"])
+        assert [r["label"] if r else None for r in results] == ["positive", None, "neutral"]
+
+        stats = cache.get_stats()
+        assert stats["lru_hits"] == 3
+        assert stats["misses"] == 1
+        assert stats["lru_entries"] == 2
+
+    async def test_redis_tier_backfills_lru(self):
+        """Test that Redis hits are served and promoted into the LRU tier."""
+        redis = FakeCacheManager()
+        writer = SentimentResultCache("finbert", cache_manager=redis)
+        await writer.set_many(["gold rallies"], [make_result("positive")])
+
+        reader = SentimentResultCache("finbert", cache_manager=redis)
+        (first,) = await reader.get_many(["gold rallies"])
+        (second,) = await reader.get_many(["gold rallies"])
+
+        assert first["label"] == second["label"] == "positive"
+        assert reader.get_stats()["redis_hits"] == 1
+        assert reader.get_stats()["lru_hits"] == 1
+
+    async def test_cached_results_are_copies(self):
+        """Test that mutating a returned result does not corrupt the cache."""
+        cache = SentimentResultCache("finbert")
+        await cache.set_many(["x"], [make_result("positive")])
+
+        (result,) = await cache.get_many(["x"])
+        result["probabilities"]["positive"] = 0.0
+
+        (again,) = await cache.get_many(["x"])
+        assert again["probabilities"]["positive"] == 0.9
@@ -0,0 +1,97 @@
+"""
+AUREX.AI - Columnar Sentiment Result Tests.
+"""
+
+import pickle
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from packages.ai_core.results import SentimentBatch
+from packages.db_core.bulk import update_news_sentiment
+from packages.db_core.connection import Base
+from packages.db_core.models import News
+from tests.helpers import expected_label
+
+PROBS = np.array(
+    [
+        [0.7, 0.2, 0.1],
+        [0.1, 0.1, 0.8],
+        [0.2, 0.6, 0.2],
+    ],
+    dtype=np.float32,
+)
+
+
+class TestSentimentBatch:
+    """Test the array-backed result type."""
+
+    def test_compact_storage(self):
+        """Test dtypes and shapes of the backing arrays."""
+        batch = SentimentBatch(PROBS)
+
+        assert batch.label_ids.dtype == np.uint8
+        assert batch.probabilities.dtype == np.float32
+        assert batch.probabilities.shape == (3, 3)
+        assert batch.label_names.tolist() == ["negative", "positive", "neutral"]
+        np.testing.assert_allclose(batch.scores, [0.7, 0.8, 0.6])
+
+    def test_lazy_views_match_result_dicts(self):
+        """Test that views behave like the regular result dicts."""
+        batch = SentimentBatch(PROBS)
+        view = batch[1]
+
+        assert view["label"] == view.label == "positive"
+        assert view["score"] == pytest.approx(0.8)
+        assert view.to_dict()["probabilities"]["positive"] == pytest.approx(0.8)
+        assert batch[-1].label == "neutral"
+        assert [v.label for v in batch] == ["negative", "positive", "neutral"]
+        with pytest.raises(IndexError):
+            batch[3]
+
+    def test_pickles_as_arrays(self):
+        """Test that batches survive the process-pool round trip."""
+        batch = pickle.loads(pickle.dumps(SentimentBatch(PROBS)))
+        assert batch.to_columns()["sentiment_label"] == ["negative", "positive", "neutral"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_batch_array(stub_analyzer):
+    """Test columnar output from the analyzer."""
+    texts = ["gold", "gold rises", "gold rises again"]
+    batch = await stub_analyzer.analyze_batch_array(texts)
+
+    assert isinstance(batch, SentimentBatch)
+    assert batch.label_names.tolist() == [expected_label(t) for t in texts]
+
+
+@pytest.mark.asyncio
+async def test_update_news_sentiment_bulk():
+    """Test writing columnar results into the news table."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda c: Base.metadata.create_all(c, tables=[News.__table__]))
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    ids = [uuid4() for _ in range(3)]
+    async with session_factory() as session:
+        session.add_all([News(id=i, title=f"t{n}", source="test") for n, i in enumerate(ids)])
+        await session.commit()
+
+        written = await update_news_sentiment(session, ids, SentimentBatch(PROBS).to_columns())
+        await session.commit()
+        assert written == 3
+
+        rows = (await session.execute(select(News.id, News.sentiment_label))).all()
+    labels = {row.id: row.sentiment_label for row in rows}
+    assert [labels[i] for i in ids] == ["negative", "positive", "neutral"]
+
+    await engine.dispose()
@@ -5,6 +5,7 @@ AUREX.AI - Sentiment Analysis Tests.
 import pytest
 
 from packages.ai_core.sentiment import SentimentAnalyzer
+from tests.helpers import expected_label
 
 
 @pytest.mark.asyncio
@@ -83,3 +84,42 @@ class TestSentimentAnalyzer:
         assert info["device"] in ["cpu", "cuda"]
         assert "labels" in info
 
+
+@pytest.mark.asyncio
+class TestLengthBucketing:
+    """Test length-bucketed batch inference."""
+
+    async def test_buckets_pad_to_own_length(self, stub_analyzer):
+        """Test that short texts are not padded to the longest text in the batch."""
+        stub_analyzer.batch_size = 2
+        texts = [
+            "long summary " * 50,
+            "gold rises",
+            "dollar slips as gold climbs",
+            "gold flat",
+        ]
+
+        results = await stub_analyzer.analyze_batch(texts)
+
+        assert [r["label"] for r in results] == [expected_label(t) for t in texts]
+        assert stub_analyzer.backend.shapes == [(2, 4), (2, 102)]
+
+    async def test_bucket_by_length_caps_size(self):
+        """Test bucket grouping order and size cap."""
+        from packages.ai_core.sentiment import bucket_by_length
+
+        assert bucket_by_length([5, 1, 3, 2, 4], 2) == [[1, 3], [2, 4], [0]]
+        assert bucket_by_length([], 4) == []
+
+
+@pytest.mark.asyncio
+class TestWarmup:
+    """Test background model warm-up."""
+
+    async def test_warmup_runs_dummy_forward_pass(self, stub_analyzer):
+        """Test that warm-up runs one forward pass and marks the analyzer ready."""
+        await stub_analyzer.warmup()
+
+        assert stub_analyzer.warmed_up
+        assert len(stub_analyzer.backend.shapes) == 1
+        assert stub_analyzer.get_model_info()["warmed_up"]
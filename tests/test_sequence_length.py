@@ -0,0 +1,115 @@
+"""
+AUREX.AI - Adaptive Sequence Length Tests.
+"""
+
+import numpy as np
+import pytest
+
+from packages.ai_core.sequence_length import (
+    OVERFLOW_LONG_DOC,
+    OVERFLOW_TRUNCATE,
+    AdaptiveMaxLength,
+)
+from tests.helpers import expected_label
+
+SHORT = "gold steady today"  # 5 tokens with special tokens
+LONG = " ".join(["gold"] * 40)  # 42 tokens
+
+
+def adaptive(overflow: str = OVERFLOW_TRUNCATE, **kwargs) -> AdaptiveMaxLength:
+    """Enabled tracker that adapts from the first batch."""
+    options = {"percentile": 90, "min_length": 8, "min_samples": 0}
+    options.update(kwargs)
+    return AdaptiveMaxLength(model_max_length=512, enabled=True, overflow=overflow, **options)
+
+
+class TestAdaptiveMaxLength:
+    """Test the token-length histogram and cap selection."""
+
+    def test_cap_follows_percentile(self):
+        """Test that the cap is the percentile length rounded up and clipped."""
+        tracker = adaptive(min_length=4)
+        tracker.observe(np.array([10] * 95 + [300] * 5))
+
+        assert tracker.length_at_percentile(50) == 10
+        assert tracker.length_at_percentile(99) == 300
+        assert tracker.cap == 16  # p90 = 10, rounded up to a multiple of 8
+
+    def test_cap_bounds(self):
+        """Test the minimum cap and clipping of lengths above the model limit."""
+        tracker = adaptive(min_length=32)
+        tracker.observe(np.array([5] * 10))
+        assert tracker.cap == 32
+
+        tracker = adaptive(percentile=100)
+        tracker.observe(np.array([5000]))
+        assert tracker.cap == 512
+
+    def test_model_limit_until_enough_samples(self):
+        """Test that the cap stays at the model limit while warming up or disabled."""
+        tracker = adaptive(min_samples=100)
+        tracker.observe(np.array([10] * 99))
+        assert tracker.cap == 512
+
+        tracker.observe(np.array([10]))
+        assert tracker.cap == 16
+
+        assert AdaptiveMaxLength(model_max_length=512, enabled=False, min_samples=0).cap == 512
+
+    def test_histogram_decays(self):
+        """Test that old lengths are halved away so the cap follows drift."""
+        tracker = adaptive(max_count=100)
+        tracker.observe(np.array([200] * 100))
+        tracker.observe(np.array([10] * 100))
+        tracker.observe(np.array([10] * 100))
+
+        assert tracker.samples <= 100
+        assert tracker.length_at_percentile(50) == 10
+
+    def test_unknown_overflow_policy(self):
+        """Test that an invalid overflow policy is rejected."""
+        with pytest.raises(ValueError, match="overflow policy"):
+            AdaptiveMaxLength(overflow="drop")
+
+
+class TestAnalyzerSequenceCap:
+    """Test per-batch capping in SentimentAnalyzer._predict_probs."""
+
+    def test_truncate_overflow(self, stub_analyzer):
+        """Test that texts above the cap are truncated and reported."""
+        stub_analyzer.sequence_length = adaptive(OVERFLOW_TRUNCATE)
+
+        probabilities = stub_analyzer._predict_probs([SHORT] * 9 + [LONG])
+
+        assert probabilities.shape == (10, 3)
+        assert max(shape[1] for shape in stub_analyzer.backend.shapes) == 8
+        batch = stub_analyzer.sequence_length.last_batch
+        assert batch["cap"] == 8
+        assert batch["overflow_texts"] == 1
+        assert batch["truncated_texts"] == 1
+        assert batch["truncated_tokens"] == 42 - 8
+
+    def test_long_doc_overflow(self, stub_analyzer):
+        """Test that texts above the cap are scored in full by the long-document path."""
+        stub_analyzer.sequence_length = adaptive(OVERFLOW_LONG_DOC)
+
+        probabilities = stub_analyzer._predict_probs([SHORT] * 9 + [LONG])
+        labels = [stub_analyzer.labels[i] for i in probabilities.argmax(axis=1)]
+
+        assert labels == [expected_label(SHORT)] * 9 + [expected_label(LONG)]
+        batch = stub_analyzer.sequence_length.last_batch
+        assert batch["overflow_texts"] == 1
+        assert batch["truncated_texts"] == 0
+
+    def test_padding_metrics(self, stub_analyzer):
+        """Test that real and padded token counts cover every forward pass."""
+        stub_analyzer.batch_size = 2
+        stub_analyzer._predict_probs([SHORT, "gold", "gold up"])  # 5, 3, 4 tokens
+
+        batch = stub_analyzer.sequence_length.last_batch
+        stats = stub_analyzer.sequence_length.get_stats()
+        assert batch["real_tokens"] == 12
+        assert batch["padded_tokens"] == 2 * 4 + 1 * 5  # buckets [3, 4] and [5]
+        assert batch["padding_ratio"] == pytest.approx(1 - 12 / 13)
+        assert stats["totals"]["texts"] == 3
+        assert stats["cap"] == 512  # disabled by default
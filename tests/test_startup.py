@@ -0,0 +1,60 @@
+"""
+AUREX.AI - Start-Up Time Benchmarks.
+
+Importing ai_core must not pull in torch/transformers; those are deferred
+until a model is actually loaded.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Generous budget: the eager torch + transformers import alone takes several seconds
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+
+HEAVY_MODULES = ("torch", "transformers", "onnxruntime")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """Import a module in a fresh interpreter and report time and heavy imports."""
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.slow
+class TestStartupTime:
+    """Guard against start-up time regressions from heavy ML imports."""
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "packages.ai_core.sentiment",
+            "packages.ai_core.backends",
+            "packages.ai_core.process_pool",
+        ],
+    )
+    def test_ai_core_import_is_lightweight(self, module):
+        """Test that importing ai_core defers torch/transformers."""
+        report = measure_import(module)
+
+        assert report["loaded"] == [], f"{module} eagerly imported {report['loaded']}"
+        assert report["seconds"] < IMPORT_TIME_BUDGET_SECONDS
@@ -0,0 +1,75 @@
+"""
+AUREX.AI - Streaming Sentiment Analysis Tests.
+"""
+
+import asyncio
+
+import pytest
+
+from tests.helpers import expected_label
+
+
+async def numbered_texts(count: int | None = None, pulled: list | None = None):
+    """Yield texts with 1..n words, recording how many were pulled."""
+    i = 0
+    while count is None or i < count:
+        i += 1
+        if pulled is not None:
+            pulled.append(i)
+        yield " ".join(["w"] * i)
+
+
+@pytest.mark.asyncio
+class TestAnalyzeStream:
+    """Test SentimentAnalyzer.analyze_stream."""
+
+    async def test_results_in_input_order(self, stub_analyzer):
+        """Test that every text gets its own result, in order, in full batches."""
+        results = [r async for r in stub_analyzer.analyze_stream(numbered_texts(70), batch_size=32)]
+
+        assert [r["label"] for r in results] == [
+            expected_label(" ".join(["w"] * i)) for i in range(1, 71)
+        ]
+        assert sum(shape[0] for shape in stub_analyzer.backend.shapes) == 70
+
+    async def test_backpressure_bounds_reads(self, stub_analyzer):
+        """Test that a slow consumer stops the reader from draining an endless source."""
+        pulled = []
+        stream = stub_analyzer.analyze_stream(
+            numbered_texts(pulled=pulled), batch_size=4, max_in_flight=2
+        )
+
+        await stream.__anext__()
+        await asyncio.sleep(0.05)  # consumer stalls
+
+        # consumed batch + 2 queued + 1 being filled (+1 pending read)
+        assert len(pulled) <= 4 * 4 + 1
+        await stream.aclose()
+
+    async def test_idle_source_flushes_partial_batch(self, stub_analyzer):
+        """Test that a stalled source does not hold back texts already read."""
+        first_result = asyncio.Event()
+
+        async def slow_source():
+            yield "gold steady"
+            await first_result.wait()
+            yield "gold higher today"
+
+        stream = stub_analyzer.analyze_stream(slow_source(), batch_size=32, max_wait_ms=5)
+        first = await asyncio.wait_for(stream.__anext__(), timeout=1)
+        first_result.set()
+        rest = [r async for r in stream]
+
+        assert first["label"] == expected_label("gold steady")
+        assert len(rest) == 1
+
+    async def test_source_errors_propagate(self, stub_analyzer):
+        """Test that a failing source raises in the consumer."""
+
+        async def failing_source():
+            yield "gold steady"
+            raise RuntimeError("feed broke")
+
+        with pytest.raises(RuntimeError, match="feed broke"):
+            async for _ in stub_analyzer.analyze_stream(failing_source()):
+                pass
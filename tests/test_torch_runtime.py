@@ -0,0 +1,141 @@
+"""
+AUREX.AI - Torch Runtime Profile Tests.
+"""
+
+import contextlib
+import sys
+import types
+
+import pytest
+
+from packages.ai_core import torch_runtime
+from packages.ai_core.backends import TorchBackend, create_backend
+from packages.ai_core.torch_runtime import (
+    FAST_PATH_BETTERTRANSFORMER,
+    FAST_PATH_COMPILE,
+    FAST_PATH_NONE,
+    TorchRuntimeProfile,
+)
+
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """Install a minimal stand-in for the torch module."""
+    torch = types.ModuleType("torch")
+    torch.threads, torch.contexts, torch.compiled = [4, 4], [], []
+    torch.set_num_threads = lambda n: torch.threads.__setitem__(0, n)
+    torch.set_num_interop_threads = lambda n: torch.threads.__setitem__(1, n)
+    torch.get_num_threads = lambda: torch.threads[0]
+    torch.get_num_interop_threads = lambda: torch.threads[1]
+
+    @contextlib.contextmanager
+    def context(name):
+        torch.contexts.append(name)
+        yield
+
+    torch.inference_mode = lambda: context("inference_mode")
+    torch.no_grad = lambda: context("no_grad")
+
+    def compile(model, mode, dynamic):
+        torch.compiled.append((mode, dynamic))
+        return CompiledModel(model)
+
+    torch.compile = compile
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(torch_runtime, "_applied_threads", None)
+    return torch
+
+
+class EagerModel:
+    """Model whose forward pass returns its name."""
+
+    def __call__(self, x):
+        return ("eager", x)
+
+    def to_bettertransformer(self):
+        raise ImportError("optimum is not installed")
+
+
+class CompiledModel:
+    """Compiled wrapper that fails on its first call."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def __call__(self, x):
+        raise RuntimeError("backend compiler failed")
+
+
+class TestTorchRuntimeProfile:
+    """Test thread sizing, autograd context and fast-path fallback."""
+
+    def test_defaults_and_validation(self):
+        """Test config defaults and unknown fast paths."""
+        profile = TorchRuntimeProfile()
+        info = profile.get_info()
+        assert info["fast_path"] == FAST_PATH_NONE
+        assert info["inference_mode"] is True
+        assert info["effective_threads"] is None
+
+        with pytest.raises(ValueError):
+            TorchRuntimeProfile(fast_path="tensorrt")
+
+    def test_no_fast_path_returns_model(self):
+        """Test the default profile leaves the model untouched."""
+        model = EagerModel()
+        assert TorchRuntimeProfile(fast_path=FAST_PATH_NONE).optimize(model) is model
+
+    def test_threads_applied_once_per_process(self, fake_torch):
+        """Test thread pools are sized by the first profile only."""
+        first = TorchRuntimeProfile(intra_op_threads=2, inter_op_threads=1)
+        first.apply_threads()
+        assert first.threads == (2, 1)
+
+        second = TorchRuntimeProfile(intra_op_threads=8, inter_op_threads=8)
+        second.apply_threads()
+        assert second.threads == (2, 1)
+        assert second.get_info()["effective_threads"] == {"intra_op": 2, "inter_op": 1}
+
+    def test_grad_context(self, fake_torch):
+        """Test inference_mode and no_grad selection."""
+        model = EagerModel()
+        TorchRuntimeProfile(inference_mode=True).run(model, model, lambda m: m(1))
+        TorchRuntimeProfile(inference_mode=False).run(model, model, lambda m: m(1))
+        assert fake_torch.contexts == ["inference_mode", "no_grad"]
+
+    def test_bettertransformer_falls_back_at_load(self):
+        """Test a missing BetterTransformer dependency keeps the eager model."""
+        profile = TorchRuntimeProfile(fast_path=FAST_PATH_BETTERTRANSFORMER)
+        model = EagerModel()
+
+        assert profile.optimize(model) is model
+        assert profile.active_fast_path == FAST_PATH_NONE
+        assert "optimum" in profile.get_info()["fallback_reason"]
+
+    def test_compile_falls_back_at_first_forward(self, fake_torch):
+        """Test a compiled model failing on first call is replaced by the eager one."""
+        profile = TorchRuntimeProfile(fast_path=FAST_PATH_COMPILE, compile_mode="reduce-overhead")
+        eager = EagerModel()
+        model = profile.optimize(eager)
+        assert isinstance(model, CompiledModel)
+        assert fake_torch.compiled == [("reduce-overhead", True)]
+        assert profile.active_fast_path == FAST_PATH_COMPILE
+
+        output, model = profile.run(model, eager, lambda m: m(3))
+        assert output == ("eager", 3)
+        assert model is eager
+        assert profile.active_fast_path == FAST_PATH_NONE
+        assert "backend compiler failed" in profile.fallback_reason
+
+    def test_backend_uses_profile(self):
+        """Test the factory threads the profile into the torch backend."""
+        profile = TorchRuntimeProfile(fast_path=FAST_PATH_COMPILE)
+        backend = create_backend("torch", "ProsusAI/finbert", profile=profile)
+        assert isinstance(backend, TorchBackend)
+        assert backend.profile is profile
+
+    def test_analyzer_reports_profile(self, stub_analyzer):
+        """Test get_model_info exposes the active profile."""
+        info = stub_analyzer.get_model_info()["runtime_profile"]
+        assert info["fast_path"] == FAST_PATH_NONE
+        assert info["active_fast_path"] == FAST_PATH_NONE
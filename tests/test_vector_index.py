@@ -0,0 +1,135 @@
+"""
+AUREX.AI - Embedding Index Tests.
+"""
+
+import numpy as np
+import pytest
+
+from packages.ai_core import vector_index
+from packages.ai_core.backends import mean_pool
+from packages.ai_core.vector_index import EmbeddingIndex, get_embedding_index
+
+
+def unit(*components: float) -> np.ndarray:
+    """Vector padded to 4 dimensions."""
+    vector = np.zeros(4, dtype=np.float32)
+    vector[: len(components)] = components
+    return vector
+
+
+class TestEmbeddingIndex:
+    """Test EmbeddingIndex kNN search and persistence."""
+
+    def test_nearest_neighbours(self):
+        """Test that search ranks by cosine similarity and honours exclusions."""
+        index = EmbeddingIndex()
+        index.add(
+            ["a", "b", "c"],
+            np.stack([unit(1, 0), unit(1, 1), unit(0, 1)]),
+        )
+
+        results = index.search(unit(3, 0.1), k=2)
+
+        assert [article_id for article_id, _ in results] == ["a", "b"]
+        assert results[0][1] == pytest.approx(0.9994, abs=1e-3)
+        assert [i for i, _ in index.search(index.get("a"), k=5, exclude={"a"})] == ["b", "c"]
+
+    def test_storage_is_compact(self):
+        """Test that vectors are stored normalized as float16."""
+        index = EmbeddingIndex()
+        index.add(["a"], np.array([[3.0, 4.0, 0.0, 0.0]]))
+
+        assert index.get("a").dtype == np.float16
+        np.testing.assert_allclose(index.get("a"), [0.6, 0.8, 0, 0], atol=1e-3)
+
+    def test_re_adding_replaces(self):
+        """Test that adding an existing id overwrites it instead of duplicating."""
+        index = EmbeddingIndex()
+        index.add(["a"], unit(1, 0)[None])
+        index.add(["a"], unit(0, 1)[None])
+
+        assert len(index) == 1
+        assert index.search(unit(0, 1), k=1)[0][1] == pytest.approx(1.0, abs=1e-3)
+
+    def test_oldest_evicted(self):
+        """Test that the index keeps only the newest max_items articles."""
+        index = EmbeddingIndex(max_items=2)
+        index.add(["old", "new"], np.stack([unit(1), unit(0, 1)]), [100.0, 300.0])
+        index.add(["newer"], unit(0, 0, 1)[None], [200.0])
+
+        assert len(index) == 2
+        assert index.get("old") is None
+        assert {i for i, _ in index.search(unit(1, 1, 1), k=5)} == {"new", "newer"}
+
+    def test_save_and_load(self, tmp_path):
+        """Test persistence round-trip and rejection of another model version."""
+        path = tmp_path / "index.npz"
+        index = EmbeddingIndex(model_version="finbert@v1")
+        index.add(["a", "b"], np.stack([unit(1, 0), unit(0, 1)]))
+        index.save(path)
+
+        loaded = EmbeddingIndex.load(path, model_version="finbert@v1")
+        assert len(loaded) == 2
+        assert loaded.search(unit(0, 1), k=1)[0][0] == "b"
+
+        assert len(EmbeddingIndex.load(path, model_version="finbert@v2")) == 0
+
+    def test_reader_reloads_on_change(self, tmp_path, monkeypatch):
+        """Test that the shared read-side index picks up a rewritten file."""
+        path = tmp_path / "index.npz"
+        monkeypatch.setattr(vector_index.config, "EMBEDDING_INDEX_PATH", str(path))
+        monkeypatch.setattr(vector_index, "_embedding_index", None)
+        assert len(get_embedding_index()) == 0
+
+        index = EmbeddingIndex()
+        index.add(["a"], unit(1)[None])
+        index.save(path)
+
+        assert len(get_embedding_index()) == 1
+
+
+def test_mean_pool_ignores_padding():
+    """Test that padded positions do not contribute to pooled embeddings."""
+    hidden = np.array([[[1.0, 0.0], [3.0, 2.0], [100.0, 100.0]]])
+    mask = np.array([[1, 1, 0]])
+
+    np.testing.assert_allclose(mean_pool(hidden, mask), [[2.0, 1.0]])
+
+
+@pytest.mark.asyncio
+async def test_embeddings_from_same_forward_pass(stub_analyzer):
+    """Test that embeddings come back in input order without extra forward passes."""
+    texts = ["gold up", "gold prices rise sharply today", "gold up"]
+
+    batch = await stub_analyzer.analyze_batch_array(texts, with_embeddings=True)
+
+    assert batch.embeddings.shape == (3, 8)
+    assert batch.embeddings.dtype == np.float16
+    np.testing.assert_array_equal(batch.embeddings[0], batch.embeddings[2])
+    assert batch[1].embedding is not None
+    assert sum(shape[0] for shape in stub_analyzer.backend.shapes) == 3
+    assert (await stub_analyzer.analyze_batch_array(texts)).embeddings is None
+
+
+@pytest.mark.asyncio
+async def test_text_query_rejected_after_model_swap(monkeypatch):
+    """Test a text query embedded by a different model than the index is a 409."""
+    from fastapi import HTTPException
+
+    from apps.backend.app.api.v1 import news
+    from packages.ai_core.results import SentimentBatch
+
+    index = EmbeddingIndex(model_version="test/finbert@v1")
+    index.add(["a"], np.stack([unit(1, 0)]))
+    monkeypatch.setattr(news, "get_embedding_index", lambda: index)
+
+    async def embed_texts(texts):
+        return SentimentBatch(
+            np.full((1, 3), 1 / 3), model_version="test/finbert@v2", embeddings=unit(1, 0)[None]
+        )
+
+    monkeypatch.setattr(news, "embed_texts", embed_texts)
+
+    with pytest.raises(HTTPException) as exc:
+        await news.get_similar_news(news_id=None, text="Gold rallies", k=5)
+    assert exc.value.status_code == 409